@@ -0,0 +1,96 @@
+"""
+Async Tk Loop - Tk and asyncio on one thread
+
+GameController.run normally hands the thread to root.mainloop(), leaving no
+room for asyncio tasks (socket control, telemetry export, background
+simulation) short of threads. AsyncTkLoop turns it around: an asyncio
+coroutine pumps Tk, so async tasks and the UI share the thread.
+
+Time is sliced fairly, with input first:
+- Each slice handles pending Tk events (clicks, timers, redraws) until the
+  queue is empty or tk_budget_ms is spent.
+- Then asyncio gets one pass over its ready tasks. A task keeps the UI
+  waiting until its next await, so tasks should await at least every few
+  milliseconds; the longest pass is kept in max_async_ms.
+- With no Tk events pending, the loop sleeps idle_ms so asyncio can wait on
+  sockets instead of spinning.
+
+Closing the main window (or stop()) ends run().
+
+Usage:
+    loop = AsyncTkLoop(gc.root)
+    loop.spawn(export_telemetry(gc))
+    asyncio.run(loop.run())
+"""
+
+import asyncio
+import time
+import tkinter as tk
+
+import _tkinter
+
+
+class AsyncTkLoop:
+    """
+    Runs a Tk root inside an asyncio event loop.
+
+    Args:
+        root: Tk root whose events are pumped
+        tk_budget_ms: Most time spent on Tk events before asyncio gets a turn
+        idle_ms: Sleep between slices when Tk had nothing to do
+    """
+
+    def __init__(self, root: tk.Tk, tk_budget_ms: float = 8, idle_ms: float = 2):
+        self.root = root
+        self.tk_budget_ms = tk_budget_ms
+        self.idle_ms = idle_ms
+        self.tasks = set()
+        self.running = False
+
+        # Counters for the GM window and the frame-time benchmark
+        self.slices = 0
+        self.tk_events = 0
+        self.max_async_ms = 0.0
+
+    def spawn(self, coro) -> asyncio.Task:
+        """Start a task that runs alongside the UI and is cancelled when the loop ends"""
+        task = asyncio.get_running_loop().create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    def stop(self):
+        self.running = False
+
+    async def run(self):
+        """Pump Tk until the main window is closed or stop() is called"""
+        self.running = True
+        budget = self.tk_budget_ms / 1000
+        idle = self.idle_ms / 1000
+        try:
+            while self.running:
+                deadline = time.perf_counter() + budget
+                handled = 0
+                try:
+                    while self.root.tk.dooneevent(_tkinter.DONT_WAIT):
+                        handled += 1
+                        self.tk_events += 1
+                        if time.perf_counter() >= deadline:
+                            break
+                    # Raises once the main window has been destroyed
+                    self.root.winfo_exists()
+                except tk.TclError:
+                    break
+                self.slices += 1
+
+                yielded = time.perf_counter()
+                await asyncio.sleep(0 if handled else idle)
+                # Time asyncio kept the thread beyond what was asked for
+                overrun = (time.perf_counter() - yielded) * 1000 - (0 if handled else self.idle_ms)
+                self.max_async_ms = max(self.max_async_ms, overrun)
+        finally:
+            self.running = False
+            for task in list(self.tasks):
+                task.cancel()
+            if self.tasks:
+                await asyncio.gather(*self.tasks, return_exceptions=True)
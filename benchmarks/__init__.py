@@ -0,0 +1,5 @@
+"""
+Benchmarks
+
+Standalone timing scripts, run with python -m benchmarks.<name>.
+"""
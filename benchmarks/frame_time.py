@@ -0,0 +1,152 @@
+"""
+Frame Time Benchmark
+
+Compares the live game on root.mainloop() with the same game pumped by
+AsyncTkLoop, idle and with busy background tasks. Two things are measured
+on the real GameController UI:
+
+- frame lateness: a 16 ms Tk timer re-arms itself every frame; how late
+  each tick fires is what an animation would stutter by.
+- input latency: a virtual event is queued every 50 ms the way a click is;
+  the delay until its binding runs is the added input lag.
+
+The background tasks burn --work-ms of CPU between awaits, standing in for
+telemetry export or a simulation chunk. Needs a display.
+
+Usage:
+    python -m benchmarks.frame_time
+    python -m benchmarks.frame_time --seconds 20 --tasks 8 --work-ms 4
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import sys
+import time
+import tkinter as tk
+
+from simulation.stats import QuantileSketch
+from ui.view_model import FRAME_MS
+
+INPUT_EVERY_MS = 50
+
+
+class _Probe:
+    """Frame timer and synthetic input on a Tk root, timed in microseconds"""
+
+    def __init__(self, root: tk.Tk):
+        self.root = root
+        self.frames = QuantileSketch()
+        self.inputs = QuantileSketch()
+        self.max_frame_us = 0
+        self.max_input_us = 0
+        self.sent = []
+        root.bind("<<BenchInput>>", self._on_input)
+
+    def start(self, seconds: float, on_done):
+        self.expected = time.perf_counter() + FRAME_MS / 1000
+        self.root.after(FRAME_MS, self._frame)
+        self.root.after(INPUT_EVERY_MS, self._send_input)
+        self.root.after(int(seconds * 1000), on_done)
+
+    def _frame(self):
+        now = time.perf_counter()
+        late = max(0, int((now - self.expected) * 1e6))
+        self.frames.add(late)
+        self.max_frame_us = max(self.max_frame_us, late)
+        self.expected = now + FRAME_MS / 1000
+        self.root.after(FRAME_MS, self._frame)
+
+    def _send_input(self):
+        self.sent.append(time.perf_counter())
+        self.root.event_generate("<<BenchInput>>", when="tail")
+        self.root.after(INPUT_EVERY_MS, self._send_input)
+
+    def _on_input(self, event):
+        lag = int((time.perf_counter() - self.sent.pop(0)) * 1e6)
+        self.inputs.add(lag)
+        self.max_input_us = max(self.max_input_us, lag)
+
+    def summary(self) -> dict:
+        return {
+            "frames": self.frames.count,
+            "frame_late_p50_ms": self.frames.quantile(0.5) / 1000,
+            "frame_late_p99_ms": self.frames.quantile(0.99) / 1000,
+            "frame_late_max_ms": self.max_frame_us / 1000,
+            "input_p50_ms": self.inputs.quantile(0.5) / 1000,
+            "input_p99_ms": self.inputs.quantile(0.99) / 1000,
+            "input_max_ms": self.max_input_us / 1000,
+        }
+
+
+async def _busy_task(work_ms: float, done: list):
+    """Burn work_ms of CPU between awaits"""
+    while True:
+        end = time.perf_counter() + work_ms / 1000
+        while time.perf_counter() < end:
+            pass
+        done[0] += 1
+        await asyncio.sleep(0)
+
+
+def run(mode: str, seconds: float, tasks: int, work_ms: float) -> dict:
+    # Imported here so the --help text works without a display
+    from game import GameController
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        gc = GameController()
+    probe = _Probe(gc.root)
+    chunks = [0]
+
+    if mode == "mainloop":
+        probe.start(seconds, gc.root.quit)
+        gc.run()
+    else:
+        background = [_busy_task(work_ms, chunks) for _ in range(tasks if mode == "asyncio+tasks" else 0)]
+
+        async def play():
+            probe.start(seconds, lambda: gc.async_loop.stop())
+            await gc.run_async(*background)
+
+        asyncio.run(play())
+
+    result = probe.summary()
+    result["task_chunks"] = chunks[0]
+    if mode != "mainloop":
+        result["max_async_ms"] = gc.async_loop.max_async_ms
+    gc.root.destroy()
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Frame time and input latency of the Tk run modes")
+    parser.add_argument("--seconds", type=float, default=10, help="Length of each run")
+    parser.add_argument("--tasks", type=int, default=4, help="Busy asyncio tasks")
+    parser.add_argument("--work-ms", type=float, default=2, help="CPU each task burns between awaits")
+    parser.add_argument("--mode", choices=("mainloop", "asyncio", "asyncio+tasks"), action="append",
+                        help="Run only these modes (default: all)")
+    args = parser.parse_args(argv)
+
+    results = {}
+    try:
+        for mode in args.mode or ("mainloop", "asyncio", "asyncio+tasks"):
+            results[mode] = run(mode, args.seconds, args.tasks, args.work_ms)
+    except tk.TclError as e:
+        print(f"Needs a display: {e}")
+        return 2
+
+    names = list(dict.fromkeys(name for result in results.values() for name in result))
+    print(f"{'':>20}" + "".join(f"{mode:>16}" for mode in results))
+    for name in names:
+        row = "".join(
+            f"{results[mode][name]:>16.2f}" if isinstance(results[mode].get(name), float)
+            else f"{results[mode].get(name, '-'):>16}"
+            for mode in results
+        )
+        print(f"{name:>20}{row}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+Input Queue Stress Test
+
+Fires random button clicks at a HeadlessController far faster than anyone
+could click (thousands per second of game time), including during drum
+reveals, and checks that presses never overlap: with the InputQueue every
+press, reveals included, finishes before the next one starts, and the game
+hash still matches a full recompute afterwards. Reveals are paced in
+virtual time as in the GUI, so clicks do land in the middle of them.
+
+--unqueued sends the same clicks straight to the state handlers, the way
+clicks reached the game before the queue, to show the overlap it prevents.
+
+Usage:
+    python -m benchmarks.input_stress
+    python -m benchmarks.input_stress --rate 5000 --seconds 120 --debounce 0
+    python -m benchmarks.input_stress --unqueued
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import sys
+import time
+
+from headless import HeadlessController
+
+BUTTONS = ("MOVE", "TOMB", "BAZAAR", "YES", "NO", "HAGGLE")
+
+
+class _NestingProbe:
+    """Wraps the controller's click handler and tracks presses that nest or overlap a reveal"""
+
+    def __init__(self, gc):
+        self.gc = gc
+        self.handle = gc.on_grid_button_click
+        self.depth = 0
+        self.max_depth = 0
+        self.presses = 0
+        self.overlapped = 0
+        gc.on_grid_button_click = self
+
+    def __call__(self, text):
+        self.depth += 1
+        self.max_depth = max(self.max_depth, self.depth)
+        self.presses += 1
+        if self.gc.driver.current is not None:
+            self.overlapped += 1
+        try:
+            self.handle(text)
+        finally:
+            self.depth -= 1
+        # Keep everyone in the game so the clicks keep doing work
+        for player in self.gc.players:
+            player.food = max(player.food, 10)
+            player.warriors = max(player.warriors, 5)
+
+
+def run(rate: int, seconds: float, debounce_ms: int, queued: bool = True, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        gc = HeadlessController(seed=seed)
+        gc.VERIFY_HASH = True
+        for text in ("YES", "NO", "NO", "NO", "YES"):  # Level 1, 4 players
+            gc.press(text)
+        gc.input_queue.debounce_ms = debounce_ms
+        gc.driver.paced = True
+        probe = _NestingProbe(gc)
+
+        click = gc.input_queue.submit if queued else gc.handle_input
+        clicks = int(rate * seconds)
+        interval = 1000 / rate
+        for i in range(clicks):
+            gc.scheduler.after(i * interval, click, rng.choice(BUTTONS))
+
+        start = time.perf_counter()
+        error = None
+        try:
+            gc.run()
+        except RecursionError as e:
+            # Unqueued clicks can nest until Python gives up
+            error = repr(e)
+        elapsed = time.perf_counter() - start
+
+    queue = gc.input_queue
+    return {
+        "clicks": clicks,
+        "handled": probe.presses,
+        "debounced": queue.debounced,
+        "coalesced": queue.coalesced,
+        "overflowed": queue.overflowed,
+        "max_nesting": probe.max_depth,
+        "overlapped": probe.overlapped,
+        "script_steps": gc.driver.steps,
+        "error": error,
+        "hash_ok": error is None and gc.zobrist.verify(gc),
+        "wall_s": elapsed,
+        "clicks_per_wall_s": clicks / elapsed if elapsed else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stress the input queue with rapid clicks")
+    parser.add_argument("--rate", type=int, default=2000, help="Clicks per second of game time")
+    parser.add_argument("--seconds", type=float, default=60, help="Game time to click for")
+    parser.add_argument("--debounce", type=int, default=120, help="Debounce in milliseconds")
+    parser.add_argument("--unqueued", action="store_true", help="Bypass the queue to show overlap")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    result = run(args.rate, args.seconds, args.debounce, queued=not args.unqueued, seed=args.seed)
+    for name, value in result.items():
+        print(f"{name:>18}: {value:.2f}" if isinstance(value, float) else f"{name:>18}: {value}")
+
+    if not args.unqueued and (result["max_nesting"] > 1 or result["overlapped"] or not result["hash_ok"]
+                              or result["error"]):
+        print("FAIL: presses overlapped or the game hash drifted")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+Level Profile Benchmark
+
+Checks that difficulty levels cost nothing per turn. A level only changes
+which immutable RuleParams the rules read, so resolving the same result
+(a plague, a battle, ...) must take the same time under every level. Whole
+games are not compared directly because harder levels roll more battles,
+which are dearer turns at any level.
+
+For every level, each MOVE and TOMB die face is resolved on a fresh clone
+of the same GameState, and the time is reported per result.
+
+Usage:
+    python -m benchmarks.level_profiles
+    python -m benchmarks.level_profiles --rounds 5000
+"""
+
+import argparse
+import random
+import time
+from collections import defaultdict
+
+from models.game_state import MOVE, TOMB, GameState
+from models.levels import LEVELS, rules_for_level
+from models.turn_record import OUTCOMES
+
+
+class _ScriptedRandom(random.Random):
+    """Random whose first randrange() returns a chosen die face"""
+
+    def __init__(self, face: int, seed):
+        super().__init__(seed)
+        self.face = face
+
+    def randrange(self, *args):
+        if self.face is None:
+            return super().randrange(*args)
+        face, self.face = self.face, None
+        return face
+
+
+def time_outcomes(level: int, rounds: int, seed: int = 0) -> dict:
+    """Mean microseconds to resolve each (action, result) under a level"""
+    params = rules_for_level(level)
+    base = GameState.new_game(1, random.Random(seed), params=params)
+    totals = defaultdict(float)
+    counts = defaultdict(int)
+    for action, table in ((MOVE, params.move_table), (TOMB, params.tomb_table)):
+        for face, outcome in enumerate(table):
+            rngs = [_ScriptedRandom(face, seed + i) for i in range(rounds)]
+            states = [base.clone() for _ in range(rounds)]
+            start = time.perf_counter()
+            for state, rng in zip(states, rngs):
+                state.apply(action, rng)
+            totals[action, outcome] += time.perf_counter() - start
+            counts[action, outcome] += rounds
+    return {key: totals[key] * 1e6 / counts[key] for key in totals}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-turn cost of each level profile")
+    parser.add_argument("--rounds", type=int, default=2000, help="Resolutions per die face")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of this many runs")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for level in LEVELS:
+        runs = [time_outcomes(level, args.rounds) for _ in range(args.repeat)]
+        results[level] = {key: min(run[key] for run in runs) for key in runs[0]}
+
+    keys = sorted({key for timings in results.values() for key in timings})
+    print(f"{'action':<6} {'result':<8}" + "".join(f"{f'level {level} us':>12}" for level in LEVELS))
+    for action, outcome in keys:
+        row = "".join(
+            f"{results[level][action, outcome]:>12.2f}" if (action, outcome) in results[level] else f"{'-':>12}"
+            for level in LEVELS
+        )
+        print(f"{action:<6} {OUTCOMES[outcome]:<8}{row}")
+
+
+if __name__ == "__main__":
+    main()
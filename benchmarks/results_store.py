@@ -0,0 +1,86 @@
+"""
+Results Store Benchmark
+
+Measures how many turn rows per hour the single ResultsWriter can store.
+A few hundred games are played once and their records are submitted over
+and over (as worker chunks would arrive) to a fresh database for each
+transaction size, so only the writing is timed. Batching is the point: one
+transaction per game pays a WAL commit for every ~60 rows.
+
+Usage:
+    python -m benchmarks.results_store
+    python -m benchmarks.results_store --games 50000 --batches 1 500 2000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from models.levels import rules_for_level
+from simulation.batch import STORE_CHUNK_GAMES, game_record, play_recorded
+from simulation.results import ResultsStore, ResultsWriter
+
+
+def make_records(count: int, players: int, policy: str) -> list:
+    params = rules_for_level(1)
+    records = []
+    for seed in range(count):
+        state, actions, turns = play_recorded(params, seed, players, policy=policy)
+        records.append(game_record(seed, policy, 1, state, actions, turns))
+    return records
+
+
+def time_writes(path, records: list, games: int, batch_games: int) -> dict:
+    start = time.perf_counter()
+    with ResultsWriter(path, batch_games=batch_games) as writer:
+        for first in range(0, games, STORE_CHUNK_GAMES):
+            chunk = [records[i % len(records)] for i in range(first, min(games, first + STORE_CHUNK_GAMES))]
+            writer.submit(chunk)
+    elapsed = time.perf_counter() - start
+    return {
+        "games": writer.games,
+        "turns": writer.turns,
+        "transactions": writer.transactions,
+        "seconds": elapsed,
+        "rows_per_hour": writer.turns / elapsed * 3600,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write throughput of the SQLite results store")
+    parser.add_argument("--games", type=int, default=20000, help="Games written per run")
+    parser.add_argument("--distinct", type=int, default=500, help="Games actually played and reused")
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--policy", default="random")
+    parser.add_argument("--batches", type=int, nargs="+", default=[1, 2000], help="Games per transaction to compare")
+    parser.add_argument("--target", type=float, default=1e6, help="Turn rows per hour the batched writer must reach")
+    args = parser.parse_args(argv)
+
+    records = make_records(args.distinct, args.players, args.policy)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for batch_games in args.batches:
+            path = os.path.join(directory, f"batch_{batch_games}.db")
+            results[batch_games] = time_writes(path, records, args.games, batch_games)
+        with ResultsStore(path) as store:
+            start = time.perf_counter()
+            store.report(policy=args.policy)
+            report_ms = (time.perf_counter() - start) * 1000
+
+    for batch_games, result in results.items():
+        print(f"{batch_games:>5} games/transaction: {result['turns']} turns in {result['transactions']} transactions, "
+              f"{result['seconds']:.2f}s ({result['rows_per_hour'] / 1e6:.1f}M turn rows/hour)")
+    print(f"report over {args.games} games: {report_ms:.1f} ms")
+
+    best = max(result["rows_per_hour"] for result in results.values())
+    if best < args.target:
+        print(f"FAIL: under {args.target / 1e6:.1f}M turn rows/hour")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+New Game Soak Test
+
+Starts thousands of new games on one controller, the way a kiosk does over
+weeks of uptime, playing a few turns of each, and checks that nothing
+builds up: after a warm-up the Tk widget count, bindings, Tcl commands
+(each Python callback handed to Tk is one) and pending timers must not
+change, and tracemalloc must show no steady growth.
+
+Without a display (or with --headless) the same cycles run on a
+HeadlessController and only memory is checked.
+
+Usage:
+    python -m benchmarks.soak
+    python -m benchmarks.soak --cycles 500 --turns 5
+    python -m benchmarks.soak --headless
+"""
+
+import argparse
+import contextlib
+import gc as garbage
+import os
+import sys
+import time
+import tracemalloc
+import tkinter as tk
+
+
+def tk_counts(root: tk.Tk) -> dict:
+    """Widgets, bindings, Tcl commands and pending timers under a Tk root"""
+    widgets = 0
+    bindings = 0
+    stack = [root]
+    while stack:
+        widget = stack.pop()
+        widgets += 1
+        bindings += len(widget.bind())
+        stack.extend(widget.winfo_children())
+    return {
+        "widgets": widgets,
+        "bindings": bindings,
+        "tcl_commands": len(root.tk.call("info", "commands")),
+        "timers": len(root.tk.call("after", "info")),
+    }
+
+
+def play_cycle(gc, turns: int):
+    """Start a new game and play a few turns of it"""
+    gc.new_game()
+    for _ in range(4):
+        if gc.state_machine.current_state_name == "player_turn":
+            break
+        gc.press("YES")
+    for _ in range(turns):
+        gc.press("MOVE")
+        gc.press("NO")  # Flees a battle, or ends the turn
+        gc.press("NO")
+    if gc.root is not None:
+        gc.view.flush()
+        gc.root.update()
+
+
+def _make_controller(headless: bool):
+    if not headless:
+        try:
+            from game import GameController
+            controller = GameController()
+            # Reveals would take over a second each; what they leave behind is the same unpaced
+            controller.driver.paced = False
+            return controller
+        except tk.TclError:
+            pass
+    from headless import HeadlessController
+    return HeadlessController(seed=0)
+
+
+def run(cycles: int, turns: int, warmup: int, headless: bool = False) -> dict:
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        controller = _make_controller(headless)
+        controller.VERIFY_HASH = True
+        for _ in range(warmup):
+            play_cycle(controller, turns)
+
+        garbage.collect()
+        tracemalloc.start()
+        before_tk = tk_counts(controller.root) if controller.root is not None else {}
+        before_memory = tracemalloc.get_traced_memory()[0]
+
+        start = time.perf_counter()
+        for _ in range(cycles):
+            play_cycle(controller, turns)
+        elapsed = time.perf_counter() - start
+
+        garbage.collect()
+        after_memory, peak = tracemalloc.get_traced_memory()
+        after_tk = tk_counts(controller.root) if controller.root is not None else {}
+        tracemalloc.stop()
+
+    result = {
+        "mode": "headless" if controller.root is None else "tk",
+        "cycles": cycles,
+        "cycles_per_s": cycles / elapsed if elapsed else 0.0,
+        "memory_growth_kb": (after_memory - before_memory) / 1024,
+        "memory_peak_kb": peak / 1024,
+    }
+    for name, value in after_tk.items():
+        result[f"{name}_growth"] = value - before_tk[name]
+    if controller.root is not None:
+        controller.root.destroy()
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check that new games leave nothing behind")
+    parser.add_argument("--cycles", type=int, default=10_000, help="New games to start")
+    parser.add_argument("--turns", type=int, default=3, help="Turns played in each game")
+    parser.add_argument("--warmup", type=int, default=50, help="Games played before measuring")
+    parser.add_argument("--max-growth-kb", type=float, default=256, help="Allowed memory growth")
+    parser.add_argument("--headless", action="store_true", help="Skip Tk even if a display is available")
+    args = parser.parse_args(argv)
+
+    result = run(args.cycles, args.turns, args.warmup, args.headless)
+    for name, value in result.items():
+        print(f"{name:>20}: {value:.2f}" if isinstance(value, float) else f"{name:>20}: {value}")
+
+    leaked = [name for name, value in result.items() if name.endswith("_growth") and value > 0]
+    if result["memory_growth_kb"] > args.max_growth_kb:
+        leaked.append("memory")
+    if leaked:
+        print(f"FAIL: growth in {', '.join(leaked)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
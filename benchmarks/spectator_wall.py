@@ -0,0 +1,85 @@
+"""
+Spectator Wall Benchmark
+
+Plays 64 headless games (GameState with the greedy policy) side by side and
+feeds every table's summary to one SpectatorWall each frame, restarting
+games as they finish. Each frame's cost (game steps excluded) is the
+wall's flush plus Tk's redraw, including the standings table of every seat
+unless --standings 0; at 60 fps it must fit in 16 ms. Needs a display.
+
+Usage:
+    python -m benchmarks.spectator_wall
+    python -m benchmarks.spectator_wall --tables 128 --frames 1200
+    python -m benchmarks.spectator_wall --standings 0
+"""
+
+import argparse
+import random
+import sys
+import time
+import tkinter as tk
+
+from bots.policies import POLICIES
+from models.game_state import GameState
+from scheduler import TkScheduler
+from simulation.stats import QuantileSketch
+from ui.spectator_wall import SpectatorWall, summary_from_state
+from ui.view_model import FRAME_MS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Frame cost of the spectator wall")
+    parser.add_argument("--tables", type=int, default=64)
+    parser.add_argument("--columns", type=int, default=8)
+    parser.add_argument("--players", type=int, default=4, help="Seats per table")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--standings", type=int, default=30, help="Rows of the standings table (0 for none)")
+    args = parser.parse_args(argv)
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Needs a display: {e}")
+        return 2
+
+    wall = SpectatorWall(root, TkScheduler(root), tables=args.tables, columns=args.columns)
+    wall.pack(side=tk.LEFT)
+    if args.standings:
+        wall.standings(root, visible_rows=args.standings).pack(side=tk.LEFT, fill=tk.Y)
+    root.update()
+
+    rng = random.Random(args.seed)
+    choose = POLICIES["greedy"]
+    games = [GameState.new_game(args.players, rng) for _ in range(args.tables)]
+
+    sketch = QuantileSketch()
+    worst = 0
+    for _ in range(args.frames):
+        for table, state in enumerate(games):
+            if state.is_over():
+                state = games[table] = GameState.new_game(args.players, rng)
+            else:
+                state.apply(choose(state, rng), rng)
+            wall.post(table, summary_from_state(state))
+
+        start = time.perf_counter()
+        wall.flush()
+        root.update_idletasks()
+        elapsed = int((time.perf_counter() - start) * 1e6)
+        sketch.add(elapsed)
+        worst = max(worst, elapsed)
+        root.update()
+
+    root.destroy()
+    p50, p99 = sketch.quantile(0.5) / 1000, sketch.quantile(0.99) / 1000
+    print(f"{args.tables} tables, {args.frames} frames, {wall.item_updates / args.frames:.0f} item updates per frame")
+    print(f"frame p50 {p50:.2f} ms  p99 {p99:.2f} ms  max {worst / 1000:.2f} ms  (budget {FRAME_MS} ms)")
+    if p99 > FRAME_MS:
+        print("FAIL: p99 frame over budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
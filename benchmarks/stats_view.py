@@ -0,0 +1,115 @@
+"""
+Stats View Benchmark
+
+Times refreshes of the virtualized player stats table with hundreds of
+seats. Every refresh changes a few players' stats, re-sorts by the current
+column and redraws the rows in view, cycling through the sort columns and
+scroll positions as a spectator would. The budget is one 16 ms frame.
+
+The sorting and row windowing (StatsTable) are always timed. With a
+display, the full VirtualStatsView is timed as well, including Tk's redraw.
+
+Usage:
+    python -m benchmarks.stats_view
+    python -m benchmarks.stats_view --players 2000 --refreshes 500
+"""
+
+import argparse
+import random
+import sys
+import time
+import tkinter as tk
+from types import SimpleNamespace
+
+from simulation.stats import QuantileSketch
+from ui.view_model import FRAME_MS
+from ui.virtual_stats_view import COLUMNS, StatsTable, VirtualStatsView
+
+
+def make_players(count: int, rng: random.Random) -> list:
+    return [
+        SimpleNamespace(player_number=i + 1, gold=rng.randrange(100), warriors=rng.randrange(30), food=rng.randrange(40))
+        for i in range(count)
+    ]
+
+
+def _churn(players: list, rng: random.Random, step: int, table: StatsTable):
+    """Change a few stats, and now and then the sort column or scroll position"""
+    for player in rng.sample(players, min(8, len(players))):
+        player.gold = rng.randrange(100)
+        player.warriors = rng.randrange(30)
+        player.food = rng.randrange(40)
+    if step % 50 == 0:
+        table.sort_by(COLUMNS[(step // 50) % len(COLUMNS)][0])
+    if step % 10 == 0:
+        table.scroll_to(rng.randrange(len(players)))
+
+
+def time_refreshes(refresh, table: StatsTable, players: list, refreshes: int, seed: int) -> dict:
+    """Milliseconds per refresh (p50, p99, max)"""
+    rng = random.Random(seed)
+    sketch = QuantileSketch()
+    worst = 0
+    for step in range(refreshes):
+        _churn(players, rng, step, table)
+        start = time.perf_counter()
+        refresh()
+        elapsed = int((time.perf_counter() - start) * 1e6)
+        sketch.add(elapsed)
+        worst = max(worst, elapsed)
+    return {
+        "p50_ms": sketch.quantile(0.5) / 1000,
+        "p99_ms": sketch.quantile(0.99) / 1000,
+        "max_ms": worst / 1000,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Refresh time of the virtualized stats view")
+    parser.add_argument("--players", type=int, default=500)
+    parser.add_argument("--refreshes", type=int, default=1000)
+    parser.add_argument("--rows", type=int, default=20, help="Rows in view")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    results = {}
+
+    players = make_players(args.players, rng)
+    table = StatsTable(players, args.rows)
+
+    def refresh_table():
+        table.refresh()
+        table.visible()
+
+    results["table"] = time_refreshes(refresh_table, table, players, args.refreshes, args.seed)
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"No display, timing the table only: {e}")
+    else:
+        players = make_players(args.players, rng)
+        view = VirtualStatsView(root, players, args.rows)
+        view.pack(fill=tk.BOTH, expand=True)
+        root.update()
+
+        def refresh_view():
+            view.refresh()
+            root.update_idletasks()
+
+        results["tk view"] = time_refreshes(refresh_view, view.table, players, args.refreshes, args.seed)
+        root.destroy()
+
+    print(f"{args.players} players, {args.rows} rows in view, budget {FRAME_MS} ms")
+    for name, result in results.items():
+        print(f"{name:>8}: " + "  ".join(f"{key} {value:.3f}" for key, value in result.items()))
+
+    if any(result["p99_ms"] > FRAME_MS for result in results.values()):
+        print("FAIL: p99 refresh over one frame")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
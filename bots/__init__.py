@@ -0,0 +1,5 @@
+"""
+Bots Package
+
+Automated players that choose actions on a models.game_state.GameState.
+"""
@@ -0,0 +1,142 @@
+"""
+Auto Player
+
+Lets a bot play seats of a running game (live GameController or
+HeadlessController) by pressing the same grid buttons a person would.
+The bot decides on a GameState snapshot of the controller, and the chosen
+action is translated into button presses.
+
+Every action played in the game, by any seat, is recorded by the turn
+state as a GameState action (PlayerTurnState.plays). The auto player
+passes them to the bot's observe() before each decision and at the end of
+every turn, so a tree-search bot re-roots its tree along the actual game
+instead of starting over each turn.
+"""
+
+from typing import TYPE_CHECKING
+
+from models.game_state import FIGHT, FLEE, MOVE, TOMB, Buy, GameState
+from models.rules import BAZAAR_ITEMS
+
+if TYPE_CHECKING:
+    from game import GameController
+
+
+def buttons_for(action):
+    """Grid buttons that perform an action during a player's turn"""
+    if action == MOVE:
+        return ["MOVE"]
+    if action == TOMB:
+        return ["TOMB"]
+    if action == FIGHT:
+        return ["YES"]
+    if action == FLEE:
+        return ["NO"]
+    if isinstance(action, Buy):
+        # The bazaar opens on warriors; NO cycles items, YES starts buying
+        # and adds one more, NO confirms.
+        skips = BAZAAR_ITEMS.index(action.item)
+        return ["BAZAAR"] + ["NO"] * skips + ["YES"] * action.count + ["NO"]
+    raise ValueError(f"Unknown action {action!r}")
+
+
+class AutoPlayer:
+    """
+    Plays the given seats with a bot through the controller's scheduler.
+
+    Args:
+        gc: Game controller to play on
+        bot: Object with choose(state) and optionally observe(action)/reset()
+        seats: Player numbers (1-based) the bot controls; None for all
+        step_delay: Milliseconds between bot decisions
+    """
+
+    def __init__(self, gc: "GameController", bot, seats=None, step_delay: int = 500):
+        self.gc: "GameController" = gc
+        self.bot = bot
+        self.seats = set(seats) if seats is not None else None
+        self.step_delay = step_delay
+        self.running = False
+        self._turn = None  # (turn number, player number) whose plays were last observed
+        self._seen = 0  # How many of that turn's plays the bot has observed
+
+    def start(self):
+        self.running = True
+        self._turn = None
+        if hasattr(self.bot, "reset"):
+            self.bot.reset()
+        if self not in self.gc.turn_observers:
+            self.gc.turn_observers.append(self)
+        self.gc.scheduler.after(self.step_delay, self._tick)
+
+    def stop(self):
+        self.running = False
+        if self in self.gc.turn_observers:
+            self.gc.turn_observers.remove(self)
+
+    def controls(self, player_number: int) -> bool:
+        return self.seats is None or player_number in self.seats
+
+    def _tick(self):
+        if not self.running:
+            return
+        self.play_step()
+        self.gc.scheduler.after(self.step_delay, self._tick)
+
+    def play_step(self) -> bool:
+        """
+        Make one decision if a controlled seat is to act.
+
+        Returns:
+            True if any button was pressed
+        """
+        # Decide only once the last action's reveals have finished
+        if self.gc.driver.busy or self.gc.input_queue.pending:
+            return False
+        if self.gc.state_machine.current_state_name != "player_turn":
+            return False
+        state = self.gc.state_machine.current_state
+        if not self.controls(state.player_number) or state.is_at_bazaar:
+            return False
+
+        if state.is_turn_over:
+            self._press("NO")
+            return True
+
+        self._follow(state)
+
+        # Live games have no round limit, so keep the bot's horizon ahead of play
+        game_state = GameState.from_controller(self.gc, max_turns=max(30, state.turn_number + 10))
+        if game_state.is_over():
+            return False
+
+        action = self.bot.choose(game_state)
+        for text in buttons_for(action):
+            self._press(text)
+        return True
+
+    def _press(self, text):
+        self.gc.press(text)
+
+    def record_turn(self, *turn):
+        """Turn observer: the finished turn's last plays still need observing"""
+        self._follow(self.gc.state_machine.current_state)
+        if not self._seen and hasattr(self.bot, "reset"):
+            # The turn ended without a play the bot models (a closed bazaar),
+            # so its tree no longer matches the game
+            self.bot.reset()
+
+    def _follow(self, state):
+        """Pass the plays made since the last call to the bot, re-rooting its tree"""
+        turn = (state.turn_number, state.player_number)
+        plays = state.plays
+        if self._turn is not None and (turn < self._turn or (turn == self._turn and len(plays) < self._seen)):
+            # A new game, or an undo took back plays the bot has seen
+            if hasattr(self.bot, "reset"):
+                self.bot.reset()
+            self._turn = None
+        seen = self._seen if turn == self._turn else 0
+        if hasattr(self.bot, "observe"):
+            for action in plays[seen:]:
+                self.bot.observe(action)
+        self._turn, self._seen = turn, len(plays)
@@ -0,0 +1,296 @@
+"""
+Expectimax Solver
+
+Solves single-player decisions exactly over a compact solo state:
+
+    (warriors, gold, food, flags, kingdom, brigands, dragon_gold, dragon_warriors)
+
+flags packs the keys and items into bits. brigands > 0 means the player is
+in a battle and must FIGHT or FLEE. Chance nodes enumerate the hex die the
+same way PlayerTurnState.move, tomb_ruin and award_treasure read it, and
+every transition is applied with models.rules and models.battle. MOVE and
+TOMB results are weighted by the faces they cover in the compiled outcome
+tables. Equal outcomes are merged before recursing.
+
+Search uses iterative deepening (one ply per decision) under a time budget,
+with a transposition table keyed by (state, depth) and evicted in LRU
+order. The table can be saved to disk and loaded so later runs start warm.
+
+Usage:
+    solver = ExpectimaxSolver(time_budget=0.05)
+    solver.load("expectimax.tt")
+    action = solver.choose(game_state)
+    solver.save("expectimax.tt")
+"""
+
+import os
+import pickle
+import time
+from collections import OrderedDict
+
+from models import battle, rules
+from models.game_state import BUY_ACTIONS, FIGHT, FLEE, MOVE, PHASE_BATTLE, TOMB, DragonState, PlayerState
+from models.outcome_tables import BATTLE, DRAGON, PLAGUE, TREASURE
+from models.rule_params import DEFAULT_RULES, RuleParams
+
+FLAG_FIELDS = ("bronze_key", "silver_key", "gold_key", "dragon_sword", "beast", "healer", "scout", "pegasus")
+DIE = battle.DIE_FACES
+TABLE_VERSION = 2
+
+
+class _Timeout(Exception):
+    """Raised inside the search when the time budget runs out"""
+
+
+def pack(player, dragon, brigands: int = 0) -> tuple:
+    """Build a solo state tuple from a player and the dragon"""
+    flags = 0
+    for bit, field in enumerate(FLAG_FIELDS):
+        if getattr(player, field):
+            flags |= 1 << bit
+    return (player.warriors, player.gold, player.food, flags, player.kingdom, brigands, dragon.gold, dragon.warriors)
+
+
+def unpack(state: tuple):
+    """Rebuild (PlayerState, DragonState, brigands) from a solo state tuple"""
+    warriors, gold, food, flags, kingdom, brigands, dragon_gold, dragon_warriors = state
+    player = PlayerState(warriors=warriors, gold=gold, food=food, kingdom=kingdom)
+    for bit, field in enumerate(FLAG_FIELDS):
+        setattr(player, field, bool(flags >> bit & 1))
+    return player, DragonState(dragon_gold, dragon_warriors), brigands
+
+
+def solo_value(state: tuple) -> float:
+    """Heuristic leaf value (0-1): fighting strength, scaled by food on hand"""
+    warriors, gold, food = state[0], state[1], state[2]
+    if rules.is_eliminated(warriors, food):
+        return 0.0
+    fed = min(1.0, food / (10 * rules.food_per_turn(warriors)))
+    strength = warriors + gold / 8
+    return fed * strength / (strength + 20)
+
+
+def _end_turn(player, dragon) -> tuple:
+    rules.consume_food(player)
+    return pack(player, dragon)
+
+
+def _treasure_outcomes(state: tuple, weight: float, out: dict):
+    """Add every treasure result of a state, weighted, to out"""
+    for gold_roll in range(0, DIE, 2):
+        for item_roll in range(DIE):
+            player, dragon, _ = unpack(state)
+            rules.award_treasure(player, gold_roll, item_roll)
+            key = _end_turn(player, dragon)
+            # Gold rolls come in pairs (r // 2), so each even roll stands for two
+            out[key] = out.get(key, 0.0) + weight * 2 / (DIE * DIE)
+
+
+def _battle_start_outcomes(state: tuple, weight: float, out: dict):
+    for roll in range(DIE):
+        player, dragon, _ = unpack(state)
+        brigands = battle.brigand_count(player.warriors, roll)
+        if battle.is_battle_over(player.warriors, brigands):
+            key = _end_turn(player, dragon)
+        else:
+            key = pack(player, dragon, brigands)
+        out[key] = out.get(key, 0.0) + weight / DIE
+
+
+def transitions(state: tuple, action, params: RuleParams = DEFAULT_RULES):
+    """
+    Chance outcomes of an action.
+
+    Returns:
+        A list of (probability, next_state)
+    """
+    out = {}
+    if action == MOVE:
+        for outcome in set(params.move_table):
+            weight = params.move_table.count(outcome) / DIE
+            if outcome == BATTLE:
+                _battle_start_outcomes(state, weight, out)
+                continue
+            player, dragon, _ = unpack(state)
+            if outcome == DRAGON:
+                rules.dragon_attack(player, dragon)
+            elif outcome == PLAGUE:
+                rules.plague(player)
+            key = _end_turn(player, dragon)
+            out[key] = out.get(key, 0.0) + weight
+
+    elif action == TOMB:
+        for outcome in set(params.tomb_table):
+            weight = params.tomb_table.count(outcome) / DIE
+            if outcome == BATTLE:
+                _battle_start_outcomes(state, weight, out)
+            elif outcome == TREASURE:
+                _treasure_outcomes(state, weight, out)
+            else:
+                player, dragon, _ = unpack(state)
+                key = _end_turn(player, dragon)
+                out[key] = out.get(key, 0.0) + weight  # Close encounter
+
+    elif action == FLEE:
+        player, dragon, _ = unpack(state)
+        player.warriors = battle.flee(player.warriors)
+        out[_end_turn(player, dragon)] = 1.0
+
+    elif action == FIGHT:
+        player, dragon, brigands = unpack(state)
+        p_win = battle.round_win_faces(player.warriors, brigands) / DIE
+        for won, prob in ((True, p_win), (False, 1 - p_win)):
+            if prob == 0:
+                continue
+            player, dragon, brigands = unpack(state)
+            if won:
+                brigands //= 2
+            else:
+                player.warriors -= 1
+            if not battle.is_battle_over(player.warriors, brigands):
+                key = pack(player, dragon, brigands)
+                out[key] = out.get(key, 0.0) + prob
+            elif brigands <= 0:
+                _treasure_outcomes(pack(player, dragon), prob, out)
+            else:
+                key = _end_turn(player, dragon)
+                out[key] = out.get(key, 0.0) + prob
+
+    else:
+        # Bazaar purchase: enumerate the price roll
+        if action.item == "food":
+            faces = 1
+        elif action.item == "warriors":
+            faces = params.warrior_price_spread
+        else:
+            faces = params.item_price_spread
+        for face in range(faces):
+            player, dragon, _ = unpack(state)
+            price = rules.bazaar_price(action.item, lambda zero_to: face, params)
+            rules.buy(player, action.item, action.count, price)
+            key = _end_turn(player, dragon)
+            out[key] = out.get(key, 0.0) + 1 / faces
+
+    return [(prob, key) for key, prob in out.items()]
+
+
+def legal_actions(state: tuple):
+    if state[5] > 0:
+        return [FIGHT, FLEE]
+    flags = state[3]
+    actions = [MOVE, TOMB]
+    for action in BUY_ACTIONS:
+        if action.item in ("beast", "scout", "healer") and flags >> FLAG_FIELDS.index(action.item) & 1:
+            continue
+        actions.append(action)
+    return actions
+
+
+class ExpectimaxSolver:
+    """
+    Iterative-deepening expectimax with an LRU transposition table.
+
+    Args:
+        max_depth: Deepest search in decisions
+        time_budget: Seconds per decision (None searches to max_depth)
+        table_size: Most (state, depth) entries kept in the table
+        params: Rule parameters the table is solved for
+    """
+
+    def __init__(self, max_depth: int = 4, time_budget: float = 0.05, table_size: int = 500_000,
+                 params: RuleParams = DEFAULT_RULES):
+        self.max_depth = max_depth
+        self.params = params
+        self.time_budget = time_budget
+        self.table_size = table_size
+        self.table = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.depth_reached = 0
+        self._deadline = None
+
+    def choose(self, game_state):
+        """Pick an action for the current player of a GameState"""
+        if game_state.params != self.params:
+            # Table values only hold for the rules they were solved under
+            self.params = game_state.params
+            self.table.clear()
+        player = game_state.player
+        brigands = game_state.brigands if game_state.phase == PHASE_BATTLE else 0
+        _, action = self.solve(pack(player, game_state.dragon, brigands))
+        return action
+
+    def solve(self, state: tuple):
+        """
+        Search a solo state by iterative deepening.
+
+        Returns:
+            (value, best action) from the deepest finished iteration
+        """
+        self._deadline = time.perf_counter() + self.time_budget if self.time_budget is not None else None
+        best = (solo_value(state), legal_actions(state)[0])
+        self.depth_reached = 0
+        for depth in range(1, self.max_depth + 1):
+            try:
+                best = self._decision(state, depth)
+            except _Timeout:
+                break
+            self.depth_reached = depth
+        return best
+
+    def _decision(self, state: tuple, depth: int):
+        key = (state, depth)
+        entry = self.table.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.table.move_to_end(key)
+            return entry
+        self.misses += 1
+
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise _Timeout()
+
+        best_value, best_action = -1.0, None
+        for action in legal_actions(state):
+            value = 0.0
+            for prob, next_state in transitions(state, action, self.params):
+                if depth <= 1 or rules.is_eliminated(next_state[0], next_state[2]):
+                    value += prob * solo_value(next_state)
+                else:
+                    value += prob * self._decision(next_state, depth - 1)[0]
+            if value > best_value:
+                best_value, best_action = value, action
+
+        entry = (best_value, best_action)
+        self.table[key] = entry
+        if len(self.table) > self.table_size:
+            self.table.popitem(last=False)
+        return entry
+
+    def save(self, path):
+        """Write the transposition table to disk"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump((TABLE_VERSION, self.params, self.table), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def load(self, path) -> bool:
+        """
+        Load a transposition table saved by save().
+
+        Returns:
+            False if there was no usable table at path
+        """
+        if not os.path.exists(path):
+            return False
+        with open(path, "rb") as f:
+            version, *data = pickle.load(f)
+        if version != TABLE_VERSION:
+            return False
+        params, table = data
+        if params != self.params:
+            return False
+        self.table = table
+        while len(self.table) > self.table_size:
+            self.table.popitem(last=False)
+        return True
@@ -0,0 +1,212 @@
+"""
+Monte Carlo Tree Search Bot
+
+Open-loop MCTS over models.game_state.GameState. Tree nodes are keyed by
+the sequence of actions from the root. Die rolls are drawn again on every
+iteration, so each node averages over the chance outcomes behind it.
+Rollouts use the same rules as the live game (models.rules, models.battle)
+and are cut off after a few rounds with a heuristic evaluation.
+
+Features:
+- Iteration and/or time budget per decision (default 40 ms)
+- Root parallelism: independent searches in a persistent process pool
+  (threads would share the GIL), started when the bot is made, all
+  searching to one shared deadline, with root visit counts summed before
+  choosing
+- Tree reuse: observe() walks the tree along the actions actually played
+  so the next search starts from the matching subtree
+
+Usage:
+    bot = MCTSBot(time_budget=0.04)
+    action = bot.choose(state)
+    for played in actions_applied_to_the_game:
+        bot.observe(played)
+"""
+
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from bots.policies import greedy_policy, player_value
+from models.game_state import GameState
+
+
+class Node:
+    """A tree node: statistics for the player who chose the action leading here"""
+
+    __slots__ = ("children", "visits", "value")
+
+    def __init__(self):
+        self.children = {}
+        self.visits = 0
+        self.value = 0.0
+
+
+def _evaluate(state):
+    """Per-player values (0-1) for a finished or cut-off rollout"""
+    if state.is_over():
+        winner = state.winner()
+        return [1.0 if i == winner else 0.0 for i in range(len(state.players))]
+    return [player_value(state, i) for i in range(len(state.players))]
+
+
+def search(root: Node, state, rng: random.Random, iterations: int = None, time_budget: float = None,
+           exploration: float = 1.4, rollout_turns: int = 6, rollout_policy=greedy_policy) -> Node:
+    """
+    Run MCTS iterations from state into root.
+
+    Stops after iterations, or after time_budget seconds, whichever comes
+    first. At least one of the two must be given.
+    """
+    if iterations is None and time_budget is None:
+        raise ValueError("search needs an iteration or time budget")
+    deadline = time.perf_counter() + time_budget if time_budget is not None else None
+    done = 0
+
+    while (iterations is None or done < iterations) and (deadline is None or time.perf_counter() < deadline):
+        done += 1
+        sim = state.clone()
+        node = root
+        path = []
+
+        # Selection / expansion
+        while not sim.is_over():
+            actions = sim.legal_actions()
+            unvisited = [a for a in actions if a not in node.children]
+            if unvisited:
+                action = rng.choice(unvisited)
+                child = node.children[action] = Node()
+                path.append((child, sim.current))
+                sim.apply(action, rng)
+                break
+
+            log_visits = math.log(node.visits or 1)
+            best_score = -1.0
+            for a in actions:
+                c = node.children[a]
+                score = c.value / c.visits + exploration * math.sqrt(log_visits / c.visits) if c.visits else math.inf
+                if score > best_score:
+                    best_score, action, child = score, a, c
+            path.append((child, sim.current))
+            sim.apply(action, rng)
+            node = child
+
+        # Rollout
+        stop_turn = sim.turn + rollout_turns
+        while not sim.is_over() and sim.turn < stop_turn:
+            sim.apply(rollout_policy(sim, rng), rng)
+        values = _evaluate(sim)
+
+        # Backpropagation
+        root.visits += 1
+        for child, actor in path:
+            child.visits += 1
+            child.value += values[actor]
+
+    return root
+
+
+def _warm_worker():
+    """Pool entry point run once per process so the first real search starts at once"""
+    return None
+
+
+def _search_worker(state, seed, iterations, time_budget, exploration, rollout_turns):
+    """Pool entry point: run a fresh search and return root child stats"""
+    root = search(Node(), state, random.Random(seed), iterations, time_budget, exploration, rollout_turns)
+    return {action: (child.visits, child.value) for action, child in root.children.items()}
+
+
+class MCTSBot:
+    """
+    MCTS player.
+
+    Args:
+        iterations: Iteration budget per decision (None for time only)
+        time_budget: Seconds per decision (None for iterations only)
+        workers: Root-parallel searches; the calling thread runs one and
+            workers - 1 run in worker processes
+        reuse_tree: Keep the subtree for the actions played between decisions
+        seed: Seed for reproducible decisions
+
+    With workers > 1 all searches share one deadline: the time budget less
+    the time the last few decisions spent past their deadline handing out
+    and collecting work, so a decision takes about time_budget overall.
+    """
+
+    def __init__(self, iterations: int = None, time_budget: float = 0.04, workers: int = 1,
+                 reuse_tree: bool = True, exploration: float = 1.4, rollout_turns: int = 6, seed=None):
+        self.iterations = iterations
+        self.time_budget = time_budget
+        self.workers = workers
+        self.reuse_tree = reuse_tree
+        self.exploration = exploration
+        self.rollout_turns = rollout_turns
+        self.rng = random.Random(seed)
+        self.root = Node()
+        self.overhead = None  # Seconds past the deadline spent collecting worker results
+        self.pool = None
+        if workers > 1:
+            self.pool = ProcessPoolExecutor(max_workers=workers - 1)
+            # Start every worker process now rather than on the first move
+            for future in [self.pool.submit(_warm_worker) for _ in range(workers - 1)]:
+                future.result()
+            if time_budget is not None:
+                # A throwaway decision measures the overhead before the first real one
+                self.choose(GameState.new_game(players=2, rng=random.Random(0)))
+                self.root = Node()
+
+    def choose(self, state):
+        """Search from state and return the most visited root action"""
+        actions = state.legal_actions()
+        if len(actions) == 1:
+            return actions[0]
+
+        if not self.reuse_tree:
+            self.root = Node()
+
+        deadline = None
+        if self.time_budget is not None:
+            deadline = time.perf_counter() + max(0.0, self.time_budget - (self.overhead or 0.0))
+
+        def remaining():
+            # Clocks are not shared with the workers, so each gets the time left at submit
+            return None if deadline is None else max(0.0, deadline - time.perf_counter())
+
+        # The calling thread searches into the reusable tree while worker
+        # processes build independent trees that are merged at the root.
+        futures = []
+        if self.pool is not None:
+            futures = [
+                self.pool.submit(_search_worker, state, self.rng.random(), self.iterations,
+                                 remaining(), self.exploration, self.rollout_turns)
+                for _ in range(self.workers - 1)
+            ]
+        search(self.root, state, self.rng, self.iterations, remaining(), self.exploration, self.rollout_turns)
+
+        visits = {a: c.visits for a, c in self.root.children.items() if a in actions}
+        for future in futures:
+            for action, (count, _) in future.result().items():
+                if action in actions:
+                    visits[action] = visits.get(action, 0) + count
+        if futures and deadline is not None:
+            late = max(0.0, time.perf_counter() - deadline)
+            if self.overhead is not None:
+                late = (self.overhead + late) / 2
+            self.overhead = min(self.time_budget, late)
+
+        return max(actions, key=lambda a: visits.get(a, 0))
+
+    def observe(self, action):
+        """Advance the reusable tree by an action that was played in the game"""
+        self.root = self.root.children.get(action) or Node()
+
+    def reset(self):
+        """Forget the search tree, e.g. for a new game"""
+        self.root = Node()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
@@ -0,0 +1,75 @@
+"""
+Simple Policies
+
+Fast action policies used as rollout policies for search bots and as
+baseline opponents in simulations. A policy is a callable
+policy(state, rng) -> action for the current player of a GameState.
+"""
+
+import random
+
+from models import battle, rules
+from models.game_state import FIGHT, FLEE, MOVE, PHASE_BATTLE, TOMB, Buy
+
+
+def random_policy(state, rng: random.Random):
+    """Pick any legal action uniformly"""
+    return rng.choice(state.legal_actions())
+
+
+def greedy_policy(state, rng: random.Random):
+    """
+    Rule-of-thumb play: fight battles that are more likely won than lost,
+    buy food before running out, and otherwise explore or move.
+    """
+    player = state.player
+    if state.phase == PHASE_BATTLE:
+        return FIGHT if battle.win_probability(player.warriors, state.brigands) >= 0.5 else FLEE
+
+    if player.food <= 3 * rules.food_per_turn(player.warriors) and player.gold >= 10:
+        return Buy("food", 10)
+    if not player.healer and player.gold >= 40:
+        return Buy("healer", 1)
+    return TOMB if rng.random() < 0.5 else MOVE
+
+
+POLICIES = {
+    "random": random_policy,
+    "greedy": greedy_policy,
+}
+
+
+def player_value(state, index: int) -> float:
+    """
+    Heuristic value (0-1) of a position for one player.
+
+    Eliminated players score 0. Otherwise the score is the player's share of
+    fighting strength against the strongest rival, scaled down when there is
+    not enough food to last until the round limit.
+    """
+    players = state.players
+    player = players[index]
+    if player.is_eliminated:
+        return 0.0
+
+    turns_left = max(0, state.max_turns - state.turn + 1)
+    food_needed = rules.food_per_turn(player.warriors) * turns_left
+    fed = min(1.0, player.food / food_needed) if food_needed else 1.0
+
+    strength = player.warriors + player.gold / 8
+    rival = max(
+        (p.warriors + p.gold / 8 for i, p in enumerate(players) if i != index and not p.is_eliminated),
+        default=20,
+    )
+    return fed * strength / (strength + rival) if strength + rival else 0.0
+
+
+class PolicyBot:
+    """Bot wrapper around a policy function, usable wherever MCTSBot is"""
+
+    def __init__(self, policy=greedy_policy, seed=None):
+        self.policy = POLICIES[policy] if isinstance(policy, str) else policy
+        self.rng = random.Random(seed)
+
+    def choose(self, state):
+        return self.policy(state, self.rng)
@@ -1,13 +1,24 @@
 
 from typing import TYPE_CHECKING
+from models import zobrist
+from models.journal import Journaled
 
 if TYPE_CHECKING:
     from game import GameController
 
-class Dragon:
+class Dragon(Journaled):
 
     def __init__(self, gc: "GameController"):
+        self.gc: "GameController" = gc
         self.gold = 0
         self.warriors = 0
-    
+
+    def __setattr__(self, name, value):
+        # Keep the game hash in step with changes to the hoard
+        if name in zobrist.DRAGON_FIELDS and name in self.__dict__:
+            game_hash = getattr(self.gc, "zobrist", None)
+            if game_hash is not None:
+                game_hash.update("dragon", name, self.__dict__[name], value)
+        super().__setattr__(name, value)
+
     
\ No newline at end of file
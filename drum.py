@@ -1,6 +1,5 @@
 
 from typing import TYPE_CHECKING
-import tkinter as tk
 
 if TYPE_CHECKING:
     from game import GameController
@@ -13,7 +12,8 @@ class Drum:
     def display(self, player_number: int, item: str, number: int=None, display_time: int=1250):
         """Display player inventory item for 1 second.
         
-        Blocks the calling code but keeps the UI responsive.
+        A step script: run it with gc.driver.play() or `yield from` it inside
+        another script, which pauses for display_time before going on.
         Args:
             item: The inventory item to display (gold, warriors, food, keys, etc.)
         """
@@ -25,7 +25,5 @@ class Drum:
         if number is not None:
             self.gc.display.set_value(number)
 
-        # Wait 1 second while keeping UI responsive
-        wait_var = tk.BooleanVar()
-        self.gc.root.after(display_time, wait_var.set, True)
-        self.gc.root.wait_variable(wait_var)
+        # The driver waits while the UI keeps running
+        yield display_time
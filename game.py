@@ -5,21 +5,48 @@ This file serves as the central starting point for the Dark Tower game.
 It initializes the window and manages game states through a state machine.
 """
 
+import argparse
+import asyncio
 import tkinter as tk
+from async_loop import AsyncTkLoop
+from bots.autoplayer import AutoPlayer
+from bots.mcts import MCTSBot
 from dragon import Dragon
 from drum import Drum
+from input_queue import InputQueue
+from latency import LatencyMonitor
 from locations.bazaar import Bazaar
+from models.journal import Journal
+from models.levels import rules_for_level
+from models.rule_params import RuleParams
+from models.zobrist import ZobristHash
+from scenarios import Scenario, ScenarioError, ScenarioRunner
+from scheduler import Scheduler, TkScheduler
+from script_driver import ScriptDriver
+from simulation.replay import ReplayReader, ReplayRecorder
 from states.state_machine import StateMachine
 from ui.button_grid import ButtonGrid
 from ui.seven_segment_display import SevenSegmentDisplay
 from ui.player_stats_window import PlayerStatsWindow
 from ui.game_master_window import GameMasterWindow
+from ui.replay_viewer import ReplayViewer
+from ui.view_model import DisplayView, ViewModel
 import random
+from collections import deque
 
 class GameController:
     """
     Main game controller that manages the window and state machine.
     """
+
+    # Repeat clicks of the same button closer together than this are dropped
+    INPUT_DEBOUNCE_MS = 120
+
+    # Wait out drum reveals in real time (headless runs skip the pauses)
+    PACE_SCRIPTS = True
+
+    # Cross-check the incremental game hash with a full recompute after every turn (test harnesses)
+    VERIFY_HASH = False
     
     def setup_debug(self):
         """Setup debug mode with deterministic random seed"""
@@ -50,17 +77,105 @@ class GameController:
             
             print(f"Step {self._debug_step_index + 1}: {message}")
             self.set_message(message)
-            self.grid.on_button_click(button)
+            self.press(button)
             
             # Schedule the next step after 1000ms (1 second)
             self._debug_step_index += 1
-            self.root.after(1000, self._execute_next_debug_step)
+            self.scheduler.after(1000, self._execute_next_debug_step)
         else:
             # Re-enable buttons when done
             self.grid.enable_all_buttons()
             print("Debug steps completed!")
             self.set_message("Debug steps completed!")
 
+    def run_scenario_file(self):
+        """Ask for a scenario file and play it live, one step per second"""
+        from tkinter import filedialog
+
+        path = filedialog.askopenfilename(
+            title="Run scenario",
+            filetypes=[("Scenario files", "*.json"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+
+        try:
+            scenario = Scenario.load(path)
+        except ScenarioError as e:
+            self.set_message(str(e))
+            return
+
+        self.IS_DEBUG = False
+        self.new_game(seed=scenario.seed)
+
+        self.grid.disable_all_buttons()
+        self.set_message(f"Running scenario: {scenario.name}")
+        self.scenario_runner = ScenarioRunner(self, scenario, step_delay=1000, on_complete=self._on_scenario_complete)
+        self.scenario_runner.start()
+
+    def _on_scenario_complete(self, runner: ScenarioRunner):
+        """Report the result of a live scenario run"""
+        self.grid.enable_all_buttons()
+        if runner.passed:
+            print(f"Scenario passed: {runner.scenario.name}")
+            self.set_gm_status(f"Scenario passed: {runner.scenario.name}")
+            return
+
+        print(f"Scenario failed: {runner.scenario.name}")
+        for failure in ([runner.error] if runner.error else runner.failures):
+            print(f"    {failure}")
+        self.set_gm_status(f"Scenario failed: {runner.error or runner.failures[0]}")
+
+    def toggle_bot(self):
+        """Let the MCTS bot play every seat, or hand control back"""
+        if hasattr(self, 'auto_player') and self.auto_player.running:
+            self.auto_player.stop()
+            self.set_gm_status("MCTS bot stopped")
+            return
+
+        self.auto_player = AutoPlayer(self, MCTSBot(), step_delay=1000)
+        self.auto_player.start()
+        self.set_gm_status("MCTS bot playing")
+
+    def toggle_replay(self):
+        """Start recording the game to a replay file, or finish the recording"""
+        from tkinter import filedialog
+
+        if hasattr(self, 'replay_recorder') and not self.replay_recorder.closed:
+            self.replay_recorder.close()
+            self.set_gm_status(f"Replay saved: {self.replay_recorder.frames} turns")
+            return
+
+        path = filedialog.asksaveasfilename(
+            title="Record replay",
+            defaultextension=".dtr",
+            filetypes=[("Replay files", "*.dtr"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+
+        self.replay_recorder = ReplayRecorder(path)
+        self.replay_recorder.attach(self)
+        self.set_gm_status("Recording replay")
+
+    def open_replay(self):
+        """Ask for a replay file and open it in a scrubber window"""
+        from tkinter import filedialog
+
+        path = filedialog.askopenfilename(
+            title="Open replay",
+            filetypes=[("Replay files", "*.dtr"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+
+        try:
+            reader = ReplayReader(path)
+        except (OSError, ValueError) as e:
+            self.set_message(str(e))
+            return
+        ReplayViewer(tk.Toplevel(self.root), reader)
+
     
     def create_menu(self):
         """Create the menu bar"""
@@ -72,13 +187,17 @@ class GameController:
         self.menubar.add_cascade(label="File", menu=file_menu)
         
         file_menu.add_command(label="New Game", command=self.new_game)
+        file_menu.add_command(label="Record Replay...", command=self.toggle_replay)
+        file_menu.add_command(label="Open Replay...", command=self.open_replay)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self.exit_game)
 
         # Debug Menu
         debug_menu = tk.Menu(self.menubar, tearoff=0)
         self.menubar.add_cascade(label="Debug", menu=debug_menu)
         debug_menu.add_command(label="Run automated commands", command=self.setup_debug)
+        debug_menu.add_command(label="Run scenario file...", command=self.run_scenario_file)
+        debug_menu.add_command(label="Toggle MCTS bot", command=self.toggle_bot)
         debug_menu.add_command(label="Clear Messages", command=self.clear_message)
         debug_menu.add_separator()
         debug_menu.add_command(label="Set seed 42", command=lambda: self.random.seed(42))
@@ -89,26 +208,39 @@ class GameController:
         # Function menu
         if hasattr(self, 'player_menu_created') and self.player_menu_created:
             self.menubar.delete("Function")
+            self.player_menu.destroy()
         player_menu = tk.Menu(self.menubar, tearoff=0)
         self.menubar.add_cascade(label="Function", menu=player_menu)
+        self.player_menu = player_menu
 
         for idx, p in enumerate(self.players, start=1):
             m = tk.Menu(player_menu, tearoff=0)
             player_menu.add_cascade(label=f"Player {idx}", menu=m)
             
             # Submenu for each player
-            m.add_command(label="Show Gold", command=lambda p=p: p.display("gold"))
-            m.add_command(label="Show Warriors", command=lambda p=p: p.display("warriors"))
-            m.add_command(label="Show Food", command=lambda p=p: p.display("food"))
-            m.add_command(label="Show Keys", command=lambda p=p: p.display("keys"))
+            m.add_command(label="Show Gold", command=lambda p=p: self.driver.play(p.display("gold")))
+            m.add_command(label="Show Warriors", command=lambda p=p: self.driver.play(p.display("warriors")))
+            m.add_command(label="Show Food", command=lambda p=p: self.driver.play(p.display("food")))
+            m.add_command(label="Show Keys", command=lambda p=p: self.driver.play(p.display("keys")))
         self.player_menu_created = True
 
 
-    def new_game(self):
-        """Start a new game"""
+    def new_game(self, seed=None):
+        """
+        Start a new game from a clean slate.
+
+        Args:
+            seed: Seed for the dice. Without one the dice are reseeded from
+                the OS, so back-to-back games never repeat their rolls.
+        """
         if hasattr(self, 'player_menu_created') and self.player_menu_created:
             self.menubar.delete("Function")
+            self.player_menu.destroy()
         self.player_menu_created = False
+
+        # Drop any reveal or press still waiting from the old game
+        self.driver.cancel()
+        self.input_queue.clear()
         
         # Destroy the player stats window if it exists
         if hasattr(self, 'game_master_window') and self.game_master_window.stats_window:
@@ -116,10 +248,14 @@ class GameController:
             self.game_master_window.stats_window = None
         
         self.state_machine.reset()
+        self.random.seed(seed)
+        self.clear_forced_events()
+        self.clear_message()
+        self.reset_game_objects()
         self.state_machine.start()
 
 
-    def __init__(self):
+    def __init__(self, scheduler: Scheduler = None):
         self.players = []
 
         self.root = tk.Tk()
@@ -127,24 +263,65 @@ class GameController:
         self.root.geometry("383x708")
         self.root.configure(bg="black")
 
+        # All delayed callbacks go through the scheduler
+        self.scheduler: Scheduler = scheduler if scheduler is not None else TkScheduler(self.root)
+
         self.random = random.Random()
         # Create menu bar
         self.create_menu()
         
         # DEBUG
         self.IS_DEBUG = True
-        self.random.seed(42)
-        self.has_forced_move = False
-        self.has_forced_die_roll = False
-        self.forced_move = ""
-        self.forced_die_roll = 0
+        self.seed = 42
+        self.random.seed(self.seed)
+        self.clear_forced_events()
         
         # Setup the windows and stuff
         self.setup_ui()
         
         # Create the button grid with callback
-        self.grid = ButtonGrid(self.grid_frame, on_button_click_callback=self.on_grid_button_click, game_controller=self)
+        self.grid = ButtonGrid(self.grid_frame, on_button_click_callback=lambda text: self.input_queue.submit(text), game_controller=self)
         
+        # Create the drum, dragon, bazaar and tower
+        self.setup_game_objects()
+
+        # Create the game master window
+        self.game_master_window = GameMasterWindow(self)
+
+        # Initialize the state machine this enters into an infinite loop of states
+        self.state_machine = StateMachine(self)
+        self.state_machine.start()
+        
+    def setup_game_objects(self):
+        """Create the non-UI game objects shared by every controller"""
+        # Button presses are handled one at a time, even during drum reveals
+        self.input_queue = InputQueue(self.scheduler, self.handle_input, debounce_ms=self.INPUT_DEBOUNCE_MS)
+
+        # Runs multi-step actions (drum reveals), holding the input queue while they play
+        self.driver = ScriptDriver(self.scheduler, paced=self.PACE_SCRIPTS, input_queue=self.input_queue)
+
+        # Press and state-enter latency, shown in the game master window
+        self.latency = LatencyMonitor(self.scheduler, getattr(self, "view", None))
+
+        # Undo history of every change to the game
+        self.journal = Journal()
+
+        # Incremental hash of the whole game, kept current by Player, Dragon and the state machine
+        self.zobrist = ZobristHash()
+        self._dt_brigands = 0
+
+        # Recorders notified by PlayerTurnState whenever a turn ends
+        self.turn_observers = []
+
+        self.reset_game_objects()
+
+    def reset_game_objects(self):
+        """Replace everything a game changes (rules, players, dragon, bazaar, tower) with a fresh set"""
+        # Balance numbers read by the rules (result tables, prices), replaced by set_level
+        self.level = 1
+        self.rules: RuleParams = rules_for_level(self.level)
+        self.players = []
+
         # Create Drum
         self.drum = Drum(self)
 
@@ -155,41 +332,73 @@ class GameController:
         self.bazaar = Bazaar(self)
 
         # Setup the Dark Tower
-        self.dt_brigands = self.roll_dice() + 17
+        self.dt_brigands = self.roll_dice() + self.rules.tower_brigands
 
         # TODO: Randomize these later
         self.dt_key_1 = "bronze"
         self.dt_key_2 = "silver"
 
-        # Create the game master window
-        self.game_master_window = GameMasterWindow(self)
+        # A new game cannot be undone back into the old one
+        self.journal.clear()
+        self.zobrist.rebuild(self)
+
+    def set_level(self, level: int):
+        """Switch to the rule profile of a difficulty level (1-3)"""
+        rules = rules_for_level(level)
+        # Keep the tower's die roll, moved into the level's brigand range
+        self.dt_brigands += rules.tower_brigands - self.rules.tower_brigands
+        self.level = level
+        self.rules = rules
+
+    @property
+    def dt_brigands(self) -> int:
+        """Brigands guarding the Dark Tower"""
+        return self._dt_brigands
+
+    @dt_brigands.setter
+    def dt_brigands(self, value: int):
+        self.zobrist.update("tower", "dt_brigands", self._dt_brigands, value)
+        self.journal.record(self, "dt_brigands", self._dt_brigands, value)
+        self._dt_brigands = value
 
-        # Initialize the state machine this enters into an infinite loop of states
-        self.state_machine = StateMachine(self)
-        self.state_machine.start()
-        
     def set_gm_status(self, status: str):
         """Update the status label text in game master window"""
-        self.game_master_window.update_status_window(status)
+        self.view.set("gm_status", status)
 
     def set_message(self, message):
         """Set the message text below the display"""
-        self.message_label.config(text=message)
+        self.view.set("message", message)
     
     def set_player_message(self, message):
         """Set the player-specific message text below the display"""
-        self.player_message_label.config(text=message)
+        self.view.set("player_message", message)
 
     def clear_message(self):
         """Clear the message text"""
-        self.message_label.config(text="")
-        self.player_message_label.config(text="")
+        self.view.set("message", "")
+        self.view.set("player_message", "")
     
     def update_stats_display(self):
         """Update the player stats display"""
+        self.view.set("stats", tuple((p.gold, p.warriors, p.food) for p in self.players))
+
+    def render_stats(self, stats):
+        """Show the player stats in the stats window, if there is one"""
         if hasattr(self, 'game_master_window') and self.game_master_window.stats_window:
             self.game_master_window.stats_window.update_player_stats()
     
+    def press(self, text, filtered: bool = False) -> bool:
+        """Press a grid button from code (bots, scenarios, debug steps), in turn with real clicks"""
+        return self.input_queue.submit(text, filtered)
+
+    def handle_input(self, text):
+        """Handle one press taken off the input queue"""
+        self.latency.press_started(text, self.input_queue.handling_since)
+        if self.grid is None or self.grid.buttons_enabled:
+            self.clear_message()
+        self.on_grid_button_click(text)
+        self.latency.press_handled()
+
     def on_grid_button_click(self, text):
         """Handle button clicks from the grid"""
         # Delegate to the current state if it has a handler
@@ -202,23 +411,35 @@ class GameController:
         """Roll a hex die and return the result"""
         result = self.random.randint(0, zero_to)
         print(f"Dice rolled (0-{zero_to}): {result}")
-        if self.has_forced_die_roll:
-            result = self.forced_die_roll
-            self.has_forced_die_roll = False
+        if self.forced_die_rolls:
+            result = self.forced_die_rolls.popleft()
             print(f"Forced die roll applied: {result}")
         return result
 
+    def clear_forced_events(self):
+        """Drop any queued forced moves and die rolls"""
+        self.forced_moves = deque()
+        self.forced_die_rolls = deque()
+
+    def force_move(self, move: str):
+        """Queue a forced move result (lost, dragon, plague, battle) for the next MOVE"""
+        self.forced_moves.append(move)
+
+    def force_die_roll(self, value: int):
+        """Queue a forced result for the next die roll"""
+        self.forced_die_rolls.append(value)
+
     def check_forced_moves(self):
         """Check if there are any forced moves (e.g., from game master)"""
-        if self.has_forced_move:
-            move = self.forced_move
-            self.has_forced_move = False
+        if self.forced_moves:
+            move = self.forced_moves.popleft()
             print(f"Forced move applied: {move}")
+            lost_max, dragon_max, plague_max, battle_max = self.rules.move_thresholds
             match move:
-                case "lost": return 2
-                case "dragon": return 4
-                case "plague": return 7
-                case "battle": return 10
+                case "lost": return lost_max
+                case "dragon": return dragon_max
+                case "plague": return plague_max
+                case "battle": return battle_max
                 case _: return 15 # Nothing
         return None
 
@@ -228,13 +449,13 @@ class GameController:
         self.display_frame.pack(pady=(20, 0))
         
         # Create the 7-segment display
-        self.display = SevenSegmentDisplay(
+        self.display_widget = SevenSegmentDisplay(
             self.display_frame,
             on_color="#d60000",   # Red
             off_color="#2a0000",  # Dark red
             bg_color="#000000"    # Black
         )
-        self.display.pack()
+        self.display_widget.pack()
         
         # Create message label below display
         self.player_message_label = tk.Label(
@@ -259,6 +480,16 @@ class GameController:
             justify=tk.CENTER
         )
         self.message_label.pack(pady=(10, 0))
+
+        # Game logic writes to the view model; it reaches the widgets once per frame
+        self.view = ViewModel(self.scheduler, {
+            "display": self.display_widget.set_value,
+            "player_message": lambda text: self.player_message_label.config(text=text),
+            "message": lambda text: self.message_label.config(text=text),
+            "gm_status": lambda status: self.game_master_window.update_status_window(status),
+            "stats": self.render_stats,
+        })
+        self.display = DisplayView(self.view)
         
         # Add spacing between message and button grid
         self.spacer_frame = tk.Frame(self.root, bg="black", height=180)
@@ -269,13 +500,40 @@ class GameController:
         self.grid_frame.pack(fill=tk.BOTH, expand=True)
         
 
-    def run(self):
-        """Start the game loop"""
+    def run(self, use_asyncio: bool = False):
+        """Start the game loop, on an asyncio event loop if use_asyncio (see async_loop.py)"""
+        if use_asyncio:
+            asyncio.run(self.run_async())
+            return
         self.root.mainloop()
 
-def main():
+    async def run_async(self, *tasks):
+        """
+        Run the game inside the running asyncio event loop.
+
+        Args:
+            tasks: Coroutines run alongside the UI, cancelled when the window closes
+        """
+        self.async_loop = AsyncTkLoop(self.root)
+        for task in tasks:
+            self.async_loop.spawn(task)
+        await self.async_loop.run()
+
+    def exit_game(self):
+        """Close the game, whichever loop is running it"""
+        # root.quit() only ends mainloop(); the asyncio pump has to be told
+        async_loop = getattr(self, "async_loop", None)
+        if async_loop is not None and async_loop.running:
+            async_loop.stop()
+        self.root.destroy()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dark Tower game")
+    parser.add_argument("--asyncio", action="store_true", help="Drive Tk from an asyncio event loop")
+    args = parser.parse_args(argv)
+
     game = GameController()
-    game.run()
+    game.run(use_asyncio=args.asyncio)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,101 @@
+"""
+Headless Game Controller
+
+Runs the real game states, Player, Drum and Bazaar logic without creating
+any Tk windows. UI calls are captured on plain attributes so scripts and
+simulations can inspect them, timing goes through a VirtualScheduler and
+drum reveals run unpaced, so display waits cost nothing.
+"""
+
+import random
+from game import GameController
+from scheduler import Scheduler, VirtualScheduler
+from states.state_machine import StateMachine
+
+
+class HeadlessDisplay:
+    """Stand-in for SevenSegmentDisplay that only remembers the last value"""
+
+    def __init__(self):
+        self.value = "off"
+
+    def set_value(self, value):
+        self.value = value
+
+    def clear(self):
+        self.value = "off"
+
+
+class HeadlessGameMasterWindow:
+    """Stand-in for GameMasterWindow with no stats window"""
+
+    def __init__(self):
+        self.stats_window = None
+        self.status = ""
+
+    def update_status_window(self, status: str):
+        self.status = status
+
+    def create_stats_window(self):
+        pass
+
+
+class HeadlessController(GameController):
+    """
+    Game controller with the same interface as GameController but no UI.
+
+    Usage:
+        gc = HeadlessController(seed=42)
+        gc.press("YES")   # Level 1
+        gc.press("YES")   # 1 player
+        gc.press("MOVE")
+    """
+
+    # Scripts press buttons at the same virtual time, so nothing is debounced
+    INPUT_DEBOUNCE_MS = 0
+
+    # Drum reveals run straight through, so a press has finished when press() returns
+    PACE_SCRIPTS = False
+
+    def __init__(self, seed=None, scheduler: Scheduler = None):
+        self.players = []
+        self.root = None
+        self.scheduler: Scheduler = scheduler if scheduler is not None else VirtualScheduler()
+
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.IS_DEBUG = False
+        self.clear_forced_events()
+
+        self.message = ""
+        self.player_message = ""
+        self.display = HeadlessDisplay()
+        self.grid = None
+
+        self.setup_game_objects()
+
+        self.game_master_window = HeadlessGameMasterWindow()
+
+        self.state_machine = StateMachine(self)
+        self.state_machine.start()
+
+    def set_gm_status(self, status: str):
+        self.game_master_window.update_status_window(status)
+
+    def set_message(self, message):
+        self.message = message
+
+    def set_player_message(self, message):
+        self.player_message = message
+
+    def clear_message(self):
+        self.message = ""
+        self.player_message = ""
+
+    def update_stats_display(self):
+        pass
+
+    def run(self):
+        """Run any pending scheduled callbacks to completion"""
+        if isinstance(self.scheduler, VirtualScheduler):
+            self.scheduler.run()
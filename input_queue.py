@@ -0,0 +1,113 @@
+"""
+Input Queue - Serialized button presses
+
+Drum reveals wait through the scheduler, which keeps the event loop running,
+so a click during a reveal used to start a second button press in the
+middle of the first. Every press now goes through the game's InputQueue:
+a press made while another is being handled is queued and only runs once
+the current one has finished. A press whose script is still pausing on a
+drum reveal holds the queue (see script_driver.py) until the script ends.
+
+Presses can also be filtered before they are queued:
+- debounce_ms: a button pressed again within this many milliseconds of its
+  last accepted press is dropped (a bouncing or double click).
+- coalesce: a press identical to the newest press still waiting in the
+  queue is dropped, so hammering a button during a reveal counts once.
+
+Scripted presses (bots, scenarios) pass filtered=False to skip the filters
+but are still serialized.
+"""
+
+from collections import deque
+
+from scheduler import Scheduler
+
+
+class InputQueue:
+    """
+    Serializes button presses for one game.
+
+    Args:
+        scheduler: Clock used for debouncing
+        handler: Called with each press, one at a time
+        debounce_ms: Minimum time between accepted presses of the same button
+        coalesce: Drop a press that repeats the newest queued one
+        max_pending: Most presses kept waiting; further ones are dropped
+    """
+
+    def __init__(self, scheduler: Scheduler, handler, debounce_ms: int = 0, coalesce: bool = True,
+                 max_pending: int = 64):
+        self.scheduler = scheduler
+        self.handler = handler
+        self.debounce_ms = debounce_ms
+        self.coalesce = coalesce
+        self.pending = deque()
+        self.max_pending = max_pending
+        self.busy = False
+        self.held = False
+        self.handling_since = None  # When the press being handled was submitted
+        self.last_accepted = {}
+
+        # Counters for the GM window and stress runs
+        self.submitted = 0
+        self.processed = 0
+        self.debounced = 0
+        self.coalesced = 0
+        self.overflowed = 0
+
+    def submit(self, text, filtered: bool = True) -> bool:
+        """
+        Queue a press, handling it right away if nothing else is running.
+
+        Returns:
+            False if the press was dropped by a filter
+        """
+        self.submitted += 1
+        if filtered and not self._accept(text):
+            return False
+        if len(self.pending) >= self.max_pending:
+            self.overflowed += 1
+            return False
+
+        self.pending.append((text, self.scheduler.now()))
+        if not self.busy and not self.held:
+            self._drain()
+        return True
+
+    def clear(self):
+        """Drop every press still waiting"""
+        self.pending.clear()
+
+    def hold(self):
+        """Keep queued presses waiting until release()"""
+        self.held = True
+
+    def release(self):
+        """Handle the presses that queued up while held"""
+        self.held = False
+        if not self.busy:
+            self._drain()
+
+    def _accept(self, text) -> bool:
+        if self.coalesce and self.pending and self.pending[-1][0] == text:
+            self.coalesced += 1
+            return False
+        if self.debounce_ms > 0:
+            now = self.scheduler.now()
+            last = self.last_accepted.get(text)
+            if last is not None and now - last < self.debounce_ms:
+                self.debounced += 1
+                return False
+            self.last_accepted[text] = now
+        return True
+
+    def _drain(self):
+        self.busy = True
+        try:
+            while self.pending and not self.held:
+                text, self.handling_since = self.pending.popleft()
+                self.handler(text)
+                self.processed += 1
+        finally:
+            self.busy = False
+            self.handling_since = None
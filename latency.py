@@ -0,0 +1,190 @@
+"""
+Latency Monitor - Press and state-enter latency histograms
+
+Two kinds of latency are recorded per game, in microseconds:
+- press <button>: from the click (when it entered the input queue) to the
+  end of the frame that put its result on screen. Time spent queued behind
+  another press counts; drum reveal pauses of a press's script do not.
+- enter <state>: how long the state's enter() took.
+
+Each name has a LatencyHistogram: fixed, preallocated buckets in the
+log-linear layout of simulation.stats.bucket_floor (exact below 128 us, at
+most 1/64 of the value wide above), so recording is one index computation
+and an increment, and p50/p99 are read back at any time. The Game Master
+window shows them live and can dump every histogram to a JSON file.
+
+Usage:
+    gc.latency.summary()["press MOVE"]["p99_ms"]
+    gc.latency.dump("latency.json")
+"""
+
+import json
+import time
+
+from scheduler import Scheduler
+from simulation.stats import EXACT_LIMIT_BITS
+
+SUB_BUCKETS = 1 << (EXACT_LIMIT_BITS - 1)  # Buckets per power of two above the exact range
+HIGHEST_US = 60_000_000  # Slower values are counted in the top bucket
+
+
+def bucket_index(value: int) -> int:
+    """Index of the bucket holding value (a non-negative integer)"""
+    shift = value.bit_length() - EXACT_LIMIT_BITS
+    if shift <= 0:
+        return value
+    return shift * SUB_BUCKETS + (value >> shift)
+
+
+def bucket_value(index: int) -> int:
+    """Lowest value in a bucket, the same as simulation.stats.bucket_floor"""
+    if index < 2 * SUB_BUCKETS:
+        return index
+    shift = index // SUB_BUCKETS - 1
+    return (index - shift * SUB_BUCKETS) << shift
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket histogram of integer latencies.
+
+    Args:
+        highest: Largest value told apart; anything above shares the top bucket
+    """
+
+    def __init__(self, highest: int = HIGHEST_US):
+        self.highest = highest
+        self.counts = [0] * (bucket_index(highest) + 1)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.overflowed = 0
+
+    def record(self, value: int):
+        value = max(0, int(value))
+        if value > self.highest:
+            self.overflowed += 1
+            index = len(self.counts) - 1
+        else:
+            index = bucket_index(value)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float):
+        """Return the bucket floor at quantile q (0-1), or None if empty"""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen > rank:
+                return bucket_value(index)
+        return bucket_value(len(self.counts) - 1)
+
+    def merge(self, other: "LatencyHistogram"):
+        if other.highest != self.highest:
+            raise ValueError("Histograms with different ranges cannot be merged")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        self.overflowed += other.overflowed
+
+    def reset(self):
+        self.counts = [0] * len(self.counts)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.overflowed = 0
+
+    def as_dict(self) -> dict:
+        """JSON-friendly form: bucket floor -> count for every non-empty bucket"""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "overflowed": self.overflowed,
+            "buckets": {str(bucket_value(i)): count for i, count in enumerate(self.counts) if count},
+        }
+
+
+class LatencyMonitor:
+    """
+    Press and state-enter latency histograms for one game.
+
+    Args:
+        scheduler: Clock presses are timed on
+        view: ViewModel whose flush ends a press (None records presses when handled)
+    """
+
+    def __init__(self, scheduler: Scheduler, view=None):
+        self.scheduler = scheduler
+        self.view = view
+        self.histograms = {}
+        self.press_start = None
+        self.unrendered = []  # (name, start) of handled presses waiting for a flush
+        if view is not None:
+            view.flush_observers.append(self.frame_rendered)
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = LatencyHistogram()
+        return histogram
+
+    def press_started(self, text, submitted_ms: float = None):
+        """A press is being handled; submitted_ms is when it was clicked (None for now)"""
+        start = self.scheduler.now() if submitted_ms is None else submitted_ms
+        self.press_start = (f"press {text}", start)
+
+    def press_handled(self):
+        """The press handler returned; it is done once its frame is drawn"""
+        if self.press_start is None:
+            return
+        name, start = self.press_start
+        self.press_start = None
+        if self.view is None or self.view.flush_id is None:
+            # Nothing left to draw
+            self.histogram(name).record((self.scheduler.now() - start) * 1000)
+        else:
+            self.unrendered.append((name, start))
+
+    def frame_rendered(self):
+        """Called by the ViewModel after each flush"""
+        if not self.unrendered:
+            return
+        now = self.scheduler.now()
+        for name, start in self.unrendered:
+            self.histogram(name).record((now - start) * 1000)
+        self.unrendered.clear()
+
+    def state_entered(self, state_name: str, seconds: float):
+        self.histogram(f"enter {state_name}").record(seconds * 1e6)
+
+    def reset(self):
+        for histogram in self.histograms.values():
+            histogram.reset()
+
+    def summary(self) -> dict:
+        """Count, p50, p99 and max in milliseconds for every histogram"""
+        return {
+            name: {
+                "count": h.count,
+                "p50_ms": h.quantile(0.5) / 1000 if h.count else None,
+                "p99_ms": h.quantile(0.99) / 1000 if h.count else None,
+                "max_ms": h.max / 1000,
+            }
+            for name, h in sorted(self.histograms.items())
+        }
+
+    def dump(self, path: str):
+        """Write every histogram (in microseconds) to a JSON file"""
+        with open(path, "w") as f:
+            json.dump({
+                "unit": "us",
+                "written": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "histograms": {name: h.as_dict() for name, h in sorted(self.histograms.items())},
+            }, f, indent=2)
@@ -6,6 +6,10 @@ This state represents a player's time at the Bazaar in the game.
 """
 
 from typing import TYPE_CHECKING
+from models import rules
+from models.game_state import Buy
+from models.journal import Journaled
+from models.turn_record import OUTCOME_CODES
 from player import Player
 from states.player_turn_state import PlayerTurnState
 
@@ -13,7 +17,7 @@ if TYPE_CHECKING:
     from game import GameController
 
 
-class Bazaar:
+class Bazaar(Journaled):
 
     def __init__(self, gc: "GameController"):
         self.gc: "GameController" = gc
@@ -25,22 +29,32 @@ class Bazaar:
         self.gc.set_player_message(f"Player {player_number}: bazaar.")
         self.player = self.gc.players[player_number - 1]
         self.state:PlayerTurnState = state
-        self.set_starting_prices()
-        self.show_warriors()
         self.is_buying = False
         self.number_buying = 1
         self.item_price = 0
+        self.set_starting_prices()
+        self.show_warriors()
 
     def exit(self):
         self.state.exit_bazaar()
 
+    def restore(self):
+        """Redraw the bazaar after an undo or redo"""
+        self.gc.set_gm_status(f"Player {self.state.player_number} is at the bazaar.")
+        if self.is_buying:
+            self.display.set_value(self.number_buying)
+        else:
+            self.display.set_value(self.item_price)
+            self.gc.set_message(self.item.capitalize())
+
     def set_starting_prices(self):
         """Set the starting prices for bazaar items"""
-        self.food_price = 1
-        self.warrior_price = self.gc.roll_dice(3) + 5 # 5-8
-        self.beast_price = self.gc.roll_dice(9) + 17 # 17-26
-        self.scout_price = self.gc.roll_dice(9) + 17 # 17-26
-        self.healer_price = self.gc.roll_dice(9) + 17 # 17-26
+        params = self.gc.rules
+        self.food_price = rules.bazaar_price("food", self.gc.roll_dice, params) # 1
+        self.warrior_price = rules.bazaar_price("warriors", self.gc.roll_dice, params) # 5-8
+        self.beast_price = rules.bazaar_price("beast", self.gc.roll_dice, params) # 17-26
+        self.scout_price = rules.bazaar_price("scout", self.gc.roll_dice, params) # 17-26
+        self.healer_price = rules.bazaar_price("healer", self.gc.roll_dice, params) # 17-26
 
     def on_button_click(self, text):
         """Handle button clicks"""
@@ -85,6 +99,7 @@ class Bazaar:
         """Display the number of warriors the player has"""
         self.clear_flags()
         self.showing_warriors = True
+        self.item = "warriors"
         self.item_price = self.warrior_price
         self.display.set_value(self.warrior_price)
         self.gc.set_message(f"Warriors")
@@ -93,6 +108,7 @@ class Bazaar:
         """Display the amount of food the player has"""
         self.clear_flags()
         self.showing_food = True
+        self.item = "food"
         self.item_price = self.food_price
         self.display.set_value(self.food_price)
         self.gc.set_message(f"Food")
@@ -101,6 +117,7 @@ class Bazaar:
         """Display if the player has a beast"""
         self.clear_flags()
         self.showing_beast = True
+        self.item = "beast"
         self.item_price = self.beast_price
         self.display.set_value(self.beast_price)
         self.gc.set_message(f"Beast")
@@ -109,6 +126,7 @@ class Bazaar:
         """Display if the player has a scout"""
         self.clear_flags()
         self.showing_scout = True
+        self.item = "scout"
         self.item_price = self.scout_price
         self.display.set_value(self.scout_price)
         self.gc.set_message(f"Scout")
@@ -117,6 +135,7 @@ class Bazaar:
         """Display if the player has a healer"""
         self.clear_flags()
         self.showing_healer = True
+        self.item = "healer"
         self.item_price = self.healer_price
         self.display.set_value(self.healer_price)
         self.gc.set_message(f"Healer")
@@ -129,11 +148,12 @@ class Bazaar:
         """Confirm the purchase of the selected items"""
         total_cost = self.number_buying * self.item_price
 
-        if total_cost > self.player.gold:
+        if not rules.buy(self.player, self.item, self.number_buying, self.item_price):
             self.bazaar_closed()
             return
         
-        self.player.gold -= total_cost
+        self.state.plays += (Buy(self.item, self.number_buying),)
+        self.state.outcome = OUTCOME_CODES["purchase"]
         self.gc.update_stats_display()
         self.gc.set_message(f"Purchased {self.number_buying} item(s) for {total_cost} gold.")
         self.exit()
@@ -141,6 +161,7 @@ class Bazaar:
     def bazaar_closed(self):
         """Handle the bazaar being closed"""
         self.gc.set_message("The bazaar is closed.")
+        self.state.outcome = OUTCOME_CODES["closed"]
         self.exit()
 
     def increase_number_buying(self):
@@ -150,5 +171,6 @@ class Bazaar:
 
         if total_cost > self.player.gold:
             self.bazaar_closed()
+            return
        
         self.display.set_value(self.number_buying)
\ No newline at end of file
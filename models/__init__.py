@@ -0,0 +1,5 @@
+"""
+Models Package
+
+UI-free game rules and data structures for Dark Tower.
+"""
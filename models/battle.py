@@ -0,0 +1,143 @@
+"""
+Brigand Battle Rules
+
+Pure battle rules shared by PlayerTurnState, bots and simulations.
+
+Each round the player rolls the hex die. The chance of winning a round is
+the player's share of the fighters, rounded to whole die faces:
+
+    winning faces = ceil(16 * warriors / (warriors + brigands))
+
+Winning a round halves the brigands, losing a round costs one warrior. The
+battle is won when no brigands are left and lost when the player is down to
+a single warrior. Fleeing ends the battle at the cost of one warrior.
+
+The win-probability and expected-loss tables cover every (warriors, brigands)
+pair up to 99x99 and are built once at import.
+"""
+
+import random
+from itertools import compress
+
+MAX_FORCE = 99
+DIE_FACES = 16
+
+
+def round_win_faces(warriors: int, brigands: int) -> int:
+    """Return how many of the 16 hex die faces win the next round"""
+    if brigands <= 0:
+        return DIE_FACES
+    if warriors <= 0:
+        return 0
+    total = warriors + brigands
+    return min(DIE_FACES, -(-DIE_FACES * warriors // total))
+
+
+def brigand_count(warriors: int, roll: int) -> int:
+    """Number of brigands met in a battle, from the player's warriors and a hex roll"""
+    return max(1, min(MAX_FORCE, warriors - 3 + roll // 2))
+
+
+def resolve_round(warriors: int, brigands: int, roll: int):
+    """
+    Resolve one round of battle.
+
+    Returns:
+        (warriors, brigands, won_round)
+    """
+    if roll < round_win_faces(warriors, brigands):
+        return warriors, brigands // 2, True
+    return warriors - 1, brigands, False
+
+
+def is_battle_over(warriors: int, brigands: int) -> bool:
+    return brigands <= 0 or warriors <= 1
+
+
+def flee(warriors: int) -> int:
+    """Return the warriors left after fleeing a battle"""
+    return max(0, warriors - 1)
+
+
+def _build_tables():
+    """Build WIN_PROBABILITY and EXPECTED_LOSS by dynamic programming"""
+    size = MAX_FORCE + 1
+    win = [[0.0] * size for _ in range(size)]
+    loss = [[0.0] * size for _ in range(size)]
+
+    # Winning a round moves to (w, b // 2) and losing moves to (w - 1, b),
+    # both already filled when walking warriors then brigands upwards.
+    for w in range(size):
+        for b in range(size):
+            if b == 0:
+                win[w][b] = 1.0
+                continue
+            if w <= 1:
+                continue
+            p = round_win_faces(w, b) / DIE_FACES
+            win[w][b] = p * win[w][b // 2] + (1 - p) * win[w - 1][b]
+            loss[w][b] = p * loss[w][b // 2] + (1 - p) * (1 + loss[w - 1][b])
+
+    return win, loss
+
+
+WIN_PROBABILITY, EXPECTED_LOSS = _build_tables()
+
+
+def win_probability(warriors: int, brigands: int) -> float:
+    """Chance of winning a battle fought to the end"""
+    return WIN_PROBABILITY[max(0, min(MAX_FORCE, warriors))][max(0, min(MAX_FORCE, brigands))]
+
+
+def expected_loss(warriors: int, brigands: int) -> float:
+    """Expected warriors lost in a battle fought to the end"""
+    return EXPECTED_LOSS[max(0, min(MAX_FORCE, warriors))][max(0, min(MAX_FORCE, brigands))]
+
+
+def resolve_battles(warriors, brigands, rng: random.Random = None):
+    """
+    Fight many battles to the end at once.
+
+    The battles still running are kept as columns (battle index, warriors,
+    brigands) and each pass advances every one of them by a round: the dice
+    for the whole column come from a single getrandbits() call, then the
+    round results, the new forces and the battles that go on are each
+    computed across the whole column. Finished battles drop
+    out of the columns, so the work per pass shrinks as battles end.
+
+    Args:
+        warriors: Sequence of starting warriors, one per battle
+        brigands: Sequence of starting brigands, one per battle
+        rng: Random source (defaults to the module random)
+
+    Returns:
+        (warriors, brigands, won) lists, one entry per battle
+    """
+    rng = rng or random
+    warriors = list(warriors)
+    brigands = list(brigands)
+    index = [i for i in range(len(warriors)) if not is_battle_over(warriors[i], brigands[i])]
+    w_col = [warriors[i] for i in index]
+    b_col = [brigands[i] for i in index]
+
+    while index:
+        # One draw of 4 random bits per battle (a hex die), taken two to a byte
+        count = len(index)
+        packed = rng.getrandbits(8 * ((count + 1) // 2)).to_bytes((count + 1) // 2, "little")
+        rolls = [nibble for byte in packed for nibble in (byte & 15, byte >> 4)]
+        # Both sides still have fighters, so the winning faces need no clamping
+        won = [roll < -(-DIE_FACES * w // (w + b)) for roll, w, b in zip(rolls, w_col, b_col)]
+        w_col = [w if win else w - 1 for w, win in zip(w_col, won)]
+        b_col = [b // 2 if win else b for b, win in zip(b_col, won)]
+        going = [b > 0 and w > 1 for w, b in zip(w_col, b_col)]
+        if all(going):
+            continue
+        for i, w, b, on in zip(index, w_col, b_col, going):
+            if not on:
+                warriors[i] = w
+                brigands[i] = b
+        index = list(compress(index, going))
+        w_col = list(compress(w_col, going))
+        b_col = list(compress(b_col, going))
+
+    return warriors, brigands, [b <= 0 for b in brigands]
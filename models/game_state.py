@@ -0,0 +1,304 @@
+"""
+Cloneable Game State
+
+A UI-free copy of everything the rules need: players, the dragon's hoard,
+the Dark Tower's brigands and whose turn it is. There are no references to
+the controller, Tk or the state machine, so a clone only copies a few small
+slotted objects (O(players)).
+
+On top of the state sits an apply/undo API used by tree-search bots. Every
+action only touches the current player, the dragon and a few scalars, so
+apply() saves just those and undo() puts them back in O(1).
+
+Turn structure:
+    PHASE_ACTION  legal actions are MOVE, TOMB and Buy(item, count)
+    PHASE_BATTLE  legal actions are FIGHT and FLEE
+After an action resolves the current player eats and play passes to the next
+player still in the game. The round number goes up when play wraps around.
+
+Since the Dark Tower itself cannot be assaulted yet, a game ends after
+max_turns rounds or when every player is eliminated. The winner is the
+surviving player with the most warriors (then gold).
+"""
+
+import random
+from collections import namedtuple
+
+from models import battle, rules
+from models.outcome_tables import BATTLE, DRAGON, PLAGUE, TREASURE
+from models.rule_params import DEFAULT_RULES, RuleParams
+
+MOVE = "MOVE"
+TOMB = "TOMB"
+FIGHT = "FIGHT"
+FLEE = "FLEE"
+Buy = namedtuple("Buy", "item count")
+
+PHASE_ACTION = 0
+PHASE_BATTLE = 1
+
+# MOVE and TOMB results are looked up in the RuleParams outcome tables
+
+BUY_ACTIONS = (
+    Buy("warriors", 1), Buy("warriors", 5),
+    Buy("food", 5), Buy("food", 10),
+    Buy("beast", 1), Buy("scout", 1), Buy("healer", 1),
+)
+
+
+class PlayerState:
+    """Plain player stats, mirroring the fields of Player"""
+
+    __slots__ = (
+        "warriors", "gold", "food",
+        "bronze_key", "silver_key", "gold_key",
+        "dragon_sword", "beast", "healer", "scout", "pegasus",
+        "kingdom",
+    )
+
+    def __init__(self, warriors=10, gold=30, food=25, bronze_key=False, silver_key=False, gold_key=False,
+                 dragon_sword=False, beast=False, healer=False, scout=False, pegasus=False, kingdom=1):
+        self.warriors = warriors
+        self.gold = gold
+        self.food = food
+        self.bronze_key = bronze_key
+        self.silver_key = silver_key
+        self.gold_key = gold_key
+        self.dragon_sword = dragon_sword
+        self.beast = beast
+        self.healer = healer
+        self.scout = scout
+        self.pegasus = pegasus
+        self.kingdom = kingdom
+
+    @classmethod
+    def from_player(cls, player) -> "PlayerState":
+        """Snapshot a live Player (or anything with the same fields)"""
+        return cls(*(getattr(player, field) for field in cls.__slots__))
+
+    def copy(self) -> "PlayerState":
+        return PlayerState(
+            self.warriors, self.gold, self.food,
+            self.bronze_key, self.silver_key, self.gold_key,
+            self.dragon_sword, self.beast, self.healer, self.scout, self.pegasus,
+            self.kingdom,
+        )
+
+    def as_tuple(self) -> tuple:
+        return (
+            self.warriors, self.gold, self.food,
+            self.bronze_key, self.silver_key, self.gold_key,
+            self.dragon_sword, self.beast, self.healer, self.scout, self.pegasus,
+            self.kingdom,
+        )
+
+    @property
+    def is_eliminated(self) -> bool:
+        return rules.is_eliminated(self.warriors, self.food)
+
+
+class DragonState:
+    """The dragon's hoard"""
+
+    __slots__ = ("gold", "warriors")
+
+    def __init__(self, gold=0, warriors=0):
+        self.gold = gold
+        self.warriors = warriors
+
+    def copy(self) -> "DragonState":
+        return DragonState(self.gold, self.warriors)
+
+
+class GameState:
+    """
+    Complete UI-free game state.
+
+    Usage:
+        state = GameState.new_game(players=2)
+        rng = random.Random(1)
+        undo = state.apply(MOVE, rng)
+        state.undo(undo)
+        child = state.clone()
+    """
+
+    __slots__ = (
+        "players", "dragon", "dt_brigands",
+        "current", "turn", "phase", "brigands",
+        "max_turns", "params",
+    )
+
+    def __init__(self, players, dragon=None, dt_brigands=17, current=0, turn=1,
+                 phase=PHASE_ACTION, brigands=0, max_turns=30, params: RuleParams = DEFAULT_RULES):
+        self.players = players
+        self.dragon = dragon if dragon is not None else DragonState()
+        self.dt_brigands = dt_brigands
+        self.current = current
+        self.turn = turn
+        self.phase = phase
+        self.brigands = brigands
+        self.max_turns = max_turns
+        self.params = params
+
+    @classmethod
+    def new_game(cls, players: int = 1, rng: random.Random = None, max_turns: int = 30,
+                 params: RuleParams = DEFAULT_RULES) -> "GameState":
+        rng = rng or random
+        return cls(
+            players=[
+                PlayerState(warriors=params.starting_warriors, gold=params.starting_gold, food=params.starting_food)
+                for _ in range(players)
+            ],
+            dt_brigands=rng.randrange(battle.DIE_FACES) + params.tower_brigands,
+            max_turns=max_turns,
+            params=params,
+        )
+
+    @classmethod
+    def from_controller(cls, gc, max_turns: int = 30) -> "GameState":
+        """Snapshot a running GameController or HeadlessController"""
+        state = gc.state_machine.current_state
+        is_battling = getattr(state, "is_battling", False)
+        return cls(
+            players=[PlayerState.from_player(p) for p in gc.players],
+            dragon=DragonState(gc.dragon.gold, gc.dragon.warriors),
+            dt_brigands=gc.dt_brigands,
+            current=getattr(state, "player_number", 1) - 1,
+            turn=getattr(state, "turn_number", 1),
+            phase=PHASE_BATTLE if is_battling else PHASE_ACTION,
+            brigands=getattr(state, "brigands", 0),
+            max_turns=max_turns,
+            params=gc.rules,
+        )
+
+    def clone(self) -> "GameState":
+        return GameState(
+            [p.copy() for p in self.players],
+            self.dragon.copy(),
+            self.dt_brigands, self.current, self.turn, self.phase, self.brigands,
+            self.max_turns, self.params,
+        )
+
+    @property
+    def player(self) -> PlayerState:
+        return self.players[self.current]
+
+    def is_over(self) -> bool:
+        return self.turn > self.max_turns or all(p.is_eliminated for p in self.players)
+
+    def winner(self):
+        """Index of the winning player, or None if nobody survived"""
+        alive = [i for i, p in enumerate(self.players) if not p.is_eliminated]
+        if not alive:
+            return None
+        return max(alive, key=lambda i: (self.players[i].warriors, self.players[i].gold))
+
+    def legal_actions(self):
+        if self.is_over():
+            return []
+        if self.phase == PHASE_BATTLE:
+            return [FIGHT, FLEE]
+
+        player = self.player
+        actions = [MOVE, TOMB]
+        for action in BUY_ACTIONS:
+            if action.item in ("beast", "scout", "healer") and getattr(player, action.item):
+                continue
+            actions.append(action)
+        return actions
+
+    # Apply / undo
+
+    def apply(self, action, rng: random.Random):
+        """
+        Play one action for the current player.
+
+        Returns:
+            An undo token for undo()
+        """
+        token = (
+            self.current, self.player.copy(), self.dragon.copy(),
+            self.turn, self.phase, self.brigands,
+        )
+        roll = rng.randrange
+
+        if self.phase == PHASE_BATTLE:
+            self._battle_action(action, roll)
+        elif action == MOVE:
+            self._move(roll(battle.DIE_FACES), roll)
+        elif action == TOMB:
+            self._tomb(roll(battle.DIE_FACES), roll)
+        elif isinstance(action, Buy):
+            price = rules.bazaar_price(action.item, lambda zero_to: roll(zero_to + 1), self.params)
+            rules.buy(self.player, action.item, action.count, price)
+            self._end_turn()
+        else:
+            raise ValueError(f"Unknown action {action!r}")
+
+        return token
+
+    def undo(self, token):
+        current, player, dragon, turn, phase, brigands = token
+        self.current = current
+        self.players[current] = player
+        self.dragon = dragon
+        self.turn = turn
+        self.phase = phase
+        self.brigands = brigands
+
+    # Rules
+
+    def _move(self, result, roll):
+        outcome = self.params.move_table[result]
+        if outcome == DRAGON:
+            rules.dragon_attack(self.player, self.dragon)
+        elif outcome == PLAGUE:
+            rules.plague(self.player)
+        elif outcome == BATTLE:
+            self._start_battle(roll)
+            return
+        self._end_turn()
+
+    def _tomb(self, result, roll):
+        outcome = self.params.tomb_table[result]
+        if outcome == BATTLE:
+            self._start_battle(roll)
+            return
+        if outcome == TREASURE:
+            rules.award_treasure(self.player, roll(battle.DIE_FACES), roll(battle.DIE_FACES))
+        self._end_turn()
+
+    def _start_battle(self, roll):
+        self.brigands = battle.brigand_count(self.player.warriors, roll(battle.DIE_FACES))
+        if battle.is_battle_over(self.player.warriors, self.brigands):
+            self._end_turn()
+            return
+        self.phase = PHASE_BATTLE
+
+    def _battle_action(self, action, roll):
+        player = self.player
+        if action == FLEE:
+            player.warriors = battle.flee(player.warriors)
+        elif action == FIGHT:
+            player.warriors, self.brigands, _ = battle.resolve_round(player.warriors, self.brigands, roll(battle.DIE_FACES))
+            if not battle.is_battle_over(player.warriors, self.brigands):
+                return
+            if self.brigands <= 0:
+                rules.award_treasure(player, roll(battle.DIE_FACES), roll(battle.DIE_FACES))
+        else:
+            raise ValueError(f"Unknown battle action {action!r}")
+        self._end_turn()
+
+    def _end_turn(self):
+        rules.consume_food(self.player)
+        self.phase = PHASE_ACTION
+        self.brigands = 0
+
+        count = len(self.players)
+        for _ in range(count):
+            self.current += 1
+            if self.current == count:
+                self.current = 0
+                self.turn += 1
+            if not self.player.is_eliminated:
+                return
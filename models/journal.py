@@ -0,0 +1,159 @@
+"""
+Game Journal
+
+Undo/redo history kept as one (target, field, old, new) entry per attribute
+change instead of snapshots. Entries live in four preallocated lists used
+as a ring buffer, so a thousand-turn game never holds more than `capacity`
+entries; undo can only reach back as far as the ring still remembers.
+
+Objects that derive from Journaled (Player, Dragon, PlayerTurnState, the
+Bazaar) report every attribute change to gc.journal; the Dark Tower's
+brigands and the state machine's current state report through their
+setters. Undo and redo replay entries with setattr while recording is off,
+so the Zobrist hash follows along through the same setters.
+
+Checkpoints mark the positions undo/redo stop at. The controller takes one
+before every grid button press, so one undo takes back one press.
+
+Usage:
+    gc.state_machine.undo()
+    gc.state_machine.redo()
+"""
+
+from collections import deque
+
+# Old value of an attribute that did not exist yet
+MISSING = object()
+
+
+class Journaled:
+    """Mixin that reports attribute changes to self.gc.journal"""
+
+    def __setattr__(self, name, value):
+        gc = self.__dict__.get("gc")
+        journal = getattr(gc, "journal", None)
+        if journal is not None and journal.recording:
+            journal.record(self, name, self.__dict__.get(name, MISSING), value)
+        object.__setattr__(self, name, value)
+
+
+class Journal:
+    """
+    Ring buffer of attribute changes with checkpointed undo/redo.
+
+    Positions are absolute entry counts; position % capacity is the slot.
+
+    Args:
+        capacity: Most entries remembered
+        max_checkpoints: Most undo steps remembered
+    """
+
+    def __init__(self, capacity: int = 65536, max_checkpoints: int = 4096):
+        self.capacity = capacity
+        self.targets = [None] * capacity
+        self.fields = [None] * capacity
+        self.old_values = [None] * capacity
+        self.new_values = [None] * capacity
+        self.position = 0  # Next entry to write; entries before it are applied
+        self.top = 0  # One past the last entry that can be redone
+        self.checkpoints = deque(maxlen=max_checkpoints)
+        self.recording = True
+
+    def __len__(self):
+        """Entries currently remembered"""
+        return min(self.top, self.capacity)
+
+    @property
+    def oldest(self) -> int:
+        """Oldest position undo can still return to"""
+        return max(0, self.top - self.capacity)
+
+    def record(self, target, field, old, new):
+        if not self.recording or old is new:
+            return
+        if self.position != self.top:
+            # A new change after an undo discards what could be redone
+            self.top = self.position
+            while self.checkpoints and self.checkpoints[-1] > self.position:
+                self.checkpoints.pop()
+
+        slot = self.position % self.capacity
+        self.targets[slot] = target
+        self.fields[slot] = field
+        self.old_values[slot] = old
+        self.new_values[slot] = new
+        self.position += 1
+        self.top = self.position
+
+    def checkpoint(self):
+        """Mark the current position as an undo/redo stop"""
+        if not self.checkpoints or self.checkpoints[-1] != self.position:
+            self.checkpoints.append(self.position)
+
+    def can_undo(self) -> bool:
+        return self._undo_target() is not None
+
+    def can_redo(self) -> bool:
+        return self.top > self.position
+
+    def undo(self) -> bool:
+        """
+        Revert entries back to the previous checkpoint.
+
+        Returns:
+            False if there is nothing (still remembered) to undo
+        """
+        target = self._undo_target()
+        if target is None:
+            return False
+        self.recording = False
+        try:
+            for position in range(self.position - 1, target - 1, -1):
+                slot = position % self.capacity
+                self._apply(self.targets[slot], self.fields[slot], self.old_values[slot])
+        finally:
+            self.recording = True
+        self.position = target
+        return True
+
+    def redo(self) -> bool:
+        """
+        Reapply entries up to the next checkpoint (or all that were undone).
+
+        Returns:
+            False if there is nothing to redo
+        """
+        if self.top <= self.position:
+            return False
+        target = next((c for c in self.checkpoints if c > self.position), self.top)
+        self.recording = False
+        try:
+            for position in range(self.position, target):
+                slot = position % self.capacity
+                self._apply(self.targets[slot], self.fields[slot], self.new_values[slot])
+        finally:
+            self.recording = True
+        self.position = target
+        return True
+
+    def clear(self):
+        # Drop references so old objects can be collected, reusing the lists
+        used = len(self)
+        for values in (self.targets, self.old_values, self.new_values):
+            values[:used] = [None] * used
+        self.position = 0
+        self.top = 0
+        self.checkpoints.clear()
+
+    def _undo_target(self):
+        for checkpoint in reversed(self.checkpoints):
+            if checkpoint < self.position:
+                return checkpoint if checkpoint >= self.oldest else None
+        return None
+
+    @staticmethod
+    def _apply(target, field, value):
+        if value is MISSING:
+            target.__dict__.pop(field, None)
+        else:
+            setattr(target, field, value)
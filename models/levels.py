@@ -0,0 +1,43 @@
+"""
+Difficulty Levels
+
+Rule profiles for the three levels picked in LevelSelectState. Each level is
+a complete RuleParams (built and compiled once, at import), so choosing a
+level swaps one immutable object and the rules keep reading plain attributes.
+
+    LEVEL  TOWER   PRICES (warriors / items)  MOVE & TOMB           START FOOD
+    =====  =====   =========================  ====================  ==========
+    1      17-32   5-8 / 17-26                as in the original    25
+    2      33-48   6-9 / 20-29                more plague, battle   25
+    3      49-64   7-10 / 23-32               more of everything    20
+"""
+
+from models.rule_params import DEFAULT_RULES, RuleParams
+
+LEVELS = (1, 2, 3)
+
+LEVEL_RULES = {
+    1: DEFAULT_RULES,
+    2: DEFAULT_RULES.with_changes(
+        tower_brigands=33,
+        warrior_price_base=6,
+        item_price_base=20,
+        move_thresholds=(2, 4, 8, 11),
+    ),
+    3: DEFAULT_RULES.with_changes(
+        tower_brigands=49,
+        warrior_price_base=7,
+        item_price_base=23,
+        move_thresholds=(2, 5, 9, 12),
+        tomb_thresholds=(1, 10),
+        starting_food=20,
+    ),
+}
+
+
+def rules_for_level(level: int) -> RuleParams:
+    """The rule profile of a level (1-3)"""
+    try:
+        return LEVEL_RULES[level]
+    except KeyError:
+        raise ValueError(f"Level must be one of {LEVELS}, got {level}") from None
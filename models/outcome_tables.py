@@ -0,0 +1,54 @@
+"""
+Outcome Tables
+
+The MOVE, TOMB and TREASURE result tables as data. A table is declared as
+rows of (result, highest die face) in die order, each row covering the faces
+after the previous row's:
+
+    MOVE      lost, dragon, plague, battle, nothing   (ranges from RuleParams)
+    TOMB      close, battle, treasure                 (ranges from RuleParams)
+    TREASURE  see models/treasure.py
+
+compile_table turns the rows into a 16-entry tuple indexed by the hex roll,
+so looking up a result is a single index. RuleParams compiles its MOVE and
+TOMB tables once when it is created; the live PlayerTurnState, GameState,
+the expectimax chance nodes and TreasureBatch all read the same tuples.
+"""
+
+from models.battle import DIE_FACES
+from models.turn_record import OUTCOME_CODES
+
+LOST = OUTCOME_CODES["lost"]
+DRAGON = OUTCOME_CODES["dragon"]
+PLAGUE = OUTCOME_CODES["plague"]
+BATTLE = OUTCOME_CODES["battle"]
+NOTHING = OUTCOME_CODES["nothing"]
+CLOSE = OUTCOME_CODES["close"]
+TREASURE = OUTCOME_CODES["treasure"]
+
+MOVE_RESULTS = (LOST, DRAGON, PLAGUE, BATTLE, NOTHING)
+TOMB_RESULTS = (CLOSE, BATTLE, TREASURE)
+
+
+def move_rows(thresholds) -> tuple:
+    """Declarative MOVE table for RuleParams.move_thresholds"""
+    return tuple(zip(MOVE_RESULTS, tuple(thresholds) + (DIE_FACES - 1,), strict=True))
+
+
+def tomb_rows(thresholds) -> tuple:
+    """Declarative TOMB table for RuleParams.tomb_thresholds"""
+    return tuple(zip(TOMB_RESULTS, tuple(thresholds) + (DIE_FACES - 1,), strict=True))
+
+
+def compile_table(rows) -> tuple:
+    """
+    Expand (result, highest face) rows into a direct-index tuple.
+
+    A row whose highest face is not above the previous row's covers no faces.
+    """
+    table = []
+    for result, high in rows:
+        table.extend([result] * (high + 1 - len(table)))
+    if len(table) != DIE_FACES:
+        raise ValueError(f"Outcome table must cover faces 0-{DIE_FACES - 1}, got {rows}")
+    return tuple(table)
@@ -0,0 +1,65 @@
+"""
+Rule Parameters
+
+The balance numbers behind the MOVE and TOMB result tables and the Bazaar
+prices, kept as data so they can be tuned without editing the rules. The
+live game reads them from GameController.rules, headless engines from
+GameState.params.
+
+The MOVE and TOMB thresholds are compiled into 16-entry outcome tables
+(move_table, tomb_table) when a RuleParams is created, so every reader
+looks results up by die face.
+
+    MOVE   lost <= move_thresholds[0] < dragon <= [1] < plague <= [2] < battle <= [3] < nothing
+    TOMB   close <= tomb_thresholds[0] < battle <= [1] < treasure
+    PRICE  warriors: warrior_price_base + 0..warrior_price_spread-1
+           beast, scout, healer: item_price_base + 0..item_price_spread-1
+    START  starting_warriors, starting_gold, starting_food per player
+    TOWER  tower_brigands + 0..15 brigands guard the Dark Tower
+
+Difficulty levels are RuleParams profiles, see models/levels.py.
+"""
+
+from dataclasses import asdict, dataclass, replace
+
+from models.outcome_tables import compile_table, move_rows, tomb_rows
+
+
+@dataclass(frozen=True)
+class RuleParams:
+    move_thresholds: tuple = (2, 4, 7, 10)
+    tomb_thresholds: tuple = (1, 9)
+    food_price: int = 1
+    warrior_price_base: int = 5
+    warrior_price_spread: int = 4
+    item_price_base: int = 17
+    item_price_spread: int = 10
+    starting_warriors: int = 10
+    starting_gold: int = 30
+    starting_food: int = 25
+    tower_brigands: int = 17
+
+    def __post_init__(self):
+        for name, thresholds, count in (
+            ("move_thresholds", self.move_thresholds, 4),
+            ("tomb_thresholds", self.tomb_thresholds, 2),
+        ):
+            if len(thresholds) != count:
+                raise ValueError(f"{name} must have {count} values, got {thresholds}")
+            if list(thresholds) != sorted(thresholds) or not all(0 <= t <= 15 for t in thresholds):
+                raise ValueError(f"{name} must be ascending hex die values (0-15), got {thresholds}")
+        if self.warrior_price_spread < 1 or self.item_price_spread < 1:
+            raise ValueError("Price spreads must be at least 1")
+
+        # Compiled lookups, not fields: they follow from the thresholds
+        object.__setattr__(self, "move_table", compile_table(move_rows(self.move_thresholds)))
+        object.__setattr__(self, "tomb_table", compile_table(tomb_rows(self.tomb_thresholds)))
+
+    def with_changes(self, **changes) -> "RuleParams":
+        return replace(self, **changes)
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+DEFAULT_RULES = RuleParams()
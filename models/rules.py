@@ -0,0 +1,170 @@
+"""
+Game Rules
+
+Pure rule functions shared by the game states and headless engines.
+
+The functions work on any object with the right attributes, so the same
+rules drive the live Player and Dragon objects as well as the UI-free
+PlayerState and DragonState used for search and simulation. Nothing here
+displays anything; callers decide what to show.
+"""
+
+from models import treasure
+from models.rule_params import DEFAULT_RULES, RuleParams
+
+MAX_WARRIORS = 99
+
+BAZAAR_ITEMS = ("warriors", "food", "beast", "scout", "healer")
+
+
+def is_eliminated(warriors: int, food: int) -> bool:
+    """A player with no warriors left or no food left is out of the game"""
+    return warriors <= 0 or food <= 0
+
+
+def food_per_turn(warriors: int) -> int:
+    """Food eaten at the end of a turn: 1 per started 15 warriors, up to 7"""
+    if warriors <= 15:
+        return 1
+    return min(7, (warriors + 14) // 15)
+
+
+def consume_food(player):
+    player.food -= food_per_turn(player.warriors)
+
+
+def plague(player):
+    """A plague costs 2 warriors, or gains 2 with a healer"""
+    player.warriors += 2 if player.healer else -2
+    player.warriors = max(0, min(MAX_WARRIORS, player.warriors))
+
+
+def dragon_loss(value: int) -> int:
+    """
+    Amount of gold or warriors the dragon takes from value.
+
+    The 1s digit 0-3 takes 0, 4-6 takes 1, 7-8 takes 3. A 10s digit of 1
+    adds 2 and 2 adds 5. The 10s digit then takes 0, 10 or 30 the same
+    way the 1s digit did. Never more than value.
+    """
+    lost_value = 0
+    value_ones = value % 10
+    value_tens = (value // 10) % 10
+
+    if value_ones < 4:
+        lost_value += 0
+    elif value_ones < 7:
+        lost_value += 1
+    elif value_ones < 9:
+        lost_value += 3
+
+    if value_tens == 1:
+        lost_value += 2
+    elif value_tens == 2:
+        lost_value += 5
+
+    if value_tens < 4:
+        lost_value += 0
+    elif value_tens < 7:
+        lost_value += 10
+    elif value_tens < 9:
+        lost_value += 30
+
+    return min(lost_value, value)
+
+
+def dragon_attack(player, dragon) -> bool:
+    """
+    The dragon attacks. With the Dragon Sword the player takes the hoard,
+    otherwise the dragon adds part of the player's gold and warriors to it.
+
+    Returns:
+        True if the Dragon Sword was used
+    """
+    if player.dragon_sword:
+        player.warriors += dragon.warriors
+        dragon.warriors = 0
+        player.gold += dragon.gold
+        dragon.gold = 0
+        return True
+
+    lost_gold = dragon_loss(player.gold)
+    lost_warriors = dragon_loss(player.warriors)
+    player.gold -= lost_gold
+    player.warriors -= lost_warriors
+    dragon.gold += lost_gold
+    dragon.warriors += lost_warriors
+    return False
+
+
+def add_key(player):
+    """
+    Give the player the key hidden in their current kingdom, if they lack it.
+
+    Returns:
+        The key name ("bronze", "silver", "gold") or None
+    """
+    if player.kingdom == treasure.BRONZE_KEY_KINGDOM and not player.bronze_key:
+        player.bronze_key = True
+        return "bronze"
+    if player.kingdom == treasure.SILVER_KEY_KINGDOM and not player.silver_key:
+        player.silver_key = True
+        return "silver"
+    if player.kingdom == treasure.GOLD_KEY_KINGDOM and not player.gold_key:
+        player.gold_key = True
+        return "gold"
+    return None
+
+
+def award_treasure(player, gold_roll: int, item_roll: int) -> int:
+    """
+    Award one treasure without any display.
+
+    Returns:
+        The item code from models.treasure
+    """
+    player.gold += treasure.treasure_gold(gold_roll)
+    item = treasure.treasure_item(item_roll)
+    if item == treasure.ITEM_KEY:
+        add_key(player)
+    elif item == treasure.ITEM_PEGASUS:
+        player.pegasus = True
+    elif item == treasure.ITEM_SWORD:
+        player.dragon_sword = True
+    return item
+
+
+def bazaar_price(item: str, roll, params: RuleParams = DEFAULT_RULES) -> int:
+    """
+    Price of a bazaar item.
+
+    Args:
+        roll: Callable taking the highest face (like GameController.roll_dice)
+        params: Rule parameters holding the price ranges
+    """
+    if item == "food":
+        return params.food_price
+    if item == "warriors":
+        return roll(params.warrior_price_spread - 1) + params.warrior_price_base  # 5-8 by default
+    return roll(params.item_price_spread - 1) + params.item_price_base  # 17-26 by default
+
+
+def buy(player, item: str, count: int, price: int) -> bool:
+    """
+    Buy count of an item at price each.
+
+    Returns:
+        False if the player cannot afford it (the bazaar closes)
+    """
+    total_cost = count * price
+    if total_cost > player.gold:
+        return False
+
+    player.gold -= total_cost
+    if item == "warriors":
+        player.warriors = min(MAX_WARRIORS, player.warriors + count)
+    elif item == "food":
+        player.food += count
+    else:
+        setattr(player, item, True)
+    return True
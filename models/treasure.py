@@ -0,0 +1,112 @@
+"""
+Treasure Rules
+
+Pure treasure rules shared by PlayerTurnState.award_treasure and the batched
+resolver used by simulations.
+
+Treasure is two hex rolls: the first gives 13-20 gold, the second picks an
+item.
+
+    RESULT     HEX   DEC
+    =======    ===  =====
+    KEY*       0-9  00-09
+    PEGASUS     A     10
+    SWORD*      B     11
+    WIZARD**    C     12
+    GOLD ONLY  D-F  13-15
+
+A key is only awarded when the player is in the kingdom that hides it and
+does not already hold it.
+"""
+
+from models.outcome_tables import compile_table
+
+ITEM_KEY = 0
+ITEM_PEGASUS = 1
+ITEM_SWORD = 2
+ITEM_WIZARD = 3
+ITEM_GOLD_ONLY = 4
+
+TREASURE_ROWS = (
+    (ITEM_KEY, 9),
+    (ITEM_PEGASUS, 10),
+    (ITEM_SWORD, 11),
+    (ITEM_WIZARD, 12),
+    (ITEM_GOLD_ONLY, 15),
+)
+ITEM_BY_ROLL = compile_table(TREASURE_ROWS)
+
+# Kingdom that hides each key
+BRONZE_KEY_KINGDOM = 2
+SILVER_KEY_KINGDOM = 3
+GOLD_KEY_KINGDOM = 4
+
+
+def treasure_gold(roll: int) -> int:
+    """Gold found with a treasure (13-20)"""
+    return roll // 2 + 13
+
+
+def treasure_item(roll: int) -> int:
+    """Item code found with a treasure"""
+    return ITEM_BY_ROLL[roll]
+
+
+class TreasureBatch:
+    """
+    Column-wise treasure resolver for many players at once.
+
+    Each attribute is a list with one entry per player, so a whole batch is
+    resolved with integer list arithmetic instead of per-player method calls.
+
+    Usage:
+        batch = TreasureBatch.from_players(players)
+        batch.resolve(gold_rolls, item_rolls)
+        batch.apply_to(players)
+    """
+
+    def __init__(self, gold, kingdom, bronze_key, silver_key, gold_key, pegasus, dragon_sword):
+        self.gold = list(gold)
+        self.kingdom = list(kingdom)
+        self.bronze_key = [int(k) for k in bronze_key]
+        self.silver_key = [int(k) for k in silver_key]
+        self.gold_key = [int(k) for k in gold_key]
+        self.pegasus = [int(p) for p in pegasus]
+        self.dragon_sword = [int(s) for s in dragon_sword]
+        self.wizard = [0] * len(self.gold)
+
+    @classmethod
+    def from_players(cls, players) -> "TreasureBatch":
+        return cls(
+            gold=[p.gold for p in players],
+            kingdom=[p.kingdom for p in players],
+            bronze_key=[p.bronze_key for p in players],
+            silver_key=[p.silver_key for p in players],
+            gold_key=[p.gold_key for p in players],
+            pegasus=[p.pegasus for p in players],
+            dragon_sword=[p.dragon_sword for p in players],
+        )
+
+    def resolve(self, gold_rolls, item_rolls):
+        """Award one treasure to every player in the batch"""
+        items = [ITEM_BY_ROLL[r] for r in item_rolls]
+        is_key = [int(i == ITEM_KEY) for i in items]
+
+        self.gold = [g + r // 2 + 13 for g, r in zip(self.gold, gold_rolls)]
+        self.bronze_key = [h | (k & (m == BRONZE_KEY_KINGDOM)) for h, k, m in zip(self.bronze_key, is_key, self.kingdom)]
+        self.silver_key = [h | (k & (m == SILVER_KEY_KINGDOM)) for h, k, m in zip(self.silver_key, is_key, self.kingdom)]
+        self.gold_key = [h | (k & (m == GOLD_KEY_KINGDOM)) for h, k, m in zip(self.gold_key, is_key, self.kingdom)]
+        self.pegasus = [h | (i == ITEM_PEGASUS) for h, i in zip(self.pegasus, items)]
+        self.dragon_sword = [h | (i == ITEM_SWORD) for h, i in zip(self.dragon_sword, items)]
+        self.wizard = [h | (i == ITEM_WIZARD) for h, i in zip(self.wizard, items)]
+        return self
+
+    def apply_to(self, players):
+        """Write the batch results back onto Player objects"""
+        for idx, p in enumerate(players):
+            p.gold = self.gold[idx]
+            p.bronze_key = bool(self.bronze_key[idx])
+            p.silver_key = bool(self.silver_key[idx])
+            p.gold_key = bool(self.gold_key[idx])
+            p.pegasus = bool(self.pegasus[idx])
+            p.dragon_sword = bool(self.dragon_sword[idx])
@@ -0,0 +1,36 @@
+"""
+Turn Records
+
+Small integer codes for the action a player took on their turn and how it
+turned out. PlayerTurnState reports every finished turn to the controller's
+turn observers as plain ints so recorders never need per-row objects.
+
+Observer interface:
+    record_turn(player_number, turn_number, action, roll, outcome,
+                gold, warriors, food, dragon_gold, dragon_warriors)
+"""
+
+NO_ROLL = -1
+
+ACTIONS = ("none", "move", "tomb", "bazaar")
+OUTCOMES = (
+    "none",
+    # MOVE
+    "lost", "dragon", "plague", "battle", "nothing",
+    # TOMB
+    "close", "treasure",
+    # BAZAAR
+    "purchase", "closed",
+    # Battles
+    "won", "defeated", "fled",
+)
+
+ACTION_CODES = {name: code for code, name in enumerate(ACTIONS)}
+OUTCOME_CODES = {name: code for code, name in enumerate(OUTCOMES)}
+
+ACTION_NONE = ACTION_CODES["none"]
+ACTION_MOVE = ACTION_CODES["move"]
+ACTION_TOMB = ACTION_CODES["tomb"]
+ACTION_BAZAAR = ACTION_CODES["bazaar"]
+
+OUTCOME_NONE = OUTCOME_CODES["none"]
@@ -0,0 +1,107 @@
+"""
+Zobrist Hashing
+
+A 64-bit hash of the whole game (every Player field, the dragon's hoard,
+the Dark Tower's brigands and the current state) that is kept up to date
+incrementally. Each (owner, field, value) triple maps to a fixed random
+64-bit key and the hash is the XOR of the keys for the current values, so
+changing one field costs two XORs.
+
+Player and Dragon report their own field changes from __setattr__, so every
+mutation site (consume_food, get_plagued, dragon_attack, add_key, bazaar
+purchases, battles, treasure) is covered in O(1). The state machine reports
+state changes. The full recompute cross-check in verify() runs after every
+turn only when the controller's VERIFY_HASH is set, as the scenario runner
+and the input stress and soak harnesses do.
+
+Keys come from a keyed BLAKE2 digest of the triple, so they are the same in
+every process and run, and hashes can be compared across workers.
+"""
+
+import hashlib
+from functools import lru_cache
+
+PLAYER_FIELDS = (
+    "warriors", "gold", "food",
+    "bronze_key", "silver_key", "gold_key",
+    "dragon_sword", "beast", "healer", "scout", "pegasus",
+    "kingdom",
+)
+DRAGON_FIELDS = ("gold", "warriors")
+
+
+@lru_cache(maxsize=65536)
+def zobrist_key(owner, field, value) -> int:
+    """Fixed random 64-bit key for one (owner, field, value) triple"""
+    digest = hashlib.blake2b(repr((owner, field, value)).encode(), digest_size=8, key=b"darktower").digest()
+    return int.from_bytes(digest, "little")
+
+
+def player_owner(player_number: int) -> str:
+    return f"player{player_number}"
+
+
+def state_value(name, kwargs):
+    """The part of the current state that goes into the hash: its name and enter() arguments"""
+    if name is None:
+        return None
+    return (name, tuple(sorted(kwargs.items())))
+
+
+class ZobristHash:
+    """Incrementally maintained Zobrist hash of a game controller"""
+
+    def __init__(self):
+        self.value = 0
+
+    def update(self, owner, field, old, new):
+        """Swap one field's old value for its new one"""
+        if old != new:
+            self.value ^= zobrist_key(owner, field, old) ^ zobrist_key(owner, field, new)
+
+    def add(self, owner, field, value):
+        """Add a field that was not hashed before"""
+        self.value ^= zobrist_key(owner, field, value)
+
+    def remove(self, owner, field, value):
+        self.value ^= zobrist_key(owner, field, value)
+
+    def rebuild(self, gc):
+        """Recompute from scratch, e.g. after the player list is replaced"""
+        self.value = full_hash(gc)
+
+    def verify(self, gc) -> bool:
+        """True if the incremental hash matches a full recompute"""
+        return self.value == full_hash(gc)
+
+
+def full_hash(gc) -> int:
+    """Hash a controller from scratch"""
+    value = 0
+    for player in gc.players:
+        owner = player_owner(player.player_number)
+        for field in PLAYER_FIELDS:
+            value ^= zobrist_key(owner, field, getattr(player, field))
+    for field in DRAGON_FIELDS:
+        value ^= zobrist_key("dragon", field, getattr(gc.dragon, field))
+    value ^= zobrist_key("tower", "dt_brigands", gc.dt_brigands)
+    state_machine = getattr(gc, "state_machine", None)
+    if state_machine is not None:
+        value ^= zobrist_key("game", "state", state_value(state_machine.current_state_name, state_machine.current_state_kwargs))
+    else:
+        value ^= zobrist_key("game", "state", None)
+    return value
+
+
+def hash_game_state(state) -> int:
+    """Hash a models.game_state.GameState with the same keys as the live game"""
+    value = 0
+    for idx, player in enumerate(state.players):
+        owner = player_owner(idx + 1)
+        for field in PLAYER_FIELDS:
+            value ^= zobrist_key(owner, field, getattr(player, field))
+    for field in DRAGON_FIELDS:
+        value ^= zobrist_key("dragon", field, getattr(state.dragon, field))
+    value ^= zobrist_key("tower", "dt_brigands", state.dt_brigands)
+    value ^= zobrist_key("game", "state", state_value("player_turn", {"player_number": state.current + 1, "turn_number": state.turn}))
+    return value
@@ -0,0 +1,13 @@
+"""
+Scenarios Package
+
+Scripted game runs for the Game Master and for regression testing.
+"""
+
+from scenarios.scenario import Scenario, ScenarioError, TurnEntry
+from scenarios.runner import ScenarioRunner, run_headless, run_scenario_file, run_corpus
+
+__all__ = [
+    'Scenario', 'ScenarioError', 'TurnEntry',
+    'ScenarioRunner', 'run_headless', 'run_scenario_file', 'run_corpus',
+]
@@ -0,0 +1,40 @@
+"""
+Run a scenario corpus from the command line.
+
+Usage:
+    python -m scenarios scenarios/examples
+    python -m scenarios path/to/corpus -j 8
+"""
+
+import argparse
+import sys
+import time
+
+from scenarios.runner import find_scenario_files, run_corpus
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run Dark Tower scenario files headless")
+    parser.add_argument("paths", nargs="+", help="Scenario files or directories")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    files = find_scenario_files(args.paths)
+    start = time.perf_counter()
+    results = run_corpus(files, workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    failed = [r for r in results if not r["passed"]]
+    for result in failed:
+        print(f"FAIL {result['name']}")
+        if result["error"]:
+            print(f"    {result['error']}")
+        for failure in result["failures"]:
+            print(f"    {failure}")
+
+    print(f"{len(results) - len(failed)}/{len(results)} scenarios passed in {elapsed:.2f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
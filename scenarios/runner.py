@@ -0,0 +1,219 @@
+"""
+Scenario Runner
+
+Plays a Scenario against a game controller one step at a time through the
+controller's scheduler. Against a HeadlessController with a VirtualScheduler
+a scenario finishes at CPU speed; against the live GameController the same
+steps are paced on the Tk event loop so the Game Master can watch.
+"""
+
+import contextlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+from scenarios.scenario import Scenario, ScenarioError, TurnEntry
+
+if TYPE_CHECKING:
+    from game import GameController
+
+# How often to look again while a reveal or queued press is still running
+WAIT_POLL_MS = 50
+
+
+class ScenarioRunner:
+    """
+    Executes a scenario's setup presses and turn entries in order.
+
+    Usage:
+        runner = ScenarioRunner(gc, scenario, step_delay=1000)
+        runner.start()
+    """
+
+    def __init__(self, gc: "GameController", scenario: Scenario, step_delay: int = 0, on_complete=None):
+        self.gc: "GameController" = gc
+        self.scenario = scenario
+        self.step_delay = step_delay
+        self.on_complete = on_complete
+        self.actions = []
+        self.index = 0
+        self.done = False
+        self.error = None
+        self.failures = []
+
+    def start(self):
+        """Build the action list and schedule the first step"""
+        self.actions = [("press", text) for text in self.scenario.setup_buttons()]
+        for entry in self.scenario.turns:
+            self.actions.append(("turn", entry))
+            self.actions.extend(("press", text) for text in entry.buttons)
+        self.index = 0
+        self.gc.scheduler.after(0, self._next_step)
+
+    def _next_step(self):
+        """Run one action, then schedule the next once it has fully finished"""
+        # Drum reveals are paced scripts and presses may still be queued:
+        # let them finish so every action and check sees the settled game
+        if self.gc.driver.busy or self.gc.input_queue.pending:
+            self.gc.scheduler.after(WAIT_POLL_MS, self._next_step)
+            return
+
+        if self.index >= len(self.actions):
+            self._finish()
+            return
+
+        kind, payload = self.actions[self.index]
+        try:
+            if kind == "turn":
+                self._begin_turn(payload)
+            else:
+                self._press(payload)
+        except ScenarioError as e:
+            self.error = str(e)
+            self._finish()
+            return
+
+        self.index += 1
+        self.gc.scheduler.after(self.step_delay, self._next_step)
+
+    def _begin_turn(self, entry: TurnEntry):
+        """Check we are on the expected turn and queue its forced events"""
+        state = self.gc.state_machine.current_state
+        current = (getattr(state, "player_number", None), getattr(state, "turn_number", None))
+        if self.gc.state_machine.current_state_name != "player_turn" or current != entry.key:
+            raise ScenarioError(
+                f"Expected player {entry.player} turn {entry.turn}, "
+                f"but game is at {self.gc.state_machine.current_state_name} {current}"
+            )
+        for move in entry.force_moves:
+            self.gc.force_move(move)
+        for roll in entry.force_rolls:
+            self.gc.force_die_roll(roll)
+
+    def _press(self, text):
+        """Press a grid button"""
+        self.gc.press(text)
+
+    def _finish(self):
+        self.done = True
+        if self.error is None:
+            self.failures = check_expectations(self.gc, self.scenario.expect)
+        if self.on_complete:
+            self.on_complete(self)
+
+    @property
+    def passed(self) -> bool:
+        return self.done and self.error is None and not self.failures
+
+
+def check_expectations(gc: "GameController", expect: dict):
+    """
+    Compare the game against a scenario's expect block.
+
+    Returns:
+        A list of human-readable failure strings (empty if everything matched)
+    """
+    failures = []
+
+    for number, fields in expect.get("players", {}).items():
+        index = int(number) - 1
+        if not 0 <= index < len(gc.players):
+            failures.append(f"Player {number} does not exist")
+            continue
+        for field, expected in fields.items():
+            actual = getattr(gc.players[index], field, None)
+            if actual != expected:
+                failures.append(f"Player {number} {field}: expected {expected}, got {actual}")
+
+    for field, expected in expect.get("dragon", {}).items():
+        actual = getattr(gc.dragon, field, None)
+        if actual != expected:
+            failures.append(f"Dragon {field}: expected {expected}, got {actual}")
+
+    if "dt_brigands" in expect and gc.dt_brigands != expect["dt_brigands"]:
+        failures.append(f"dt_brigands: expected {expect['dt_brigands']}, got {gc.dt_brigands}")
+
+    if "state" in expect and gc.state_machine.current_state_name != expect["state"]:
+        failures.append(f"State: expected {expect['state']}, got {gc.state_machine.current_state_name}")
+
+    state = gc.state_machine.current_state
+    for field, attr in (("player", "player_number"), ("turn", "turn_number")):
+        if field in expect and getattr(state, attr, None) != expect[field]:
+            failures.append(f"{field}: expected {expect[field]}, got {getattr(state, attr, None)}")
+
+    return failures
+
+
+def run_headless(scenario: Scenario) -> dict:
+    """
+    Run a scenario on a fresh HeadlessController at full speed.
+
+    Returns:
+        A result dict with name, passed, error, failures and virtual_ms
+    """
+    # Imported here so worker processes only pay for it when they run
+    from headless import HeadlessController
+
+    gc = HeadlessController(seed=scenario.seed)
+    gc.VERIFY_HASH = True
+    runner = ScenarioRunner(gc, scenario)
+    runner.start()
+    gc.run()
+
+    return {
+        "name": scenario.name,
+        "passed": runner.passed,
+        "error": runner.error,
+        "failures": runner.failures,
+        "virtual_ms": gc.scheduler.now(),
+    }
+
+
+def run_scenario_file(path, quiet: bool = True) -> dict:
+    """Load and run one scenario file, turning crashes into failed results"""
+    output = io.StringIO() if quiet else None
+    with contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext():
+        try:
+            return run_headless(Scenario.load(path))
+        except Exception as e:
+            return {
+                "name": str(path),
+                "passed": False,
+                "error": f"{type(e).__name__}: {e}",
+                "failures": [],
+                "virtual_ms": 0,
+            }
+
+
+def find_scenario_files(paths):
+    """Expand files and directories into a sorted list of .json scenario files"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, _, filenames in os.walk(path):
+                files.extend(os.path.join(dirpath, name) for name in filenames if name.endswith(".json"))
+        else:
+            files.append(path)
+    return sorted(files)
+
+
+def run_corpus(paths, workers: int = None):
+    """
+    Run many scenario files in parallel worker processes.
+
+    Args:
+        paths: Scenario files and/or directories containing them
+        workers: Number of processes (defaults to the CPU count)
+
+    Returns:
+        A list of result dicts in the same order as the expanded file list
+    """
+    files = find_scenario_files(paths)
+    if workers == 1 or len(files) <= 1:
+        return [run_scenario_file(path) for path in files]
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_scenario_file, files, chunksize=chunksize))
@@ -0,0 +1,116 @@
+"""
+Scenario Files
+
+A scenario is a JSON file that scripts a whole game: the level and player
+count to select, then a list of turn entries keyed by player and turn. Each
+entry queues forced moves and forced die rolls and lists the buttons to press.
+An optional "expect" block is checked once the script has finished.
+
+Example:
+    {
+        "name": "dragon on first move",
+        "seed": 42,
+        "level": 1,
+        "players": 2,
+        "turns": [
+            {"player": 1, "turn": 1, "force_moves": ["dragon"], "buttons": ["MOVE", "NO"]},
+            {"player": 2, "turn": 1, "force_rolls": [12], "buttons": ["TOMB", "NO"]}
+        ],
+        "expect": {
+            "players": {"1": {"gold": 27, "warriors": 10}},
+            "dragon": {"gold": 3},
+            "state": "player_turn",
+            "player": 1,
+            "turn": 2
+        }
+    }
+"""
+
+import json
+
+FORCED_MOVES = ("lost", "dragon", "plague", "battle", "nothing")
+
+
+class ScenarioError(Exception):
+    """Raised when a scenario file is malformed or does not match the game"""
+
+
+class TurnEntry:
+    """The scripted events for one player's turn"""
+
+    def __init__(self, player: int, turn: int, force_moves=(), force_rolls=(), buttons=()):
+        self.player = player
+        self.turn = turn
+        self.force_moves = list(force_moves)
+        self.force_rolls = list(force_rolls)
+        self.buttons = list(buttons)
+
+    @property
+    def key(self):
+        return (self.player, self.turn)
+
+
+class Scenario:
+    """A parsed scenario file"""
+
+    def __init__(self, name: str, seed=None, level: int = 1, players: int = 1, turns=(), expect=None):
+        self.name = name
+        self.seed = seed
+        self.level = level
+        self.players = players
+        self.turns = list(turns)
+        self.expect = expect or {}
+
+    @classmethod
+    def from_dict(cls, data: dict, name: str = "scenario") -> "Scenario":
+        """Build a scenario from decoded JSON, validating as we go"""
+        level = data.get("level", 1)
+        players = data.get("players", 1)
+        if level not in (1, 2, 3):
+            raise ScenarioError(f"{name}: level must be 1-3, got {level}")
+        if not 1 <= players <= 4:
+            raise ScenarioError(f"{name}: players must be 1-4, got {players}")
+
+        turns = []
+        for entry in data.get("turns", []):
+            try:
+                turn = TurnEntry(
+                    player=entry["player"],
+                    turn=entry["turn"],
+                    force_moves=entry.get("force_moves", []),
+                    force_rolls=entry.get("force_rolls", []),
+                    buttons=entry.get("buttons", []),
+                )
+            except KeyError as e:
+                raise ScenarioError(f"{name}: turn entry missing {e}") from e
+
+            for move in turn.force_moves:
+                if move not in FORCED_MOVES:
+                    raise ScenarioError(f"{name}: unknown forced move '{move}'")
+            for roll in turn.force_rolls:
+                if not 0 <= roll <= 15:
+                    raise ScenarioError(f"{name}: forced roll {roll} is not a hex die value")
+            turns.append(turn)
+
+        return cls(
+            name=data.get("name", name),
+            seed=data.get("seed"),
+            level=level,
+            players=players,
+            turns=turns,
+            expect=data.get("expect"),
+        )
+
+    @classmethod
+    def load(cls, path) -> "Scenario":
+        """Load a scenario from a JSON file"""
+        with open(path) as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ScenarioError(f"{path}: {e}") from e
+        return cls.from_dict(data, name=str(path))
+
+    def setup_buttons(self):
+        """Buttons that select the level and player count from a fresh game"""
+        return ["NO"] * (self.level - 1) + ["YES"] + ["NO"] * (self.players - 1) + ["YES"]
@@ -0,0 +1,117 @@
+"""
+Scheduler - Timing abstraction for delayed callbacks
+
+Game code schedules work through a scheduler instead of calling Tk directly.
+TkScheduler runs in real time on the Tk event loop, VirtualScheduler keeps a
+virtual clock and jumps straight to the next due callback so scripted runs
+finish at CPU speed with the same event ordering as a live session.
+"""
+
+import heapq
+import itertools
+import time
+
+
+class Scheduler:
+    """
+    Base class for schedulers.
+
+    Times are in milliseconds, matching Tk's after() API.
+    """
+
+    def now(self) -> float:
+        """Return the current time in milliseconds"""
+        raise NotImplementedError
+
+    def after(self, delay_ms: int, callback, *args):
+        """
+        Schedule callback(*args) to run after delay_ms milliseconds.
+
+        Returns:
+            An id that can be passed to cancel()
+        """
+        raise NotImplementedError
+
+    def cancel(self, after_id):
+        """Cancel a callback scheduled with after()"""
+        raise NotImplementedError
+
+
+class TkScheduler(Scheduler):
+    """Real-time scheduler backed by the Tk event loop"""
+
+    def __init__(self, root):
+        self.root = root
+
+    def now(self) -> float:
+        return time.monotonic() * 1000
+
+    def after(self, delay_ms: int, callback, *args):
+        return self.root.after(delay_ms, callback, *args)
+
+    def cancel(self, after_id):
+        self.root.after_cancel(after_id)
+
+
+class VirtualScheduler(Scheduler):
+    """
+    Virtual-time scheduler.
+
+    Callbacks are kept in a heap ordered by (due time, insertion order), the
+    same ordering Tk uses for timers. Nothing ever sleeps: the clock jumps
+    directly to the next due callback.
+    """
+
+    def __init__(self, start_ms: float = 0):
+        self._now = start_ms
+        self._queue = []
+        self._counter = itertools.count()
+        self._cancelled = set()
+        self._live = set()  # Ids queued and neither run nor cancelled
+
+    def now(self) -> float:
+        return self._now
+
+    def after(self, delay_ms: int, callback, *args):
+        after_id = next(self._counter)
+        heapq.heappush(self._queue, (self._now + max(0, delay_ms), after_id, callback, args))
+        self._live.add(after_id)
+        return after_id
+
+    def cancel(self, after_id):
+        # Ids that already ran or were cancelled are ignored, as Tk does
+        if after_id in self._live:
+            self._live.discard(after_id)
+            self._cancelled.add(after_id)
+
+    def pending(self) -> int:
+        """Return the number of callbacks still queued"""
+        return len(self._live)
+
+    def step(self) -> bool:
+        """
+        Advance the clock to the next due callback and run it.
+
+        Returns:
+            False if there was nothing left to run
+        """
+        while self._queue:
+            due, after_id, callback, args = heapq.heappop(self._queue)
+            if after_id in self._cancelled:
+                self._cancelled.discard(after_id)
+                continue
+            self._live.discard(after_id)
+            self._now = max(self._now, due)
+            callback(*args)
+            return True
+        return False
+
+    def run(self, until_ms: float = None):
+        """
+        Run queued callbacks until the queue is empty, or until the next
+        callback would be due after until_ms.
+        """
+        while self._queue and (until_ms is None or self._queue[0][0] <= until_ms):
+            self.step()
+        if until_ms is not None:
+            self._now = max(self._now, until_ms)
@@ -0,0 +1,106 @@
+"""
+Script Driver - Multi-step sequences without nested event loops
+
+A dragon attack shows the dragon, then the player's gold, then their
+warriors, each for over a second. Rather than block inside the button
+handler, multi-step actions are generators: each `yield` is a pause in
+milliseconds, and the driver resumes the generator once the pause is over.
+
+    def dragon_attack(self):
+        ...
+        yield from self.gc.drum.display(self.player_number, "dragon")
+        yield from self.gc.drum.display(self.player_number, "gold", self.gold)
+
+Paced (the GUI), each pause is waited out with scheduler.after and the
+stack unwinds back to the event loop in between. The input queue is held
+until the script finishes, so the next press sees the finished action.
+Unpaced (headless), pauses are skipped and play() returns once the script
+has run to the end, so the same code runs at CPU speed.
+
+Usage:
+    gc.driver.play(player.display("gold"))
+"""
+
+from collections import deque
+
+from scheduler import Scheduler
+
+
+class ScriptDriver:
+    """
+    Runs step scripts one at a time.
+
+    Args:
+        scheduler: Scheduler pauses are waited out on
+        paced: Wait out each pause; False runs scripts straight through
+        input_queue: InputQueue held while a paced script is paused
+    """
+
+    def __init__(self, scheduler: Scheduler, paced: bool = True, input_queue=None):
+        self.scheduler = scheduler
+        self.paced = paced
+        self.input_queue = input_queue
+        self.scripts = deque()
+        self.current = None
+        self.resume_id = None
+
+        # Counters for the GM window and stress runs
+        self.steps = 0
+        self.completed = 0
+
+    @property
+    def busy(self) -> bool:
+        """True while a script is running or waiting to run"""
+        return self.current is not None or bool(self.scripts)
+
+    def play(self, script):
+        """Run a script (a generator of pauses), after any script already running"""
+        if script is None:
+            return
+        self.scripts.append(script)
+        if self.current is None and self.resume_id is None:
+            self._run()
+
+    def cancel(self):
+        """Drop the running script and every script waiting to run"""
+        if self.resume_id is not None:
+            self.scheduler.cancel(self.resume_id)
+            self.resume_id = None
+        if self.current is not None:
+            self.current.close()
+            self.current = None
+        for script in self.scripts:
+            script.close()
+        self.scripts.clear()
+        self._release()
+
+    def _run(self):
+        self.resume_id = None
+        while True:
+            if self.current is None:
+                if not self.scripts:
+                    self._release()
+                    return
+                self.current = self.scripts.popleft()
+            try:
+                delay = next(self.current)
+            except StopIteration:
+                self.current = None
+                self.completed += 1
+                continue
+            except BaseException:
+                # A broken script must not leave the input queue held
+                self.current = None
+                self.scripts.clear()
+                self._release()
+                raise
+            self.steps += 1
+            if self.paced and delay:
+                if self.input_queue is not None:
+                    self.input_queue.hold()
+                self.resume_id = self.scheduler.after(delay, self._run)
+                return
+
+    def _release(self):
+        if self.input_queue is not None:
+            self.input_queue.release()
@@ -0,0 +1,5 @@
+"""
+Simulation Package
+
+Tools for running, recording and analysing games in bulk.
+"""
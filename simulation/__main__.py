@@ -0,0 +1,74 @@
+"""
+Run headless simulations from the command line. No display is needed.
+
+Prints aggregate results as JSON on stdout and throughput on stderr.
+
+Usage:
+    python -m simulation --games 10000
+    python -m simulation --games 50000 --players 2 --level 3 --seed 7 --policy random -j 8
+    python -m simulation --games 100000 --db runs.db
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from bots.policies import POLICIES
+from models.levels import LEVELS
+from simulation.batch import run_games
+from simulation.results import ResultsWriter
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate Dark Tower games headless")
+    parser.add_argument("-n", "--games", type=int, default=1000, help="Number of games")
+    parser.add_argument("-p", "--players", type=int, choices=range(1, 5), default=1, metavar="1-4")
+    parser.add_argument("--level", type=int, choices=LEVELS, default=1)
+    parser.add_argument("--seed", type=int, default=0, help="Game i uses seed + i")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="greedy", help="Policy for every seat")
+    parser.add_argument("--max-turns", type=int, default=30, help="Round limit of each game")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("-o", "--output", default=None, help="Write the JSON to this file instead of stdout")
+    parser.add_argument("--db", default=None, help="Also store every game and turn in this SQLite database")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    writer = ResultsWriter(args.db) if args.db else None
+    try:
+        result = run_games(
+            args.games, players=args.players, level=args.level, seed=args.seed,
+            policy=args.policy, max_turns=args.max_turns, workers=args.workers, writer=writer,
+        )
+    finally:
+        if writer is not None:
+            writer.close()
+    elapsed = time.perf_counter() - start
+
+    report = {
+        "config": {
+            "games": args.games, "players": args.players, "level": args.level, "seed": args.seed,
+            "policy": args.policy, "max_turns": args.max_turns, "workers": args.workers,
+        },
+        "elapsed_s": elapsed,
+        "games_per_s": result.games / elapsed if elapsed else 0.0,
+        "actions_per_s": result.actions / elapsed if elapsed else 0.0,
+        "results": result.summary(),
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    print(f"{result.games} games, {result.actions} actions in {elapsed:.2f}s "
+          f"({report['games_per_s']:.0f} games/s, {report['actions_per_s']:.0f} actions/s)", file=sys.stderr)
+    if writer is not None:
+        print(f"Stored {writer.games} games, {writer.turns} turns in {writer.transactions} transactions "
+              f"({writer.turns / elapsed * 3600:.0f} turn rows/hour)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+"""
+Batch Simulation
+
+Plays many complete headless games (GameState with a policy for every seat)
+across worker processes and aggregates the results into a JSON-friendly
+summary: wins per seat, games nobody survived, game length and the final
+gold, warriors and food of every player.
+
+Game i is played with seed + i, so a run is reproducible for a given seed
+whatever the worker count.
+
+Given a ResultsWriter (simulation/results.py), the workers also send back
+every game's summary and turn rows, and the writer stores them in SQLite
+while the workers keep playing.
+
+Usage:
+    result = run_games(10_000, players=2, level=2, seed=1, workers=8)
+    print(result.summary())
+
+    with ResultsWriter("runs.db") as writer:
+        run_games(100_000, policy="random", writer=writer)
+"""
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from bots.policies import POLICIES
+from models import battle
+from models.game_state import FIGHT, FLEE, MOVE, PHASE_BATTLE, Buy, GameState
+from models.levels import rules_for_level
+from models.outcome_tables import BATTLE
+from models.rule_params import RuleParams
+from models.turn_record import ACTION_CODES, NO_ROLL, OUTCOME_CODES
+from simulation.stats import Metric
+
+# Games per job when storing results, so each job's rows stay small
+STORE_CHUNK_GAMES = 500
+
+
+def play_to_end(params: RuleParams, seed, players: int = 1, max_turns: int = 30, policy: str = "greedy"):
+    """
+    Play one headless game to the end.
+
+    Returns:
+        (final GameState, number of actions taken)
+    """
+    rng = random.Random(seed)
+    choose = POLICIES[policy]
+    state = GameState.new_game(players, rng, max_turns=max_turns, params=params)
+    actions = 0
+    while not state.is_over():
+        state.apply(choose(state, rng), rng)
+        actions += 1
+    return state, actions
+
+
+class RollLog(random.Random):
+    """Random that remembers its randrange results, so a turn's dice can be read back"""
+
+    def __init__(self, seed=None):
+        self.rolls = []
+        super().__init__(seed)
+
+    def randrange(self, *args):
+        value = super().randrange(*args)
+        self.rolls.append(value)
+        return value
+
+
+def play_recorded(params: RuleParams, seed, players: int = 1, max_turns: int = 30, policy: str = "greedy"):
+    """
+    Play one headless game to the end, keeping a row per finished turn.
+
+    The game is the one play_to_end plays for the same seed. GameState does
+    not report what happened, so each turn's roll and outcome are read back
+    from the dice through the same outcome tables it uses.
+
+    Returns:
+        (final GameState, number of actions taken, turn rows) where a row is
+        (player, turn, action, roll, outcome, gold, warriors, food,
+        dragon gold, dragon warriors), codes as in models.turn_record
+    """
+    rng = RollLog(seed)
+    choose = POLICIES[policy]
+    state = GameState.new_game(players, rng, max_turns=max_turns, params=params)
+    rows = []
+    actions = 0
+    turn_action = turn_roll = None
+    while not state.is_over():
+        seat, turn, phase = state.current, state.turn, state.phase
+        warriors, brigands = state.player.warriors, state.brigands
+        action = choose(state, rng)
+        rolls = rng.rolls
+        rolls.clear()
+        state.apply(action, rng)
+        actions += 1
+
+        if phase != PHASE_BATTLE:
+            if isinstance(action, Buy):
+                turn_action, turn_roll, outcome = ACTION_CODES["bazaar"], NO_ROLL, OUTCOME_CODES["purchase"]
+            else:
+                turn_action = ACTION_CODES["move"] if action == MOVE else ACTION_CODES["tomb"]
+                turn_roll = rolls[0]
+                table = params.move_table if action == MOVE else params.tomb_table
+                outcome = table[turn_roll]
+                if outcome == BATTLE and state.phase != PHASE_BATTLE:
+                    # Too few warriors to fight at all
+                    outcome = OUTCOME_CODES["defeated"]
+        elif action == FLEE:
+            outcome = OUTCOME_CODES["fled"]
+        elif action == FIGHT:
+            won = rolls[0] < battle.round_win_faces(warriors, brigands)
+            outcome = OUTCOME_CODES["won"] if won else OUTCOME_CODES["defeated"]
+
+        if state.phase == PHASE_BATTLE:
+            continue  # The battle goes on
+        player, dragon = state.players[seat], state.dragon
+        rows.append((
+            seat + 1, turn, turn_action, turn_roll, outcome,
+            player.gold, player.warriors, player.food, dragon.gold, dragon.warriors,
+        ))
+    return state, actions, rows
+
+
+class BatchResult:
+    """Aggregated results of a batch of games; parts from workers merge"""
+
+    def __init__(self, players: int):
+        self.players = players
+        self.games = 0
+        self.actions = 0
+        self.wins = [0] * players
+        self.no_winner = 0
+        self.length = Metric()
+        self.gold = Metric()
+        self.warriors = Metric()
+        self.food = Metric()
+
+    def add(self, state: GameState, actions: int):
+        self.games += 1
+        self.actions += actions
+        winner = state.winner()
+        if winner is None:
+            self.no_winner += 1
+        else:
+            self.wins[winner] += 1
+        self.length.add(min(state.turn, state.max_turns))
+        for player in state.players:
+            self.gold.add(player.gold)
+            self.warriors.add(player.warriors)
+            self.food.add(max(0, player.food))
+
+    def merge(self, other: "BatchResult"):
+        self.games += other.games
+        self.actions += other.actions
+        self.wins = [a + b for a, b in zip(self.wins, other.wins)]
+        self.no_winner += other.no_winner
+        self.length.merge(other.length)
+        self.gold.merge(other.gold)
+        self.warriors.merge(other.warriors)
+        self.food.merge(other.food)
+
+    def summary(self) -> dict:
+        """JSON-friendly summary of the batch"""
+        return {
+            "games": self.games,
+            "actions": self.actions,
+            "wins": {str(seat + 1): count for seat, count in enumerate(self.wins)},
+            "win_rate": {str(seat + 1): count / self.games if self.games else 0.0 for seat, count in enumerate(self.wins)},
+            "no_winner": self.no_winner,
+            "length": self.length.summary(),
+            "gold": self.gold.summary(),
+            "warriors": self.warriors.summary(),
+            "food": self.food.summary(),
+        }
+
+
+def game_record(seed, policy: str, level: int, state: GameState, actions: int, turns: list) -> tuple:
+    """Everything ResultsStore keeps about one game, as plain tuples that pickle cheaply"""
+    winner = state.winner()
+    return (
+        seed, policy, level, len(state.players), state.max_turns,
+        None if winner is None else winner + 1, min(state.turn, state.max_turns), actions,
+        tuple((p.gold, p.warriors, max(0, p.food), p.is_eliminated) for p in state.players),
+        turns,
+    )
+
+
+def _play_chunk(job):
+    params, seeds, players, max_turns, policy, level, store = job
+    result = BatchResult(players)
+    records = [] if store else None
+    for seed in seeds:
+        if store:
+            state, actions, turns = play_recorded(params, seed, players, max_turns, policy)
+            records.append(game_record(seed, policy, level, state, actions, turns))
+        else:
+            state, actions = play_to_end(params, seed, players, max_turns, policy)
+        result.add(state, actions)
+    return result, records
+
+
+def run_games(games: int, players: int = 1, level: int = 1, seed: int = 0, policy: str = "greedy",
+              max_turns: int = 30, workers: int = None, params: RuleParams = None, writer=None) -> BatchResult:
+    """
+    Play games headless, split across worker processes.
+
+    Args:
+        level: Difficulty level whose rule profile is used (ignored if params is given)
+        seed: Game i uses seed + i
+        workers: Number of processes (defaults to the CPU count, 1 runs in-process)
+        writer: ResultsWriter that every game's summary and turns are sent to
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy {policy!r}, expected one of {sorted(POLICIES)}")
+    params = params or rules_for_level(level)
+    workers = workers or os.cpu_count() or 1
+    seeds = range(seed, seed + games)
+
+    # A few chunks per worker keeps them busy when game lengths vary
+    chunks = max(1, min(games, workers * 4))
+    if writer is not None:
+        chunks = max(chunks, min(games, -(-games // STORE_CHUNK_GAMES)))
+    jobs = [(params, seeds[i::chunks], players, max_turns, policy, level, writer is not None) for i in range(chunks)]
+
+    total = BatchResult(players)
+    if workers == 1:
+        for part, records in map(_play_chunk, jobs):
+            total.merge(part)
+            if records:
+                writer.submit(records)
+        return total
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part, records in pool.map(_play_chunk, jobs):
+            total.merge(part)
+            if records:
+                writer.submit(records)
+    return total
@@ -0,0 +1,177 @@
+"""
+Columnar Turn Exporter
+
+Streams per-turn records to disk in fixed-size columnar chunks. Each column
+is a preallocated typed array; when a chunk fills up every column is written
+as its own NumPy .npy file and the arrays are reused, so memory stays at one
+chunk no matter how many rows are exported.
+
+Layout:
+    <directory>/
+        manifest.json
+        chunk_00000/game.npy, player.npy, turn.npy, ...
+        chunk_00001/...
+
+The .npy files are written directly (NumPy is not needed to produce them)
+and load with numpy.load() or read_column() below.
+
+Usage:
+    with TurnExporter("runs/export") as exporter:
+        exporter.attach(gc)
+        ... play games, bumping exporter.game_id between games ...
+"""
+
+import ast
+import json
+import os
+import struct
+import sys
+from array import array
+
+from models.turn_record import ACTIONS, OUTCOMES
+
+# (column name, array typecode)
+COLUMNS = (
+    ("game", "I"),
+    ("player", "B"),
+    ("turn", "H"),
+    ("action", "B"),
+    ("roll", "b"),
+    ("outcome", "B"),
+    ("gold", "i"),
+    ("warriors", "h"),
+    ("food", "h"),
+    ("dragon_gold", "i"),
+    ("dragon_warriors", "i"),
+)
+
+NPY_MAGIC = b"\x93NUMPY\x01\x00"
+
+
+def _npy_descr(typecode: str) -> str:
+    """NumPy dtype string for an array typecode on this machine"""
+    order = "<" if sys.byteorder == "little" else ">"
+    itemsize = array(typecode).itemsize
+    kind = "u" if typecode.isupper() else "i"
+    return f"{order if itemsize > 1 else '|'}{kind}{itemsize}"
+
+
+def write_npy(path, values: array, count: int):
+    """Write the first count items of a typed array as a 1-D .npy file"""
+    header = "{'descr': '%s', 'fortran_order': False, 'shape': (%d,), }" % (_npy_descr(values.typecode), count)
+    # Pad so the data starts on a 64-byte boundary, as the format asks
+    padding = 64 - (len(NPY_MAGIC) + 2 + len(header) + 1) % 64
+    header = header + " " * (padding % 64) + "\n"
+
+    with open(path, "wb") as f:
+        f.write(NPY_MAGIC)
+        f.write(struct.pack("<H", len(header)))
+        f.write(header.encode("latin1"))
+        f.write(memoryview(values).cast("B")[:count * values.itemsize])
+
+
+def read_column(path, typecode: str) -> array:
+    """Read a 1-D .npy column written by write_npy back into a typed array"""
+    with open(path, "rb") as f:
+        if f.read(len(NPY_MAGIC)) != NPY_MAGIC:
+            raise ValueError(f"{path} is not a version 1.0 .npy file")
+        (header_len,) = struct.unpack("<H", f.read(2))
+        header = ast.literal_eval(f.read(header_len).decode("latin1"))
+        values = array(typecode)
+        values.frombytes(f.read())
+
+    if header["descr"] != _npy_descr(typecode):
+        raise ValueError(f"{path} holds {header['descr']}, expected {_npy_descr(typecode)}")
+    return values
+
+
+class TurnExporter:
+    """
+    Turn observer that buffers records in columns and flushes full chunks.
+
+    Args:
+        directory: Output directory (created if needed)
+        chunk_rows: Rows per chunk; also the most rows ever held in memory
+    """
+
+    def __init__(self, directory, chunk_rows: int = 65536):
+        self.directory = directory
+        self.chunk_rows = chunk_rows
+        self.game_id = 0
+        self.rows = 0
+        self.chunk_sizes = []
+        self._count = 0
+        self._columns = [array(typecode, [0]) * chunk_rows for _, typecode in COLUMNS]
+        os.makedirs(directory, exist_ok=True)
+
+    def attach(self, gc):
+        """Start receiving turns from a game controller"""
+        gc.turn_observers.append(self)
+
+    def detach(self, gc):
+        if self in gc.turn_observers:
+            gc.turn_observers.remove(self)
+
+    def record_turn(self, player_number, turn_number, action, roll, outcome,
+                    gold, warriors, food, dragon_gold, dragon_warriors):
+        n = self._count
+        (game_col, player_col, turn_col, action_col, roll_col, outcome_col,
+         gold_col, warriors_col, food_col, dragon_gold_col, dragon_warriors_col) = self._columns
+        game_col[n] = self.game_id
+        player_col[n] = player_number
+        turn_col[n] = turn_number
+        action_col[n] = action
+        roll_col[n] = roll
+        outcome_col[n] = outcome
+        gold_col[n] = gold
+        warriors_col[n] = warriors
+        food_col[n] = food
+        dragon_gold_col[n] = dragon_gold
+        dragon_warriors_col[n] = dragon_warriors
+
+        self._count = n + 1
+        if self._count == self.chunk_rows:
+            self.flush()
+
+    def flush(self):
+        """Write the rows buffered so far as a new chunk"""
+        if self._count == 0:
+            return
+
+        chunk_dir = os.path.join(self.directory, f"chunk_{len(self.chunk_sizes):05d}")
+        os.makedirs(chunk_dir, exist_ok=True)
+        for (name, _), values in zip(COLUMNS, self._columns):
+            write_npy(os.path.join(chunk_dir, f"{name}.npy"), values, self._count)
+
+        self.chunk_sizes.append(self._count)
+        self.rows += self._count
+        self._count = 0
+
+    def close(self):
+        """Flush the last partial chunk and write the manifest"""
+        self.flush()
+        manifest = {
+            "rows": self.rows,
+            "chunks": self.chunk_sizes,
+            "columns": [{"name": name, "dtype": _npy_descr(typecode)} for name, typecode in COLUMNS],
+            "actions": list(ACTIONS),
+            "outcomes": list(OUTCOMES),
+        }
+        with open(os.path.join(self.directory, "manifest.json"), "w") as f:
+            json.dump(manifest, f, indent=2)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def read_export(directory, column: str):
+    """Yield one typed array per chunk for a column of an export directory"""
+    typecode = dict(COLUMNS)[column]
+    with open(os.path.join(directory, "manifest.json")) as f:
+        manifest = json.load(f)
+    for idx in range(len(manifest["chunks"])):
+        yield read_column(os.path.join(directory, f"chunk_{idx:05d}", f"{column}.npy"), typecode)
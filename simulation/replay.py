@@ -0,0 +1,257 @@
+"""
+Seekable Game Replays
+
+A replay stores one frame per finished turn: the turn's player, action,
+roll and outcome, what the drum display showed, and every Player and Dragon
+field (models.zobrist.PLAYER_FIELDS and DRAGON_FIELDS). Every `interval`
+frames is a keyframe holding all values; the frames in between only hold
+the (field, value) pairs that changed since the frame before. Reaching any
+frame means decoding its keyframe and at most interval - 1 deltas, and
+stepping forward from the last frame read decodes a single delta.
+
+Layout (little-endian):
+    header      magic, version, interval, players, frames, index offset
+    frames      FRAME header, then `count` int32 values (keyframe) or
+                `count` (uint16 field, int32 value) pairs (delta)
+    index       uint64 file offset of every keyframe
+
+The header's frame count and index offset are written when the recorder
+closes. ReplayReader memory-maps the file and only decodes the frames a
+seek passes through.
+
+Usage:
+    recorder = ReplayRecorder("game.dtr", interval=16)
+    recorder.attach(gc)
+    ... play ...
+    recorder.close()
+
+    with ReplayReader("game.dtr") as replay:
+        frame = replay.frame(120)
+        print(frame.turn_number, frame.player(0)["gold"], frame.dragon["warriors"])
+"""
+
+import mmap
+import struct
+from array import array
+
+from models.zobrist import DRAGON_FIELDS, PLAYER_FIELDS
+
+MAGIC = b"DTREPLAY"
+VERSION = 1
+
+HEADER = struct.Struct("<8sHHBxxxIQ")  # magic, version, interval, players, frames, index offset
+FRAME = struct.Struct("<BBHBbBBBH")  # kind, player, turn, action, roll, outcome, digit 1, digit 2, count
+DELTA = struct.Struct("<Hi")  # field, value
+
+KEYFRAME = 0
+DELTA_FRAME = 1
+
+# What one display digit shows (SevenSegmentDisplay.DIGIT_SEGMENTS keys) <-> byte code
+DIGIT_NAMES = tuple(range(10)) + ("off", "dash", "minus", "l")
+DIGIT_CODES = {name: code for code, name in enumerate(DIGIT_NAMES)}
+DIGIT_CODES["-"] = DIGIT_CODES["minus"]
+
+
+def display_digits(value) -> tuple:
+    """Byte codes of the two digits a display value shows"""
+    # Imported here so reading replays never needs the UI package
+    from ui.seven_segment_display import SevenSegmentDisplay
+
+    return tuple(DIGIT_CODES.get(digit, 0) for digit in SevenSegmentDisplay.digits(value))
+
+
+def game_values(gc) -> list:
+    """Every recorded Player and Dragon field of a controller, players first"""
+    values = [int(getattr(player, field)) for player in gc.players for field in PLAYER_FIELDS]
+    values.extend(int(getattr(gc.dragon, field)) for field in DRAGON_FIELDS)
+    return values
+
+
+class ReplayFrame:
+    """One decoded frame: the finished turn and the game values after it"""
+
+    __slots__ = ("index", "player_number", "turn_number", "action", "roll", "outcome", "display", "values")
+
+    def __init__(self, index, player_number, turn_number, action, roll, outcome, display, values):
+        self.index = index
+        self.player_number = player_number
+        self.turn_number = turn_number
+        self.action = action
+        self.roll = roll
+        self.outcome = outcome
+        self.display = display
+        self.values = values
+
+    def player(self, seat: int) -> dict:
+        """Fields of the player in a seat (0-based)"""
+        start = seat * len(PLAYER_FIELDS)
+        return dict(zip(PLAYER_FIELDS, self.values[start:start + len(PLAYER_FIELDS)]))
+
+    @property
+    def dragon(self) -> dict:
+        return dict(zip(DRAGON_FIELDS, self.values[-len(DRAGON_FIELDS):]))
+
+
+class ReplayRecorder:
+    """
+    Turn observer that writes a replay of one game.
+
+    The replay covers the players of the first recorded turn; if a new game
+    changes the number of players the recorder closes itself.
+
+    Args:
+        path: Replay file to write
+        interval: Frames from one keyframe to the next
+    """
+
+    def __init__(self, path, interval: int = 16):
+        if not 1 <= interval <= 0xFFFF:
+            raise ValueError(f"Keyframe interval must be 1-65535, not {interval}")
+        self.path = path
+        self.interval = interval
+        self.file = open(path, "wb")
+        self.players = None
+        self.frames = 0
+        self.keyframes = array("Q")
+        self.last_values = None
+        self.gc = None
+
+    def attach(self, gc):
+        """Start receiving turns from a game controller"""
+        self.gc = gc
+        gc.turn_observers.append(self)
+
+    def detach(self, gc):
+        if self in gc.turn_observers:
+            gc.turn_observers.remove(self)
+        self.gc = None
+
+    @property
+    def closed(self) -> bool:
+        return self.file is None
+
+    def record_turn(self, player_number, turn_number, action, roll, outcome,
+                    gold, warriors, food, dragon_gold, dragon_warriors):
+        if self.file is None:
+            return
+        gc = self.gc
+        if self.players is None:
+            self.players = len(gc.players)
+            self.file.write(HEADER.pack(MAGIC, VERSION, self.interval, self.players, 0, 0))
+        elif len(gc.players) != self.players:
+            self.close()
+            return
+
+        values = game_values(gc)
+        digits = display_digits(gc.display.value)
+        frame = (player_number, turn_number, action, roll, outcome) + digits
+
+        if self.frames % self.interval == 0:
+            self.keyframes.append(self.file.tell())
+            self.file.write(FRAME.pack(KEYFRAME, *frame, len(values)))
+            self.file.write(array("i", values).tobytes())
+        else:
+            changes = [(field, value) for field, (old, value) in enumerate(zip(self.last_values, values)) if old != value]
+            self.file.write(FRAME.pack(DELTA_FRAME, *frame, len(changes)))
+            self.file.write(b"".join(DELTA.pack(field, value) for field, value in changes))
+
+        self.last_values = values
+        self.frames += 1
+
+    def close(self):
+        """Write the keyframe index and finish the header"""
+        if self.file is None:
+            return
+        if self.gc is not None:
+            self.detach(self.gc)
+        if self.players is None:
+            # No turns were recorded: still leave a valid, empty replay
+            self.players = 0
+            self.file.write(HEADER.pack(MAGIC, VERSION, self.interval, 0, 0, 0))
+        index_offset = self.file.tell()
+        self.file.write(self.keyframes.tobytes())
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, VERSION, self.interval, self.players, self.frames, index_offset))
+        self.file.close()
+        self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class ReplayReader:
+    """
+    Memory-mapped replay with keyframe seeking.
+
+    Args:
+        path: Replay file written by ReplayRecorder
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.interval, self.players, self.frames, index_offset = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a replay file")
+        if version != VERSION:
+            raise ValueError(f"{path} is replay version {version}, expected {VERSION}")
+        if index_offset == 0:
+            raise ValueError(f"{path} was not closed; its keyframe index is missing")
+
+        keyframes = (self.frames + self.interval - 1) // self.interval
+        self.keyframes = memoryview(self.data)[index_offset:index_offset + keyframes * 8].cast("Q")
+        self._cursor = None  # (frame, offset of the next frame, values) of the last frame read
+
+    def __len__(self):
+        return self.frames
+
+    def frame(self, index: int) -> ReplayFrame:
+        """Decode a frame, from its keyframe or from the last frame read"""
+        if not 0 <= index < self.frames:
+            raise IndexError(f"Frame {index} is outside the replay (0-{self.frames - 1})")
+
+        cursor = self._cursor
+        if cursor is not None and cursor[0] < index and index // self.interval == cursor[0] // self.interval:
+            # Same keyframe span, ahead of the last frame read: keep going from there
+            position, offset, values = cursor[0] + 1, cursor[1], list(cursor[2])
+        else:
+            position, offset, values = index - index % self.interval, self.keyframes[index // self.interval], None
+
+        while True:
+            header = FRAME.unpack_from(self.data, offset)
+            kind, count = header[0], header[-1]
+            offset += FRAME.size
+            if kind == KEYFRAME:
+                values = list(array("i", self.data[offset:offset + count * 4]))
+                offset += count * 4
+            else:
+                for _ in range(count):
+                    field, value = DELTA.unpack_from(self.data, offset)
+                    values[field] = value
+                    offset += DELTA.size
+            if position == index:
+                break
+            position += 1
+
+        self._cursor = (index, offset, values)
+        player_number, turn_number, action, roll, outcome, digit1, digit2 = header[1:-1]
+        display = [DIGIT_NAMES[digit1], DIGIT_NAMES[digit2]]
+        return ReplayFrame(index, player_number, turn_number, action, roll, outcome, display, list(values))
+
+    def close(self):
+        self._cursor = None
+        self.keyframes.release()
+        self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -0,0 +1,304 @@
+"""
+Simulation Results Store
+
+Keeps simulated games in SQLite for balance reports:
+
+    games     one row per game: seed, policy, level, seats, round limit,
+              outcome ("won" or "no_winner"), winning seat, rounds, actions
+    seats     final gold, warriors and food of every seat
+    turns     one row per finished turn, codes as in models.turn_record
+    actions, outcomes   code -> name lookups for the turn codes
+
+Games are played by many worker processes but written by one connection:
+workers send finished games back to the parent (run_games), which hands
+them to a ResultsWriter thread. The writer groups `batch_games` games into
+one transaction of executemany calls on fixed INSERT statements, which
+sqlite3 prepares once and reuses. The database runs in WAL mode, so
+analysts can query it while a run is still writing.
+
+Usage:
+    with ResultsWriter("runs.db") as writer:
+        run_games(100_000, policy="random", workers=8, writer=writer)
+
+    with ResultsStore("runs.db") as store:
+        print(store.report(group_by=("policy", "level"), players=2))
+
+    python -m simulation --games 100000 --db runs.db
+    python -m simulation.results runs.db --group-by policy level
+"""
+
+import argparse
+import json
+import queue
+import sqlite3
+import sys
+import threading
+
+from models.turn_record import ACTIONS, OUTCOMES
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    seed INTEGER NOT NULL,
+    policy TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    players INTEGER NOT NULL,
+    max_turns INTEGER NOT NULL,
+    outcome TEXT NOT NULL,
+    winner INTEGER,
+    rounds INTEGER NOT NULL,
+    actions INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS seats (
+    game_id INTEGER NOT NULL,
+    seat INTEGER NOT NULL,
+    gold INTEGER NOT NULL,
+    warriors INTEGER NOT NULL,
+    food INTEGER NOT NULL,
+    eliminated INTEGER NOT NULL,
+    PRIMARY KEY (game_id, seat)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS turns (
+    game_id INTEGER NOT NULL,
+    player INTEGER NOT NULL,
+    turn INTEGER NOT NULL,
+    action INTEGER NOT NULL,
+    roll INTEGER NOT NULL,
+    outcome INTEGER NOT NULL,
+    gold INTEGER NOT NULL,
+    warriors INTEGER NOT NULL,
+    food INTEGER NOT NULL,
+    dragon_gold INTEGER NOT NULL,
+    dragon_warriors INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS actions (code INTEGER PRIMARY KEY, name TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS outcomes (code INTEGER PRIMARY KEY, name TEXT NOT NULL);
+
+CREATE INDEX IF NOT EXISTS games_seed ON games (seed);
+CREATE INDEX IF NOT EXISTS games_policy ON games (policy);
+CREATE INDEX IF NOT EXISTS games_level ON games (level);
+CREATE INDEX IF NOT EXISTS games_outcome ON games (outcome);
+CREATE INDEX IF NOT EXISTS turns_game ON turns (game_id);
+CREATE INDEX IF NOT EXISTS turns_outcome ON turns (outcome);
+"""
+
+INSERT_GAME = "INSERT INTO games VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+INSERT_SEAT = "INSERT INTO seats VALUES (?, ?, ?, ?, ?, ?)"
+INSERT_TURN = "INSERT INTO turns VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+# Columns report() and turn_outcomes() can group and filter by
+GAME_COLUMNS = ("seed", "policy", "level", "players", "max_turns", "outcome", "winner")
+
+
+def _where(filters: dict, prefix: str = "") -> tuple:
+    """WHERE clause and parameters for column=value filters on games"""
+    for column in filters:
+        if column not in GAME_COLUMNS:
+            raise ValueError(f"Cannot filter by {column!r}, expected one of {GAME_COLUMNS}")
+    if not filters:
+        return "", ()
+    clause = " AND ".join(f"{prefix}{column} = ?" for column in filters)
+    return f" WHERE {clause}", tuple(filters.values())
+
+
+def _columns(group_by, prefix: str = "") -> str:
+    for column in group_by:
+        if column not in GAME_COLUMNS:
+            raise ValueError(f"Cannot group by {column!r}, expected one of {GAME_COLUMNS}")
+    return ", ".join(f"{prefix}{column}" for column in group_by)
+
+
+class ResultsStore:
+    """
+    SQLite database of simulated games.
+
+    Only one store should write to a database at a time: game ids are
+    handed out from the highest id seen when the store opened.
+
+    Args:
+        path: Database file (created with the schema if needed)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        # With WAL a commit only waits for the log write; a crash can lose the last few batches, not corrupt the file
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+            self.conn.executemany("INSERT OR IGNORE INTO actions VALUES (?, ?)", enumerate(ACTIONS))
+            self.conn.executemany("INSERT OR IGNORE INTO outcomes VALUES (?, ?)", enumerate(OUTCOMES))
+        self.next_id = self.conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM games").fetchone()[0]
+
+    def write(self, records) -> int:
+        """
+        Store game records (simulation.batch.game_record) in one transaction.
+
+        Returns:
+            Number of turn rows written
+        """
+        games, seats, turns = [], [], []
+        game_id = self.next_id
+        for seed, policy, level, players, max_turns, winner, rounds, actions, finals, rows in records:
+            outcome = "no_winner" if winner is None else "won"
+            games.append((game_id, seed, policy, level, players, max_turns, outcome, winner, rounds, actions))
+            seats.extend(
+                (game_id, seat, gold, warriors, food, eliminated)
+                for seat, (gold, warriors, food, eliminated) in enumerate(finals, start=1)
+            )
+            turns.extend((game_id, *row) for row in rows)
+            game_id += 1
+
+        with self.conn:
+            self.conn.executemany(INSERT_GAME, games)
+            self.conn.executemany(INSERT_SEAT, seats)
+            self.conn.executemany(INSERT_TURN, turns)
+        self.next_id = game_id
+        return len(turns)
+
+    def report(self, group_by=("policy", "level", "players"), **filters) -> list:
+        """Games, win rate, rounds and final resources per group of games"""
+        columns = _columns(group_by, "g.")
+        where, params = _where(filters, "g.")
+        group = f" GROUP BY {columns} ORDER BY {columns}" if group_by else ""
+        sql = (
+            f"SELECT {columns + ', ' if group_by else ''}"
+            # One row per seat: game columns are only counted on seat 1's row
+            "SUM(s.seat = 1) AS games, "
+            "AVG(CASE WHEN s.seat = 1 THEN g.outcome = 'won' END) AS win_rate, "
+            "AVG(CASE WHEN s.seat = 1 THEN g.rounds END) AS rounds, "
+            "AVG(s.gold) AS gold, AVG(s.warriors) AS warriors, AVG(s.food) AS food, "
+            "AVG(s.eliminated) AS eliminated "
+            f"FROM games g JOIN seats s ON s.game_id = g.id{where}{group}"
+        )
+        return self._rows(sql, params)
+
+    def turn_outcomes(self, group_by=("policy", "level"), **filters) -> list:
+        """How often each turn outcome happened, per group of games"""
+        columns = _columns(group_by, "g.")
+        where, params = _where(filters, "g.")
+        sql = (
+            f"SELECT {columns + ', ' if group_by else ''}o.name AS outcome, COUNT(*) AS turns "
+            f"FROM turns t JOIN games g ON g.id = t.game_id JOIN outcomes o ON o.code = t.outcome{where} "
+            f"GROUP BY {columns + ', ' if group_by else ''}o.name ORDER BY {columns + ', ' if group_by else ''}turns DESC"
+        )
+        return self._rows(sql, params)
+
+    def _rows(self, sql: str, params: tuple) -> list:
+        cursor = self.conn.execute(sql, params)
+        names = [column[0] for column in cursor.description]
+        return [dict(zip(names, row)) for row in cursor]
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class ResultsWriter:
+    """
+    The single writer of a run: a thread that owns the store's connection.
+
+    submit() queues a list of game records and returns at once, unless
+    max_pending lists are already waiting, which keeps a slow disk from
+    filling memory. The thread commits every batch_games games.
+
+    Args:
+        path: Database file
+        batch_games: Games per transaction
+        max_pending: Record lists that may wait in the queue
+    """
+
+    def __init__(self, path, batch_games: int = 2000, max_pending: int = 64):
+        self.path = path
+        self.batch_games = batch_games
+        self.queue = queue.Queue(max_pending)
+        self.error = None
+
+        # Counters for the benchmark
+        self.games = 0
+        self.turns = 0
+        self.transactions = 0
+
+        self.thread = threading.Thread(target=self._run, name="results-writer", daemon=True)
+        self.thread.start()
+
+    def submit(self, records: list):
+        """Queue finished games for writing"""
+        if self.error is not None:
+            raise self.error
+        self.queue.put(records)
+
+    def _run(self):
+        store = None
+        batch = []
+        try:
+            store = ResultsStore(self.path)
+            for records in iter(self.queue.get, None):
+                batch.extend(records)
+                while len(batch) >= self.batch_games:
+                    self._write(store, batch[:self.batch_games])
+                    del batch[:self.batch_games]
+            self._write(store, batch)
+        except (sqlite3.Error, OSError) as e:
+            self.error = e
+            # Keep taking submissions so no producer blocks on a full queue
+            for _ in iter(self.queue.get, None):
+                pass
+        finally:
+            if store is not None:
+                store.close()
+
+    def _write(self, store: ResultsStore, batch: list):
+        if not batch:
+            return
+        self.turns += store.write(batch)
+        self.games += len(batch)
+        self.transactions += 1
+
+    def close(self):
+        """Write what is queued, stop the thread and raise any write error"""
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Balance report from a simulation results database")
+    parser.add_argument("db", help="Database written by python -m simulation --db")
+    parser.add_argument("--group-by", nargs="*", default=["policy", "level", "players"], choices=GAME_COLUMNS)
+    parser.add_argument("--policy", default=None, help="Only games played by this policy")
+    parser.add_argument("--level", type=int, default=None, help="Only games at this level")
+    parser.add_argument("--players", type=int, default=None, help="Only games with this many seats")
+    parser.add_argument("--turns", action="store_true", help="Report turn outcomes instead of game results")
+    args = parser.parse_args(argv)
+
+    filters = {
+        column: value
+        for column, value in (("policy", args.policy), ("level", args.level), ("players", args.players))
+        if value is not None
+    }
+    with ResultsStore(args.db) as store:
+        query = store.turn_outcomes if args.turns else store.report
+        json.dump(query(group_by=args.group_by, **filters), sys.stdout, indent=2)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
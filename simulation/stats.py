@@ -0,0 +1,215 @@
+"""
+Streaming Campaign Statistics
+
+Constant-memory aggregates that simulation workers update turn by turn and
+merge at the end of a campaign:
+
+- RunningStats: count, mean, variance (Welford) and min/max. Partial results
+  from separate workers are combined with Chan's parallel update.
+- QuantileSketch: log-linear bucket counts. Values below 128 are counted
+  exactly, larger ones share buckets at most 1/64 (about 1.6%) of the value
+  wide; negative values mirror the positive buckets. Buckets
+  depend only on the value, so merging two sketches gives exactly the sketch
+  of the combined data.
+- CampaignStats: the turn observer tying them together for gold, warriors,
+  food, outcomes and turns-to-elimination.
+
+Usage:
+    stats = CampaignStats()
+    stats.attach(gc)
+    ... play a game ...
+    stats.end_game()
+    total = CampaignStats.merged(worker_results)
+    print(total.summary())
+"""
+
+from collections import Counter
+
+from models.rules import is_eliminated
+from models.turn_record import ACTIONS, OUTCOMES
+
+EXACT_LIMIT_BITS = 7
+
+
+def bucket_floor(value: int) -> int:
+    """Lowest value in the sketch bucket holding value"""
+    magnitude = abs(value)
+    shift = magnitude.bit_length() - EXACT_LIMIT_BITS
+    if shift <= 0:
+        return value
+    if value < 0:
+        # The mirror of the positive bucket: its lowest value is minus that bucket's highest
+        return -((((magnitude >> shift) + 1) << shift) - 1)
+    return (value >> shift) << shift
+
+
+class RunningStats:
+    """Welford running mean and variance"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: "RunningStats"):
+        """Fold another RunningStats into this one"""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+
+class QuantileSketch:
+    """Mergeable integer quantile sketch with log-linear buckets"""
+
+    def __init__(self):
+        self.counts = Counter()
+        self.count = 0
+
+    def add(self, value: int):
+        self.counts[bucket_floor(int(value))] += 1
+        self.count += 1
+
+    def merge(self, other: "QuantileSketch"):
+        self.counts.update(other.counts)
+        self.count += other.count
+
+    def quantile(self, q: float):
+        """Return the bucket floor at quantile q (0-1), or None if empty"""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for value in sorted(self.counts):
+            seen += self.counts[value]
+            if seen > rank:
+                return value
+        return value
+
+
+class Metric:
+    """RunningStats and a QuantileSketch over the same values"""
+
+    def __init__(self):
+        self.stats = RunningStats()
+        self.sketch = QuantileSketch()
+
+    def add(self, value):
+        self.stats.add(value)
+        self.sketch.add(value)
+
+    def merge(self, other: "Metric"):
+        self.stats.merge(other.stats)
+        self.sketch.merge(other.sketch)
+
+    def summary(self) -> dict:
+        return {
+            "count": self.stats.count,
+            "mean": self.stats.mean,
+            "stdev": self.stats.variance ** 0.5,
+            "min": self.stats.min,
+            "max": self.stats.max,
+            "p50": self.sketch.quantile(0.5),
+            "p90": self.sketch.quantile(0.9),
+            "p99": self.sketch.quantile(0.99),
+        }
+
+
+class CampaignStats:
+    """
+    Turn observer aggregating a whole simulation campaign in constant memory.
+    """
+
+    def __init__(self):
+        self.games = 0
+        self.turns = 0
+        self.gold = Metric()
+        self.warriors = Metric()
+        self.food = Metric()
+        self.turns_to_elimination = Metric()
+        self.action_counts = [0] * len(ACTIONS)
+        self.outcome_counts = [0] * len(OUTCOMES)
+        self._eliminated = set()
+
+    def attach(self, gc):
+        """Start receiving turns from a game controller"""
+        gc.turn_observers.append(self)
+
+    def detach(self, gc):
+        if self in gc.turn_observers:
+            gc.turn_observers.remove(self)
+
+    def record_turn(self, player_number, turn_number, action, roll, outcome,
+                    gold, warriors, food, dragon_gold, dragon_warriors):
+        self.turns += 1
+        self.gold.add(gold)
+        self.warriors.add(warriors)
+        self.food.add(food)
+        self.action_counts[action] += 1
+        self.outcome_counts[outcome] += 1
+
+        if player_number not in self._eliminated and is_eliminated(warriors, food):
+            self._eliminated.add(player_number)
+            self.turns_to_elimination.add(turn_number)
+
+    def end_game(self):
+        """Mark the end of a game so elimination tracking starts fresh"""
+        self.games += 1
+        self._eliminated.clear()
+
+    def merge(self, other: "CampaignStats"):
+        """Fold another worker's stats into this one"""
+        self.games += other.games
+        self.turns += other.turns
+        self.gold.merge(other.gold)
+        self.warriors.merge(other.warriors)
+        self.food.merge(other.food)
+        self.turns_to_elimination.merge(other.turns_to_elimination)
+        self.action_counts = [a + b for a, b in zip(self.action_counts, other.action_counts)]
+        self.outcome_counts = [a + b for a, b in zip(self.outcome_counts, other.outcome_counts)]
+
+    @classmethod
+    def merged(cls, parts) -> "CampaignStats":
+        total = cls()
+        for part in parts:
+            total.merge(part)
+        return total
+
+    def summary(self) -> dict:
+        """JSON-friendly summary of the campaign"""
+        return {
+            "games": self.games,
+            "turns": self.turns,
+            "gold": self.gold.summary(),
+            "warriors": self.warriors.summary(),
+            "food": self.food.summary(),
+            "turns_to_elimination": self.turns_to_elimination.summary(),
+            "actions": dict(zip(ACTIONS, self.action_counts)),
+            "outcomes": dict(zip(OUTCOMES, self.outcome_counts)),
+        }
@@ -0,0 +1,242 @@
+"""
+Rule Parameter Sweep
+
+Plays many headless games (GameState with a fast policy) for each point of
+a grid or random sample of RuleParams and reports the win rate and mean
+game length of every point. Games are played in batches across worker
+processes, and every point uses the same game seeds so points are compared
+on the same dice.
+
+Balance tuning aims for a target win rate, so a point's score is its
+distance from the target. After each batch, points whose distance is
+clearly worse than the best point's (Hoeffding bounds at the given
+confidence do not overlap) stop early and get no more games.
+
+A space maps RuleParams fields to candidate values:
+
+    {"move_thresholds": [[2, 4, 7, 10], [1, 4, 7, 10]], "item_price_base": [15, 17, 20]}
+
+Usage:
+    python -m simulation.sweep space.json --games 2000
+    python -m simulation.sweep space.json --sample 20 --target 0.6 -j 8
+    python -m simulation.sweep space.json --level 3
+"""
+
+import argparse
+import itertools
+import json
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from bots.policies import POLICIES
+from models.levels import LEVELS, rules_for_level
+from models.rule_params import DEFAULT_RULES, RuleParams
+from simulation.batch import play_to_end
+
+
+def _values(values):
+    # JSON has no tuples; threshold lists become tuples so RuleParams stay hashable
+    return [tuple(v) if isinstance(v, list) else v for v in values]
+
+
+def grid(space: dict, base: RuleParams = DEFAULT_RULES):
+    """Every combination of the values in space, applied to base"""
+    names = list(space)
+    return [
+        base.with_changes(**dict(zip(names, combo)))
+        for combo in itertools.product(*(_values(space[name]) for name in names))
+    ]
+
+
+def random_sample(space: dict, count: int, rng: random.Random = None, base: RuleParams = DEFAULT_RULES):
+    """count distinct random combinations from space (fewer if the grid is smaller)"""
+    rng = rng or random.Random()
+    names = list(space)
+    choices = [_values(space[name]) for name in names]
+    if count >= math.prod(len(values) for values in choices):
+        return grid(space, base)
+
+    # Draw every dimension on its own so the grid is never built
+    seen = set()
+    points = []
+    while len(points) < count:
+        picks = tuple(rng.randrange(len(values)) for values in choices)
+        if picks in seen:
+            continue
+        seen.add(picks)
+        points.append(base.with_changes(**{name: values[i] for name, values, i in zip(names, choices, picks)}))
+    return points
+
+
+def play_game(params: RuleParams, seed, players: int = 1, max_turns: int = 30, policy: str = "greedy"):
+    """
+    Play one headless game to the end.
+
+    Returns:
+        (won, length): whether anyone survived, and the rounds played
+    """
+    state, _ = play_to_end(params, seed, players, max_turns, policy)
+    return state.winner() is not None, min(state.turn, max_turns)
+
+
+def _play_batch(job):
+    params, seeds, players, max_turns, policy = job
+    wins = 0
+    total_length = 0
+    for seed in seeds:
+        won, length = play_game(params, seed, players, max_turns, policy)
+        wins += won
+        total_length += length
+    return wins, total_length, len(seeds)
+
+
+class SweepPoint:
+    """Running results of one parameterization"""
+
+    def __init__(self, params: RuleParams):
+        self.params = params
+        self.games = 0
+        self.wins = 0
+        self.total_length = 0
+        self.stopped_early = False
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def mean_length(self) -> float:
+        return self.total_length / self.games if self.games else 0.0
+
+    def add(self, wins: int, total_length: int, games: int):
+        self.wins += wins
+        self.total_length += total_length
+        self.games += games
+
+    def distance_bounds(self, target: float, confidence: float):
+        """Hoeffding interval for |win rate - target|"""
+        if not self.games:
+            return 0.0, 1.0
+        margin = math.sqrt(math.log(2 / (1 - confidence)) / (2 * self.games))
+        distance = abs(self.win_rate - target)
+        return max(0.0, distance - margin), distance + margin
+
+    def as_dict(self) -> dict:
+        return {
+            "params": self.params.as_dict(),
+            "games": self.games,
+            "win_rate": self.win_rate,
+            "mean_length": self.mean_length,
+            "stopped_early": self.stopped_early,
+        }
+
+
+def _prune(points, target: float, confidence: float):
+    """Stop points whose distance from the target is clearly worse than the best one's"""
+    active = [p for p in points if not p.stopped_early]
+    best_upper = min(p.distance_bounds(target, confidence)[1] for p in active)
+    for point in active:
+        if point.distance_bounds(target, confidence)[0] > best_upper:
+            point.stopped_early = True
+
+
+def sweep(params_list, games: int = 1000, batch_size: int = 100, players: int = 1, max_turns: int = 30,
+          policy: str = "greedy", target: float = 0.5, confidence: float = 0.95, seed: int = 0,
+          workers: int = None):
+    """
+    Evaluate parameterizations in parallel.
+
+    Args:
+        params_list: RuleParams to evaluate
+        games: Most games played per point
+        batch_size: Games per point between early-stopping checks
+        target: Win rate the balance is tuned towards
+        confidence: Confidence of the bounds used to stop points early
+        seed: First game seed; game i of every point uses seed + i
+        workers: Number of processes (defaults to the CPU count, 1 runs in-process)
+
+    Returns:
+        A list of SweepPoint in the order of params_list
+    """
+    points = [SweepPoint(params) for params in params_list]
+    workers = workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for start in range(0, games, batch_size):
+            active = [p for p in points if not p.stopped_early]
+            if not active:
+                break
+            seeds = range(seed + start, seed + min(games, start + batch_size))
+
+            # Split each point's batch so every worker has work even with few points
+            chunks = max(1, min(len(seeds), -(-workers // len(active))))
+            jobs, owners = [], []
+            for point in active:
+                for i in range(chunks):
+                    jobs.append((point.params, seeds[i::chunks], players, max_turns, policy))
+                    owners.append(point)
+
+            results = pool.map(_play_batch, jobs) if pool is not None else map(_play_batch, jobs)
+            for point, result in zip(owners, results):
+                point.add(*result)
+            _prune(points, target, confidence)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return points
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep Dark Tower rule parameters headless")
+    parser.add_argument("space", help="JSON file mapping RuleParams fields to candidate values")
+    parser.add_argument("--level", type=int, choices=LEVELS, default=1, help="Level profile the space is applied to")
+    parser.add_argument("--sample", type=int, default=None, help="Evaluate a random sample instead of the full grid")
+    parser.add_argument("--games", type=int, default=1000, help="Most games per point")
+    parser.add_argument("--batch", type=int, default=100, help="Games per point between early-stopping checks")
+    parser.add_argument("--players", type=int, default=1)
+    parser.add_argument("--max-turns", type=int, default=30)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="greedy")
+    parser.add_argument("--target", type=float, default=0.5, help="Target win rate")
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    with open(args.space) as f:
+        space = json.load(f)
+    base = rules_for_level(args.level)
+    if args.sample is not None:
+        params_list = random_sample(space, args.sample, random.Random(args.seed), base)
+    else:
+        params_list = grid(space, base)
+
+    start = time.perf_counter()
+    points = sweep(
+        params_list, games=args.games, batch_size=args.batch, players=args.players,
+        max_turns=args.max_turns, policy=args.policy, target=args.target,
+        confidence=args.confidence, seed=args.seed, workers=args.workers,
+    )
+    elapsed = time.perf_counter() - start
+
+    points.sort(key=lambda p: (p.stopped_early, abs(p.win_rate - args.target)))
+    if args.json:
+        print(json.dumps([p.as_dict() for p in points], indent=2))
+        return 0
+
+    for point in points:
+        changes = {name: value for name, value in point.params.as_dict().items()
+                   if value != getattr(base, name)}
+        flag = " (stopped early)" if point.stopped_early else ""
+        print(f"win {point.win_rate:6.1%}  length {point.mean_length:5.1f}  games {point.games:6d}  {changes or 'defaults'}{flag}")
+    total_games = sum(p.games for p in points)
+    print(f"{len(points)} points, {total_games} games in {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
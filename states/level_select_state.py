@@ -48,6 +48,7 @@ class LevelSelectState(State):
                 self.current_level = 1
             self.display.set_value(["l", self.current_level])
         if text == "YES":
+            self.gc.set_level(self.current_level)
             self.gc.state_machine.change_state("player_select")
 
     def exit(self):
@@ -39,7 +39,8 @@ class PlayerSelectState(State):
             self.display.set_value(self.player_count)
         elif text == "YES":
             self.game_controller.players = [Player(self.game_controller, i) for i in range(self.player_count)]
-            self.game_controller.state_machine.change_state("player_turn", player_number=1)
+            self.game_controller.zobrist.rebuild(self.game_controller)
+            self.game_controller.state_machine.change_state("player_turn", player_number=1, turn_number=1)
 
     def exit(self):
         # self.game_controller.setup_player_menu()
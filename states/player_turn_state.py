@@ -7,60 +7,135 @@ This state represents a single player's turn in the game.
 
 from typing import TYPE_CHECKING
 from states.base_state import State
+from models import battle, outcome_tables, treasure
+from models.game_state import FIGHT, FLEE, MOVE, TOMB
+from models.journal import Journaled
+from models.turn_record import ACTION_BAZAAR, ACTION_MOVE, ACTION_NONE, ACTION_TOMB, NO_ROLL, OUTCOME_CODES, OUTCOME_NONE
 from player import Player
 
 if TYPE_CHECKING:
     from game import GameController
 
+OUTCOME_MESSAGES = {
+    outcome_tables.LOST: "got lost!",
+    outcome_tables.DRAGON: "encountered a dragon!",
+    outcome_tables.PLAGUE: "encountered a plague!",
+    outcome_tables.BATTLE: "encountered a battle!",
+    outcome_tables.NOTHING: "encountered nothing!",
+    outcome_tables.CLOSE: "found a close encounter!",
+    outcome_tables.TREASURE: "found treasure!",
+}
 
-class PlayerTurnState(State):
+# Treasure item -> (name shown, Player method that awards it)
+ITEM_AWARDS = {
+    treasure.ITEM_KEY: ("a key", "add_key"),
+    treasure.ITEM_PEGASUS: ("Pegasus", "add_pegasus"),
+    treasure.ITEM_SWORD: ("the Dragon Sword", "add_dragon_sword"),
+    treasure.ITEM_WIZARD: ("the Wizard", "add_wizard"),
+    treasure.ITEM_GOLD_ONLY: ("gold", None),
+}
+
+
+class PlayerTurnState(Journaled, State):
 
     def __init__(self, gc: "GameController"):
         super().__init__(gc)
         self.gc: "GameController" = gc
         self.display = self.gc.display
+
+        # MOVE/TOMB result -> handler script (None when the message is all that happens)
+        self.outcome_handlers = {
+            outcome_tables.LOST: lambda: self.player.get_lost(),
+            outcome_tables.DRAGON: lambda: self.player.dragon_attack(),
+            outcome_tables.PLAGUE: lambda: self.player.get_plagued(),
+            outcome_tables.BATTLE: self.do_battle,
+            outcome_tables.NOTHING: None,
+            outcome_tables.CLOSE: None,
+            outcome_tables.TREASURE: self.award_treasure,
+        }
         
-    def enter(self, player_number, **kwargs):
+    def enter(self, player_number, turn_number=1, **kwargs):
         """Set up the player turn UI"""
         self.gc.set_gm_status(f"Player {player_number} Turn. Waiting for action...")
         self.is_turn_over = False
         self.player_number = player_number
+        self.turn_number = turn_number
         self.player: Player = self.gc.players[self.player_number - 1]
         self.display.set_value(self.player_number)
         self.next_player_number = self.player_number + 1 if self.player_number < len(self.gc.players) else 1
         self.is_battling = False
+        self.brigands = 0
         self.is_at_bazaar = False
 
+        # What happened this turn, reported to turn observers when it ends
+        self.action = ACTION_NONE
+        self.roll = NO_ROLL
+        self.outcome = OUTCOME_NONE
+        # The same turn as GameState actions, for bots following the game
+        self.plays = ()
+
     def exit(self):
         pass
 
+    def restore(self):
+        """Redraw the turn after an undo or redo"""
+        if self.is_at_bazaar:
+            self.gc.bazaar.restore()
+            return
+        self.gc.clear_message()
+        if self.is_battling:
+            self.display.set_value(self.player_number)
+            self.show_battle_odds()
+        elif self.is_turn_over:
+            self.display.set_value(["minus", self.player_number])
+            self.gc.set_gm_status(f"Player {self.player_number} Turn Over. Press NO to end turn.")
+        else:
+            self.display.set_value(self.player_number)
+            self.gc.set_gm_status(f"Player {self.player_number} Turn. Waiting for action...")
+
     def on_button_click(self, text):
         """Handle button clicks"""
+        # Each press can be taken back with StateMachine.undo
+        self.gc.journal.checkpoint()
         self.gc.set_gm_status("")
 
         if self.is_at_bazaar:
             self.gc.bazaar.on_button_click(text)
             return
+
+        if self.is_battling:
+            # YES fights another round, NO flees
+            if text == "YES":
+                self.plays += (FIGHT,)
+                self.gc.driver.play(self.fight_round())
+            elif text == "NO":
+                self.plays += (FLEE,)
+                self.gc.driver.play(self.flee_battle())
+            return
         
         if text == "NO":
             if self.is_turn_over:
                 self.end_turn()
-            if self.is_battling:
-                self.gc.set_message("Attempt to flee battle")
-                self.gc.set_gm_status(f"Player {self.player_number} is attempting to flee battle...")
         if text == "MOVE":
             if not self.is_turn_over:
-                self.move()
-                self.set_turn_over()
+                self.plays += (MOVE,)
+                self.gc.driver.play(self.take_action(self.move))
         if text == "TOMB":
             if not self.is_turn_over:
-                self.tomb_ruin()
-                self.set_turn_over()
+                self.plays += (TOMB,)
+                self.gc.driver.play(self.take_action(self.tomb_ruin))
         if text == "BAZAAR":
             if not self.is_turn_over:
+                self.action = ACTION_BAZAAR
                 self.is_at_bazaar = True
                 self.gc.bazaar.enter(self)
 
+    def take_action(self, action):
+        """Script for MOVE or TOMB: the action, then the end of the turn unless a battle started"""
+        yield from action()
+        if not self.is_battling:
+            self.set_turn_over()
+
     def set_turn_over(self):
         self.display.set_value(["minus", self.player_number])
         self.is_turn_over = True
@@ -69,24 +144,35 @@ class PlayerTurnState(State):
         self.gc.update_stats_display()
         self.gc.set_gm_status(f"Player {self.player_number} Turn Over. Press NO to end turn.")
 
+        if self.gc.VERIFY_HASH:
+            assert self.gc.zobrist.verify(self.gc), "Incremental game hash out of step"
+
+        for observer in self.gc.turn_observers:
+            observer.record_turn(
+                self.player_number, self.turn_number, self.action, self.roll, self.outcome,
+                self.player.gold, self.player.warriors, self.player.food,
+                self.gc.dragon.gold, self.gc.dragon.warriors
+            )
+
     def end_turn(self):
         """End the current player's turn and switch to the next player"""
-        self.gc.state_machine.change_state("player_turn", player_number=self.next_player_number)
+        # A new round starts each time play wraps back to player 1
+        next_turn_number = self.turn_number + 1 if self.next_player_number == 1 else self.turn_number
+        self.gc.state_machine.change_state("player_turn", player_number=self.next_player_number, turn_number=next_turn_number)
 
     def exit_bazaar(self):
         """Exit the bazaar and continue the player's turn"""
         self.is_at_bazaar = False
         self.set_turn_over()
 
-    # MOVE RESULTS
-    # RESULT   HEX   DEC   LINE
-    # ======   ===  =====  ====
-    # LOST     0-2  00-02  2099
-    # DRAGON   3-4  03-04  2142
-    # PLAGUE   5-7  05-07  2280
-    # BATTLE   8-A  08-10  2511
-    # NOTHING  B-F  11-15   NA
-    
+    # Actions below are step scripts run by gc.driver (see script_driver.py).
+    # MOVE, TOMB and TREASURE result tables are compiled from data, see
+    # models/outcome_tables.py, models/rule_params.py and models/treasure.py.
+    # The original source line for each result:
+    #   LOST 2099, DRAGON 2142, PLAGUE 2280, BATTLE 2511
+    #   CLOSE 3182, BATTLE 3189
+    #   KEY 3218, PEGASUS 3298, SWORD 3321, WIZARD 3343
+
     def move(self):
         """Handle the player's move action"""
         # Implement the logic for moving the player
@@ -99,96 +185,115 @@ class PlayerTurnState(State):
         if forced_move is not None:
             result = forced_move
 
-        if result <= 2:
-            print(f"Player {self.player_number} got lost!")
-            self.gc.set_message(f"Player {self.player_number} got lost!")
-            self.player.get_lost()
-        elif result <= 4:
-            print(f"Player {self.player_number} encountered a dragon!")
-            self.gc.set_message(f"Player {self.player_number} encountered a dragon!")
-            self.player.dragon_attack()
-        elif result <= 7:
-            print(f"Player {self.player_number} encountered a plague!")
-            self.gc.set_message(f"Player {self.player_number} encountered a plague!")
-            self.player.get_plagued()
-        elif result <= 10:
-            print(f"Player {self.player_number} encountered a battle!")
-            self.gc.set_message(f"Player {self.player_number} encountered a battle!")
-        else:
-            print(f"Player {self.player_number} encountered nothing!")
-            self.gc.set_message(f"Player {self.player_number} encountered nothing!")
-
-    # RESULT    HEX   DEC   LINE
-    # ========  ===  =====  ====
-    # CLOSE     0-1  00-01  3182
-    # BATTLE    2-9  02-09  3189
-    # TREASURE  A-F  10-16   NA
+        self.action = ACTION_MOVE
+        self.roll = result
+        yield from self.resolve_outcome(self.gc.rules.move_table[result])
 
     def tomb_ruin(self):
         """Handle the player's tomb/ruin action"""
         print(f"Player {self.player_number} is exploring a tomb/ruin...")
         result = self.gc.roll_dice()
 
-        print(f"Player {self.player_number} rolled a {result}")
-
-        if result <= 1:
-            print(f"Player {self.player_number} found a close encounter!")
-            self.gc.set_message(f"Player {self.player_number} found a close encounter!")
-        elif result <= 9:
-            print(f"Player {self.player_number} encountered a battle!")
-            self.gc.set_message(f"Player {self.player_number} encountered a battle!")
-            self.do_battle()
-        else:
-            print(f"Player {self.player_number} found treasure!")
-            self.gc.set_message(f"Player {self.player_number} found treasure!")
+        self.action = ACTION_TOMB
+        self.roll = result
 
+        print(f"Player {self.player_number} rolled a {result}")
+        yield from self.resolve_outcome(self.gc.rules.tomb_table[result])
 
-    # RESULT     HEX   DEC   LINE
-    # =======    ===  =====  ====
-    # KEY*       0-9  00-09  3218
-    # PEGASUS     A     10   3298
-    # SWORD*      B     11   3321
-    # WIZARD**    C     12   3343
-    # GOLD ONLY  D-F  13-15   NA  
+    def resolve_outcome(self, outcome: int):
+        """Announce a MOVE or TOMB result and run its handler"""
+        message = f"Player {self.player_number} {OUTCOME_MESSAGES[outcome]}"
+        print(message)
+        self.gc.set_message(message)
+        self.outcome = outcome
+        handler = self.outcome_handlers[outcome]
+        if handler is not None:
+            yield from handler()
 
     def award_treasure(self):
         """Award treasure to the player"""
         print(f"Player {self.player_number} is being awarded treasure...")
         self.gc.set_gm_status(f"Awarding treasure to Player {self.player_number}...")
 
-        result = self.gc.roll_dice()
-        result /= 2
-        result += 13
-
-        self.player.gold += result
-        self.player.display("gold")
+        self.player.gold += treasure.treasure_gold(self.gc.roll_dice())
+        yield from self.player.display("gold")
 
         self.gc.set_message(f"Player {self.player_number} has been awarded treasure!")
 
-        result = self.gc.roll_dice()
-
-        if result <= 9:
-            print(f"Player {self.player_number} found a key!")
-            self.gc.set_message(f"Player {self.player_number} found a key!")
-            self.player.add_key()
-        elif result == 10:
-            print(f"Player {self.player_number} found Pegasus!")
-            self.gc.set_message(f"Player {self.player_number} found Pegasus!")
-            self.player.add_pegasus()
-        elif result == 11:
-            print(f"Player {self.player_number} found the Dragon Sword!")
-            self.gc.set_message(f"Player {self.player_number} found the Dragon Sword!")
-            self.player.add_dragon_sword()
-        elif result == 12:
-            print(f"Player {self.player_number} found the Wizard!")
-            self.gc.set_message(f"Player {self.player_number} found the Wizard!")
-            self.player.add_wizard()
-        elif result <= 15:
+        item = treasure.treasure_item(self.gc.roll_dice())
+        name, award = ITEM_AWARDS[item]
+        if award is None:
             print(f"Player {self.player_number} only found gold!")
+            return
 
+        print(f"Player {self.player_number} found {name}!")
+        self.gc.set_message(f"Player {self.player_number} found {name}!")
+        # Awards with a drum reveal (the keys) return a step script
+        steps = getattr(self.player, award)()
+        if steps is not None:
+            yield from steps
 
     def do_battle(self):
-        """Handle battle logic for the player"""
+        """Start a battle against brigands. YES fights a round, NO flees."""
         print(f"Player {self.player_number} is engaging in battle...")
-        self.gc.set_gm_status(f"Player {self.player_number} is engaging in battle...")
-        self.is_battling = True
\ No newline at end of file
+        self.brigands = battle.brigand_count(self.player.warriors, self.gc.roll_dice())
+        self.is_battling = True
+        yield from self.gc.drum.display(self.player_number, "brigands", self.brigands)
+
+        # A player down to their last warrior cannot fight at all
+        if battle.is_battle_over(self.player.warriors, self.brigands):
+            yield from self.end_battle()
+            return
+        self.show_battle_odds()
+
+    def show_battle_odds(self):
+        """Show the current battle odds on the game master window"""
+        odds = battle.win_probability(self.player.warriors, self.brigands)
+        loss = battle.expected_loss(self.player.warriors, self.brigands)
+        self.gc.set_gm_status(
+            f"Player {self.player_number}: {self.player.warriors} warriors vs {self.brigands} brigands. "
+            f"Win chance {odds:.0%}, expected loss {loss:.1f}. YES to fight, NO to flee."
+        )
+
+    def fight_round(self):
+        """Fight one round of the current battle"""
+        self.player.warriors, self.brigands, won_round = battle.resolve_round(
+            self.player.warriors, self.brigands, self.gc.roll_dice()
+        )
+
+        if won_round:
+            print(f"Player {self.player_number} won the round!")
+            yield from self.gc.drum.display(self.player_number, "brigands", self.brigands)
+        else:
+            print(f"Player {self.player_number} lost the round!")
+            yield from self.gc.drum.display(self.player_number, "warriors", self.player.warriors)
+
+        if not battle.is_battle_over(self.player.warriors, self.brigands):
+            self.show_battle_odds()
+            return
+
+        yield from self.end_battle()
+        self.set_turn_over()
+
+    def end_battle(self):
+        """Finish a battle that has been won or lost"""
+        self.is_battling = False
+        if self.brigands <= 0:
+            print(f"Player {self.player_number} won the battle!")
+            self.gc.set_message(f"Player {self.player_number} won the battle!")
+            self.outcome = OUTCOME_CODES["won"]
+            yield from self.award_treasure()
+        else:
+            print(f"Player {self.player_number} lost the battle!")
+            self.gc.set_message(f"Player {self.player_number} lost the battle!")
+            self.outcome = OUTCOME_CODES["defeated"]
+
+    def flee_battle(self):
+        """Flee the current battle, losing one warrior"""
+        print(f"Player {self.player_number} fled the battle!")
+        self.player.warriors = battle.flee(self.player.warriors)
+        self.is_battling = False
+        self.outcome = OUTCOME_CODES["fled"]
+        self.gc.set_message(f"Player {self.player_number} fled the battle!")
+        yield from self.gc.drum.display(self.player_number, "warriors", self.player.warriors)
+        self.set_turn_over()
@@ -4,7 +4,9 @@ State Machine Manager
 Manages state transitions and the current active state for the Dark Tower game.
 """
 
+import time
 
+from models.zobrist import state_value
 from states.level_select_state import LevelSelectState
 from states.player_select_state import PlayerSelectState
 from states.player_turn_state import PlayerTurnState
@@ -32,6 +34,7 @@ class StateMachine:
         self.states = {}  # Dictionary of state_name -> State class
         self.current_state = None
         self.current_state_name = None
+        self.current_state_kwargs = {}
     
     def register_state(self, state_name, state_class):
         """
@@ -61,9 +64,12 @@ class StateMachine:
         
         # Create and enter new state
         state_class = self.states[new_state_name]
-        self.current_state = state_class(self.gc)
-        self.current_state_name = new_state_name
+        self._set_current_state(state_class(self.gc), new_state_name, kwargs)
+        start = time.perf_counter()
         self.current_state.enter(**kwargs)
+        latency = getattr(self.gc, "latency", None)
+        if latency is not None:
+            latency.state_entered(new_state_name, time.perf_counter() - start)
         
         # Update stats window if it exists
         self.gc.update_stats_display()
@@ -94,11 +100,64 @@ class StateMachine:
             self.current_state.exit()
         
         # Clear current state references
-        self.current_state = None
-        self.current_state_name = None
+        self._set_current_state(None, None, {})
 
         self.states.clear()
 
+    @property
+    def current(self):
+        """(state, name, enter kwargs) of the current state"""
+        return self.current_state, self.current_state_name, self.current_state_kwargs
+
+    @current.setter
+    def current(self, value):
+        self._set_current_state(*value)
+
+    def undo(self) -> bool:
+        """
+        Take back the last button press, returning to the state it was made in.
+
+        Returns:
+            False if there is no history left to undo
+        """
+        if not self.gc.journal.undo():
+            return False
+        self._restore_view()
+        return True
+
+    def redo(self) -> bool:
+        """
+        Play an undone button press again.
+
+        Returns:
+            False if there is nothing to redo
+        """
+        if not self.gc.journal.redo():
+            return False
+        self._restore_view()
+        return True
+
+    def _restore_view(self):
+        if hasattr(self.current_state, "restore"):
+            self.current_state.restore()
+        self.gc.update_stats_display()
+
+    def _set_current_state(self, state, state_name, kwargs):
+        """Switch the current state and keep the game hash and journal in step"""
+        journal = getattr(self.gc, "journal", None)
+        if journal is not None:
+            journal.record(self, "current", self.current, (state, state_name, kwargs))
+        zobrist = getattr(self.gc, "zobrist", None)
+        if zobrist is not None:
+            zobrist.update(
+                "game", "state",
+                state_value(self.current_state_name, self.current_state_kwargs),
+                state_value(state_name, kwargs)
+            )
+        self.current_state = state
+        self.current_state_name = state_name
+        self.current_state_kwargs = kwargs
+
     def start(self):
         """
         Start the state machine by registering all states and transitioning to the initial state.
@@ -128,8 +128,7 @@ class ButtonGrid:
     
     def on_button_click(self, text):
         """Handle button click events from the grid"""
-        if self.buttons_enabled:
-            self.game_controller.clear_message()
+        # The message is cleared when the game controller takes the press off its input queue
         self.handle_button_click(text)
     
     def handle_button_click(self, text):
@@ -10,6 +10,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from game import GameController
 
+LATENCY_REFRESH_MS = 1000
+
 
 class GameMasterWindow:
     """
@@ -29,7 +31,7 @@ class GameMasterWindow:
         
         # Create the game master window as a Toplevel (child of main window)
         self.window = tk.Toplevel(gc.root)
-        self.window.geometry("300x400")
+        self.window.geometry("300x560")
         self.window.configure(bg="black")
         self.game_master_window_offset = 310
         self.stats_window_offset = 720
@@ -72,6 +74,9 @@ class GameMasterWindow:
 
         # Create buttons
         self.create_buttons()
+
+        # Create the latency panel
+        self.create_latency_panel()
     
     def _on_main_window_move(self, event):
         """Keep both windows positioned relative to main window when it moves"""
@@ -111,7 +116,9 @@ class GameMasterWindow:
         buttons = {
             "Force Dragon": self.on_force_dragon,
             "Force Plague": self.on_force_plague,
-            "Force Lost": self.on_force_lost
+            "Force Lost": self.on_force_lost,
+            "Undo": self.on_undo,
+            "Redo": self.on_redo,
         }
 
         for b in buttons:
@@ -128,6 +135,57 @@ class GameMasterWindow:
             )
             btn.pack(fill=tk.X, pady=5)
     
+    def create_latency_panel(self):
+        """Create the live press and state-enter latency readout"""
+        self.latency_label = tk.Label(
+            self.button_frame,
+            text="",
+            bg="black",
+            fg="#d60000",  # Red text to match display
+            font=("Courier", 8),
+            justify=tk.LEFT,
+            anchor="w"
+        )
+        self.latency_label.pack(fill=tk.X, pady=(10, 0))
+
+        btn = tk.Button(
+            self.button_frame,
+            text="Dump Latency",
+            bg="#d60000",  # Red
+            fg="#ffffff",  # White text
+            font=("Arial", 10, "bold"),
+            command=self.on_dump_latency,
+            relief=tk.RAISED,
+            padx=10,
+            pady=5
+        )
+        btn.pack(fill=tk.X, pady=5)
+
+        self.refresh_latency()
+
+    def refresh_latency(self):
+        """Show p50/p99 of every latency histogram, then schedule the next refresh"""
+        lines = [f"{'':<18}{'n':>5}{'p50':>7}{'p99':>7}"]
+        for name, row in self.gc.latency.summary().items():
+            if row["count"]:
+                lines.append(f"{name[:18]:<18}{row['count']:>5}{row['p50_ms']:>7.1f}{row['p99_ms']:>7.1f}")
+        self.latency_label.config(text="\n".join(lines))
+        self.gc.scheduler.after(LATENCY_REFRESH_MS, self.refresh_latency)
+
+    def on_dump_latency(self):
+        """Save every latency histogram to a JSON file chosen by the operator"""
+        from tkinter import filedialog
+
+        path = filedialog.asksaveasfilename(
+            title="Dump latency histograms",
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        self.gc.latency.dump(path)
+        self.gc.set_gm_status(f"Latency written to {path}")
+
     def update_status_window(self, status: str):
         """Update the status label text"""
         self.status_label.config(text=status)
@@ -135,23 +193,33 @@ class GameMasterWindow:
     def on_force_dragon(self):
         """Handle force dragon button click"""
         print("Force Dragon clicked!")
-        # Add game master logic here
-        self.gc.has_forced_move = True
-        self.gc.forced_move = "dragon"
+        self.gc.force_move("dragon")
             
     def on_force_plague(self):
         """Handle force Plague button click"""
         print("Force Plague clicked!")
-        # Add game master logic here
-        self.gc.has_forced_move = True
-        self.gc.forced_move = "plague"
+        self.gc.force_move("plague")
             
     def on_force_lost(self):
         """Handle force Lost button click"""
         print("Force Lost clicked!")
-        # Add game master logic here
-        self.gc.has_forced_move = True
-        self.gc.forced_move = "lost"
+        self.gc.force_move("lost")
+
+    def on_undo(self):
+        """Take back the last button press"""
+        if self.gc.driver.busy:
+            self.gc.set_gm_status("Wait for the drum to finish.")
+            return
+        if not self.gc.state_machine.undo():
+            self.gc.set_gm_status("Nothing to undo.")
+
+    def on_redo(self):
+        """Play an undone button press again"""
+        if self.gc.driver.busy:
+            self.gc.set_gm_status("Wait for the drum to finish.")
+            return
+        if not self.gc.state_machine.redo():
+            self.gc.set_gm_status("Nothing to redo.")
     
     def create_stats_window(self):
         """Create the player stats window as a child of this window"""
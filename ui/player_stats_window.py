@@ -2,16 +2,22 @@
 Player Stats Window - Displays player information in a separate window
 
 Shows each player's gold, warriors, and food in a dedicated stats window
-positioned to the left of the main game window.
+positioned to the left of the main game window. Up to MAX_PLAYER_PANELS
+players get a panel each; larger games (bot leagues) get a scrollable,
+sortable VirtualStatsView instead.
 """
 
 import tkinter as tk
 from tkinter import font as tkfont
 from typing import TYPE_CHECKING, Optional
 
+from ui.virtual_stats_view import VirtualStatsView
+
 if TYPE_CHECKING:
     from game import GameController
 
+MAX_PLAYER_PANELS = 4
+
 
 class PlayerStatsWindow:
     """
@@ -60,9 +66,15 @@ class PlayerStatsWindow:
         
         # Store player stat labels for updating
         self.player_stat_labels = []
+        self.table = None
         
         # Create stat displays for each player
-        self.create_player_stat_displays()
+        if len(self.players) > MAX_PLAYER_PANELS:
+            self.table = VirtualStatsView(self.stats_frame, self.players)
+            self.table.pack(fill=tk.BOTH, expand=True)
+            self.table.refresh()
+        else:
+            self.create_player_stat_displays()
     
     def create_player_stat_displays(self):
         """Create stat display panels for each player"""
@@ -129,6 +141,9 @@ class PlayerStatsWindow:
     
     def update_player_stats(self):
         """Update the display with current player stats"""
+        if self.table is not None:
+            self.table.refresh()
+            return
         for idx, player in enumerate(self.players):
             if idx < len(self.player_stat_labels):
                 labels = self.player_stat_labels[idx]
@@ -0,0 +1,176 @@
+"""
+Replay Viewer - Scrub through a recorded game
+
+Shows one frame of a replay (simulation/replay.py) at a time on the game's
+own SevenSegmentDisplay, with each player's gold, warriors and food in a
+PlayerStatsWindow. The slider jumps to any turn; the replay is memory-mapped,
+so a jump decodes at most one keyframe interval and long games open
+instantly.
+
+Usage:
+    python -m ui.replay_viewer game.dtr
+"""
+
+import argparse
+import sys
+import tkinter as tk
+
+from models.turn_record import ACTIONS, OUTCOMES
+from simulation.replay import ReplayReader
+from ui.player_stats_window import PlayerStatsWindow
+from ui.seven_segment_display import SevenSegmentDisplay
+
+PLAY_MS = 500  # Time each frame is shown while playing
+
+
+class ReplayPlayer:
+    """Player fields of the frame on screen, read by PlayerStatsWindow"""
+
+    def __init__(self, player_number: int):
+        self.player_number = player_number
+        self.gold = 0
+        self.warriors = 0
+        self.food = 0
+
+
+class ReplayViewer:
+    """
+    Slider, transport buttons and game readouts for one replay.
+
+    Args:
+        window: Tk or Toplevel window the viewer fills
+        reader: Open replay; closed with the window
+    """
+
+    def __init__(self, window, reader: ReplayReader):
+        self.window = window
+        self.root = window
+        self.reader = reader
+        self.players = [ReplayPlayer(seat + 1) for seat in range(reader.players)]
+        self.index = 0
+        self.play_id = None
+
+        window.title(f"Replay - {reader.path}")
+        window.configure(bg="black")
+        window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.display = SevenSegmentDisplay(window)
+        self.display.pack(pady=(20, 0))
+
+        self.turn_label = tk.Label(window, text="", bg="black", fg="#d60000", font=("Arial", 10))
+        self.turn_label.pack(pady=(10, 0))
+        self.dragon_label = tk.Label(window, text="", bg="black", fg="#d60000", font=("Arial", 10))
+        self.dragon_label.pack()
+
+        self.slider = tk.Scale(
+            window,
+            from_=0,
+            to=max(0, len(reader) - 1),
+            orient=tk.HORIZONTAL,
+            length=360,
+            showvalue=False,
+            bg="black",
+            fg="#d60000",
+            troughcolor="#2a0000",
+            highlightthickness=0,
+            command=lambda value: self.show(int(value))
+        )
+        self.slider.pack(pady=10)
+
+        controls = tk.Frame(window, bg="black")
+        controls.pack()
+        buttons = {
+            "|<": lambda: self.seek(0),
+            "<": lambda: self.seek(self.index - 1),
+            "Play": self.toggle_play,
+            ">": lambda: self.seek(self.index + 1),
+            ">|": lambda: self.seek(len(self.reader) - 1),
+        }
+        for text, command in buttons.items():
+            btn = tk.Button(
+                controls,
+                text=text,
+                bg="#d60000",  # Red
+                fg="#ffffff",  # White text
+                font=("Arial", 10, "bold"),
+                command=command,
+                width=4
+            )
+            btn.pack(side=tk.LEFT, padx=2)
+            if text == "Play":
+                self.play_button = btn
+
+        self.stats_window = PlayerStatsWindow(self, parent_window=window)
+        if len(reader):
+            self.show(0)
+        else:
+            self.turn_label.config(text="Empty replay")
+
+    def seek(self, index: int):
+        """Move the slider (and so the readouts) to a frame"""
+        index = max(0, min(index, len(self.reader) - 1))
+        self.slider.set(index)
+        self.show(index)
+
+    def show(self, index: int):
+        """Show one frame of the replay"""
+        if not len(self.reader):
+            return
+        frame = self.reader.frame(index)
+        self.index = index
+
+        self.display.set_value(frame.display)
+        self.turn_label.config(
+            text=f"Turn {frame.turn_number}, Player {frame.player_number}: "
+                 f"{ACTIONS[frame.action]} -> {OUTCOMES[frame.outcome]} ({index + 1}/{len(self.reader)})"
+        )
+        dragon = frame.dragon
+        self.dragon_label.config(text=f"Dragon: {dragon['gold']} gold, {dragon['warriors']} warriors")
+
+        for seat, player in enumerate(self.players):
+            fields = frame.player(seat)
+            player.gold = fields["gold"]
+            player.warriors = fields["warriors"]
+            player.food = fields["food"]
+        self.stats_window.update_player_stats()
+
+    def toggle_play(self):
+        """Step through the frames on a timer, or stop"""
+        if self.play_id is not None:
+            self.window.after_cancel(self.play_id)
+            self.play_id = None
+            self.play_button.config(text="Play")
+            return
+        self.play_button.config(text="Pause")
+        self._play_next()
+
+    def _play_next(self):
+        if self.index >= len(self.reader) - 1:
+            self.play_id = None
+            self.play_button.config(text="Play")
+            return
+        self.seek(self.index + 1)
+        self.play_id = self.window.after(PLAY_MS, self._play_next)
+
+    def close(self):
+        if self.play_id is not None:
+            self.window.after_cancel(self.play_id)
+            self.play_id = None
+        self.stats_window.window.destroy()
+        self.window.destroy()
+        self.reader.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scrub through a recorded Dark Tower game")
+    parser.add_argument("replay", help="Replay file written by ReplayRecorder")
+    args = parser.parse_args(argv)
+
+    root = tk.Tk()
+    ReplayViewer(root, ReplayReader(args.replay))
+    root.mainloop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
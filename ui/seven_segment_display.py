@@ -2,6 +2,37 @@ import tkinter as tk
 from tkinter import Canvas
 
 
+def segment_polygons(x: int, y: int, height: int, thickness: int) -> list:
+    """
+    Polygon points of the 7 segments (a-g) of one digit.
+
+    Args:
+        x, y: Top-left corner of the digit
+        height: Digit height; vertical segments are half of it and so is the digit's width
+        thickness: Segment thickness
+    """
+    t = thickness
+    size = height // 2
+
+    def horizontal(x, y):
+        # Trapezoid shape
+        return [x + t, y, x + size - t, y, x + size, y + t, x, y + t]
+
+    def vertical(x, y):
+        # Trapezoid shape
+        return [x, y + t, x + t, y, x + t, y + size - t, x, y + size]
+
+    return [
+        horizontal(x, y),                     # a (top)
+        vertical(x + size - t, y),            # b (top-right)
+        vertical(x + size - t, y + size),     # c (bottom-right)
+        horizontal(x, y + height - t),        # d (bottom)
+        vertical(x, y + size),                # e (bottom-left)
+        vertical(x, y),                       # f (top-left)
+        horizontal(x, y + size - t // 2),     # g (middle)
+    ]
+
+
 class SevenSegmentDisplay:
     """
     A 2-digit 7-segment LED-style display component for Tkinter.
@@ -90,60 +121,12 @@ class SevenSegmentDisplay:
         x_offset = 3 + digit_index * (self.digit_width + 6)
         y_offset = 5
         
-        w = self.digit_width
         h = self.digit_height
         t = self.segment_thickness
         
-        # Calculate segment dimensions - horizontal width = vertical height
-        segment_height = h // 2  # Height of each vertical segment
-        segment_width = segment_height  # Width of horizontal segments matches vertical height
-        
-        # Define segment coordinates (relative to digit position)
-        # Segment a (top)
-        seg_a = self._create_horizontal_segment(x_offset, y_offset, segment_width)
-        
-        # Segment b (top-right)
-        seg_b = self._create_vertical_segment(x_offset + segment_width - t, y_offset, segment_height)
-        
-        # Segment c (bottom-right)
-        seg_c = self._create_vertical_segment(x_offset + segment_width - t, y_offset + segment_height, segment_height)
-        
-        # Segment d (bottom)
-        seg_d = self._create_horizontal_segment(x_offset, y_offset + h - t, segment_width)
-        
-        # Segment e (bottom-left)
-        seg_e = self._create_vertical_segment(x_offset, y_offset + segment_height, segment_height)
-        
-        # Segment f (top-left)
-        seg_f = self._create_vertical_segment(x_offset, y_offset, segment_height)
-        
-        # Segment g (middle)
-        seg_g = self._create_horizontal_segment(x_offset, y_offset + segment_height - t // 2, segment_width)
-        
-        # Store in order: a, b, c, d, e, f, g
-        segment_list.extend([seg_a, seg_b, seg_c, seg_d, seg_e, seg_f, seg_g])
-    
-    def _create_horizontal_segment(self, x, y, width):
-        """Create a horizontal segment (trapezoid shape)."""
-        t = self.segment_thickness
-        points = [
-            x + t, y,
-            x + width - t, y,
-            x + width, y + t,
-            x, y + t
-        ]
-        return self.canvas.create_polygon(points, fill=self.off_color, outline="")
-    
-    def _create_vertical_segment(self, x, y, height):
-        """Create a vertical segment (trapezoid shape)."""
-        t = self.segment_thickness
-        points = [
-            x, y + t,
-            x + t, y,
-            x + t, y + height - t,
-            x, y + height
-        ]
-        return self.canvas.create_polygon(points, fill=self.off_color, outline="")
+        # Segments a-g, horizontal width = vertical height
+        for points in segment_polygons(x_offset, y_offset, h, t):
+            segment_list.append(self.canvas.create_polygon(points, fill=self.off_color, outline=""))
     
     def _update_digit(self, digit_segments, digit_value):
         """
@@ -171,43 +154,40 @@ class SevenSegmentDisplay:
                    string command ("dash", "off", "minus"), or
                    array/list of 2 items [digit1, digit2] where each can be 0-9, "dash", "minus", or "off"
         """
+        digit1, digit2 = self.digits(value)
+        self._update_digit(self.digit1_segments, digit1)
+        self._update_digit(self.digit2_segments, digit2)
+
+    @staticmethod
+    def digits(value):
+        """
+        Split a display value into what the left and right digits show.
         
+        Returns:
+            (digit1, digit2), each a key of DIGIT_SEGMENTS
+        """
         # Check if value is an array of 2 items
         if isinstance(value, (list, tuple)) and len(value) == 2:
-            self._update_digit(self.digit1_segments, value[0])
-            self._update_digit(self.digit2_segments, value[1])
-            return
+            return value[0], value[1]
 
         if value == "dash":
-            self._update_digit(self.digit1_segments, "dash")
-            self._update_digit(self.digit2_segments, "dash")
-            return
+            return "dash", "dash"
         if value == "off":
-            self._update_digit(self.digit1_segments, "off")
-            self._update_digit(self.digit2_segments, "off")
-            return
+            return "off", "off"
         if value == "minus":
-            self._update_digit(self.digit1_segments, "minus")
-            self._update_digit(self.digit2_segments, "off")
-            return
+            return "minus", "off"
 
         # Clamp value to -9 to 99
         value = max(-9, min(99, int(value)))
         
         # Handle negative numbers
         if value < 0:
-            self._update_digit(self.digit1_segments, "minus")
-            self._update_digit(self.digit2_segments, abs(value))
+            return "minus", abs(value)
         # Handle 0-9 (show leading space)
-        elif value < 10:
-            self._update_digit(self.digit1_segments, "off")
-            self._update_digit(self.digit2_segments, value)
+        if value < 10:
+            return "off", value
         # Handle 10-99 (show both digits)
-        else:
-            tens = value // 10
-            ones = value % 10
-            self._update_digit(self.digit1_segments, tens)
-            self._update_digit(self.digit2_segments, ones)
+        return value // 10, value % 10
     
     def pack(self, **kwargs):
         """Pack the display canvas."""
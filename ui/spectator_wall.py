@@ -0,0 +1,261 @@
+"""
+Spectator Wall - Many games on one canvas
+
+Tournament broadcasts watch dozens of games at once. Instead of a Tk root,
+display canvas and stats windows per game, SpectatorWall draws a small
+summary of every table on one shared canvas: round, current player, the
+seven-segment readout and each player's gold, warriors and food.
+
+Games feed the wall summaries (see summary_from_controller and
+summary_from_state, or attach a TableFeed to a controller). post() only
+records the newest summary of a table; once per frame the wall compares
+every posted table with what is drawn and sends all segment color changes
+to Tk as one batched script, so a table that did not change costs nothing
+and a busy frame is still a single round trip to Tcl.
+
+standings() adds a sortable VirtualStatsView of every seat on the wall,
+hundreds of rows at 64 tables, refreshed in the same flush.
+
+Usage:
+    wall = SpectatorWall(root, TkScheduler(root), tables=64)
+    wall.pack()
+    feed = TableFeed(wall, table=0)
+    feed.attach(gc)
+    wall.post(1, summary_from_state(state))
+    wall.standings(side_frame, visible_rows=30).pack(fill=tk.BOTH)
+"""
+
+import tkinter as tk
+from typing import TYPE_CHECKING
+
+from models.game_state import PHASE_BATTLE, GameState
+from scheduler import Scheduler
+from ui.seven_segment_display import SevenSegmentDisplay, segment_polygons
+from ui.view_model import FRAME_MS
+from ui.virtual_stats_view import VirtualStatsView
+
+if TYPE_CHECKING:
+    from game import GameController
+
+CELL_WIDTH = 160
+CELL_HEIGHT = 96
+DIGIT_HEIGHT = 36
+SEGMENT_THICKNESS = 4
+
+ON_COLOR = "#d60000"  # Red, as the main display
+OFF_COLOR = "#2a0000"  # Dark red
+TEXT_COLOR = "#f09800"  # Gold
+FONT = ("Courier", 8)
+
+# (seat attribute, column heading, text color) of the standings table
+STANDINGS_COLUMNS = (
+    ("table", "Table", ON_COLOR),
+    ("player_number", "Seat", TEXT_COLOR),
+    ("gold", "Gold", "#f09800"),  # Gold
+    ("warriors", "Warriors", "#0090aa"),  # Blue
+    ("food", "Food", "#00c100"),  # Green
+)
+
+
+def summary_from_controller(gc: "GameController") -> tuple:
+    """(round, current player, readout, ((gold, warriors, food), ...)) of a live game"""
+    state = gc.state_machine.current_state
+    readout = gc.display.value
+    return (
+        getattr(state, "turn_number", 0),
+        getattr(state, "player_number", 0),
+        # Copied so later changes to the display cannot alter a posted summary
+        tuple(readout) if isinstance(readout, list) else readout,
+        tuple((p.gold, p.warriors, p.food) for p in gc.players),
+    )
+
+
+def summary_from_state(state: GameState) -> tuple:
+    """Summary of a headless GameState, showing the brigands during a battle as the drum would"""
+    readout = state.brigands if state.phase == PHASE_BATTLE else state.current + 1
+    return (
+        state.turn,
+        state.current + 1,
+        readout,
+        tuple((p.gold, p.warriors, p.food) for p in state.players),
+    )
+
+
+class WallSeat:
+    """One seat at one table, as drawn last, read by the standings table"""
+
+    __slots__ = ("table", "player_number", "gold", "warriors", "food")
+
+    def __init__(self, table: int, player_number: int):
+        self.table = table
+        self.player_number = player_number
+        self.gold = 0
+        self.warriors = 0
+        self.food = 0
+
+
+class SpectatorWall:
+    """
+    Grid of game summaries on one canvas, redrawn once per frame.
+
+    Args:
+        parent: Widget the canvas is placed in
+        scheduler: Scheduler the frame flush is queued on
+        tables: Number of tables on the wall
+        columns: Tables per row
+        names: Table titles (defaults to "Table 1", "Table 2", ...)
+    """
+
+    def __init__(self, parent, scheduler: Scheduler, tables: int = 64, columns: int = 8, names=None):
+        self.scheduler = scheduler
+        self.tables = tables
+        self.columns = columns
+        rows = -(-tables // columns)
+        self.canvas = tk.Canvas(
+            parent, width=columns * CELL_WIDTH, height=rows * CELL_HEIGHT, bg="black", highlightthickness=0
+        )
+        names = names or [f"Table {i + 1}" for i in range(tables)]
+
+        self.pending = {}  # Table -> newest summary not drawn yet
+        self.flush_id = None
+        self.segment_ids = []  # Per table: 2 digits x 7 segment items
+        self.segments_on = []  # Per table: lit state of those items as drawn
+        self.status_ids = []
+        self.resource_ids = []
+        self.drawn = [None] * tables
+        self.table_seats = [[] for _ in range(tables)]
+        self.seats = []  # Every WallSeat, table by table
+        self.standings_view = None
+
+        # Counters for the benchmark
+        self.flushes = 0
+        self.item_updates = 0
+
+        for table in range(tables):
+            x = (table % columns) * CELL_WIDTH
+            y = (table // columns) * CELL_HEIGHT
+            self.canvas.create_rectangle(x + 2, y + 2, x + CELL_WIDTH - 2, y + CELL_HEIGHT - 2, outline="#1a1a1a")
+            self.canvas.create_text(x + 6, y + 4, text=names[table], anchor="nw", fill=ON_COLOR, font=FONT)
+            self.status_ids.append(self.canvas.create_text(
+                x + CELL_WIDTH - 6, y + 4, text="", anchor="ne", fill=TEXT_COLOR, font=FONT
+            ))
+
+            segments = []
+            for digit in range(2):
+                digit_x = x + 6 + digit * (DIGIT_HEIGHT // 2 + 4)
+                for points in segment_polygons(digit_x, y + 22, DIGIT_HEIGHT, SEGMENT_THICKNESS):
+                    segments.append(self.canvas.create_polygon(points, fill=OFF_COLOR, outline=""))
+            self.segment_ids.append(segments)
+            self.segments_on.append([False] * len(segments))
+
+            self.resource_ids.append(self.canvas.create_text(
+                x + 56, y + 20, text="", anchor="nw", fill=TEXT_COLOR, font=FONT
+            ))
+
+    def pack(self, **kwargs):
+        self.canvas.pack(**kwargs)
+
+    def grid(self, **kwargs):
+        self.canvas.grid(**kwargs)
+
+    def standings(self, parent, visible_rows: int = 20) -> VirtualStatsView:
+        """Create the sortable table of every seat on the wall; the caller places it"""
+        self.standings_view = VirtualStatsView(parent, self.seats, visible_rows, STANDINGS_COLUMNS)
+        self.standings_view.refresh()
+        return self.standings_view
+
+    def post(self, table: int, summary: tuple):
+        """Record the newest summary of a table and make sure a flush is queued"""
+        self.pending[table] = summary
+        if self.flush_id is None:
+            self.flush_id = self.scheduler.after(FRAME_MS, self.flush)
+
+    def flush(self):
+        """Draw every posted table that differs from what is on the canvas"""
+        if self.flush_id is not None:
+            self.scheduler.cancel(self.flush_id)
+            self.flush_id = None
+        pending, self.pending = self.pending, {}
+        self.flushes += 1
+
+        fills = []
+        seats_changed = False
+        for table, summary in pending.items():
+            drawn = self.drawn[table]
+            if summary == drawn:
+                continue
+            turn, player, readout, resources = summary
+
+            if drawn is None or drawn[2] != readout:
+                lit = self._lit_segments(readout)
+                ids, on = self.segment_ids[table], self.segments_on[table]
+                for i, state in enumerate(lit):
+                    if on[i] != state:
+                        on[i] = state
+                        fills.append(f"{ids[i]} -fill {ON_COLOR if state else OFF_COLOR}")
+
+            if drawn is None or drawn[:2] != (turn, player):
+                self.canvas.itemconfigure(self.status_ids[table], text=f"R{turn} P{player}")
+                self.item_updates += 1
+            if drawn is None or drawn[3] != resources:
+                text = "\n".join(
+                    f"{seat}:{gold:>3}g{warriors:>3}w{food:>3}f"
+                    for seat, (gold, warriors, food) in enumerate(resources, start=1)
+                )
+                self.canvas.itemconfigure(self.resource_ids[table], text=text)
+                self.item_updates += 1
+                self._update_seats(table, resources)
+                seats_changed = True
+            self.drawn[table] = summary
+
+        if fills:
+            # One Tcl round trip for every segment that changed this frame
+            self.canvas.tk.eval("\n".join(f"{self.canvas} itemconfigure {fill}" for fill in fills))
+            self.item_updates += len(fills)
+        if seats_changed and self.standings_view is not None:
+            self.standings_view.refresh()
+
+    def _update_seats(self, table: int, resources: tuple):
+        seats = self.table_seats[table]
+        if len(seats) != len(resources):
+            # A new game with another number of players
+            seats[:] = [WallSeat(table + 1, seat) for seat in range(1, len(resources) + 1)]
+            # In place: the standings table holds this list
+            self.seats[:] = [seat for table_seats in self.table_seats for seat in table_seats]
+        for seat, (gold, warriors, food) in zip(seats, resources):
+            seat.gold = gold
+            seat.warriors = warriors
+            seat.food = food
+
+    @staticmethod
+    def _lit_segments(readout) -> list:
+        patterns = SevenSegmentDisplay.DIGIT_SEGMENTS
+        lit = []
+        for digit in SevenSegmentDisplay.digits(readout):
+            lit.extend(bool(bit) for bit in patterns.get(digit, patterns[0]))
+        return lit
+
+
+class TableFeed:
+    """Turn observer that posts a controller's summary to one wall table after every turn"""
+
+    def __init__(self, wall: SpectatorWall, table: int):
+        self.wall = wall
+        self.table = table
+        self.gc = None
+
+    def attach(self, gc: "GameController"):
+        """Start feeding the wall from a game controller"""
+        self.gc = gc
+        gc.turn_observers.append(self)
+        self.post()
+
+    def detach(self, gc: "GameController"):
+        gc.turn_observers.remove(self)
+        self.gc = None
+
+    def post(self):
+        self.wall.post(self.table, summary_from_controller(self.gc))
+
+    def record_turn(self, *turn):
+        self.post()
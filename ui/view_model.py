@@ -0,0 +1,97 @@
+"""
+View Model - Frame-batched UI output
+
+Game logic never touches widgets directly. It writes the latest value of
+each output (display digits, messages, GM status, player stats) to the
+ViewModel, and one flush per frame pushes only the values that differ from
+what is already on screen. A value that is set and then replaced within the
+same frame, like the GM status the Bazaar clears and then sets again, never
+reaches Tk.
+
+Usage:
+    view = ViewModel(scheduler, {"message": lambda text: label.config(text=text)})
+    view.set("message", "Player 1 got lost!")
+    view.flush()  # or wait for the scheduled flush
+"""
+
+from scheduler import Scheduler
+
+FRAME_MS = 16  # About 60 flushes a second
+
+_NOTHING = object()
+
+
+class ViewModel:
+    """
+    Latest value of every UI output, applied to widgets once per frame.
+
+    Args:
+        scheduler: Scheduler the frame flush is queued on
+        renderers: Output name -> callable(value) that updates the widget
+        frame_ms: Delay between the first change and the flush
+    """
+
+    def __init__(self, scheduler: Scheduler, renderers: dict, frame_ms: int = FRAME_MS):
+        self.scheduler = scheduler
+        self.renderers = renderers
+        self.frame_ms = frame_ms
+        self.values = {}
+        self.rendered = {}
+        self.dirty = {}  # Used as an ordered set
+        self.flush_id = None
+        self.flushes = 0
+        self.renders = 0
+        # Called with no arguments after every flush (e.g. the latency monitor)
+        self.flush_observers = []
+
+    def set(self, name: str, value):
+        """Record the latest value of an output and make sure a flush is queued"""
+        self.values[name] = value
+        self.dirty[name] = None
+        if self.flush_id is None:
+            self.flush_id = self.scheduler.after(self.frame_ms, self.flush)
+
+    def get(self, name: str, default=None):
+        return self.values.get(name, default)
+
+    def flush(self):
+        """Apply every output whose latest value differs from what is on screen"""
+        if self.flush_id is not None:
+            self.scheduler.cancel(self.flush_id)
+            self.flush_id = None
+        dirty, self.dirty = self.dirty, {}
+        self.flushes += 1
+        for name in dirty:
+            value = self.values[name]
+            if self.rendered.get(name, _NOTHING) == value:
+                continue
+            self.renderers[name](value)
+            self.rendered[name] = value
+            self.renders += 1
+        for observer in self.flush_observers:
+            observer()
+
+    def invalidate(self, name: str):
+        """Forget what is on screen for an output, e.g. after its widget was recreated"""
+        self.rendered.pop(name, None)
+        if name in self.values:
+            self.set(name, self.values[name])
+
+
+class DisplayView:
+    """Stand-in for SevenSegmentDisplay that writes to a ViewModel"""
+
+    def __init__(self, view: ViewModel, name: str = "display"):
+        self.view = view
+        self.name = name
+
+    @property
+    def value(self):
+        return self.view.get(self.name, "off")
+
+    def set_value(self, value):
+        # Lists are copied so later changes by the caller cannot leak into the frame
+        self.view.set(self.name, tuple(value) if isinstance(value, list) else value)
+
+    def clear(self):
+        self.view.set(self.name, "off")
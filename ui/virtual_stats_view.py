@@ -0,0 +1,178 @@
+"""
+Virtual Stats View - Player stats table for leagues with hundreds of seats
+
+PlayerStatsWindow builds a panel of labels per player, which is fine for the
+board game's four seats but not for bot leagues. VirtualStatsView keeps a
+fixed pool of row labels, as many as fit on screen, and shows whichever
+players are scrolled into view in them:
+- scrolling only changes which players the rows show,
+- sorting by a column re-sorts the players (O(n log n)) and leaves the
+  widgets alone,
+- a refresh only reconfigures labels whose text changed.
+
+StatsTable holds the sorting and scrolling and needs no Tk, so it can be
+timed without a display.
+
+The columns default to a seat's player number and resources; other tables
+(the spectator wall's standings) pass their own.
+
+Usage:
+    view = VirtualStatsView(frame, gc.players, visible_rows=20)
+    view.pack(fill=tk.BOTH, expand=True)
+    view.refresh()  # after the stats change
+"""
+
+import tkinter as tk
+from operator import attrgetter
+
+# (player attribute, column heading, text color)
+COLUMNS = (
+    ("player_number", "Player", "#f09800"),  # Gold
+    ("gold", "Gold", "#f09800"),  # Gold
+    ("warriors", "Warriors", "#0090aa"),  # Blue
+    ("food", "Food", "#00c100"),  # Green
+)
+
+# Columns that name a row rather than count something sort ascending first
+LABEL_KEYS = ("table", "player_number")
+
+
+class StatsTable:
+    """
+    Sorted and scrolled window over a list of players.
+
+    Args:
+        players: Objects with the column attributes (read on every refresh)
+        visible_rows: Rows shown at once
+        columns: (attribute, heading, color) per column
+    """
+
+    def __init__(self, players, visible_rows: int = 20, columns=COLUMNS):
+        self.players = players
+        self.visible_rows = visible_rows
+        self.columns = columns
+        self.sort_key = columns[0][0]
+        self.descending = False
+        self.offset = 0
+        self.order = list(players)
+
+    def sort_by(self, key: str):
+        """Sort by a column; sorting by the current column again flips the direction"""
+        if key == self.sort_key:
+            self.descending = not self.descending
+        else:
+            self.sort_key = key
+            # Biggest hoards first, players in seat order
+            self.descending = key not in LABEL_KEYS
+        self.refresh()
+
+    def refresh(self):
+        """Re-sort the players by their current stats"""
+        # Stable, so equal stats stay in seat order either way
+        self.order = sorted(self.players, key=attrgetter(self.sort_key), reverse=self.descending)
+        self.scroll_to(self.offset)
+
+    def scroll_to(self, offset: int):
+        """Show the rows starting at offset, clamped to the table"""
+        self.offset = max(0, min(offset, len(self.order) - self.visible_rows))
+
+    def visible(self) -> list:
+        """Cell texts of the rows in view, one tuple per row"""
+        return [
+            tuple(str(getattr(player, key)) for key, _, _ in self.columns)
+            for player in self.order[self.offset:self.offset + self.visible_rows]
+        ]
+
+    def fraction(self) -> tuple:
+        """(first, last) fraction of the table in view, as Scrollbar.set() takes it"""
+        total = len(self.order)
+        if total == 0:
+            return 0.0, 1.0
+        return self.offset / total, min(1.0, (self.offset + self.visible_rows) / total)
+
+
+class VirtualStatsView(tk.Frame):
+    """
+    Scrollable, sortable player stats table with a fixed pool of row widgets.
+
+    Args:
+        parent: Widget the table is placed in
+        players: Players to show (read on every refresh)
+        visible_rows: Rows of widgets created, the most shown at once
+        columns: (attribute, heading, color) per column
+    """
+
+    def __init__(self, parent, players, visible_rows: int = 20, columns=COLUMNS):
+        super().__init__(parent, bg="black")
+        self.table = StatsTable(players, visible_rows, columns)
+
+        # Column headings sort the table
+        for column, (key, heading, color) in enumerate(columns):
+            tk.Button(
+                self,
+                text=heading,
+                bg="#1a1a1a",
+                fg=color,
+                font=("Arial", 9, "bold"),
+                relief=tk.FLAT,
+                command=lambda key=key: self.sort_by(key)
+            ).grid(row=0, column=column, sticky="ew")
+            self.columnconfigure(column, weight=1)
+
+        # The row pool: one label per cell, reused for whichever players are in view
+        self.cells = []
+        self.texts = []
+        for row in range(visible_rows):
+            labels = []
+            for column, (_, _, color) in enumerate(columns):
+                label = tk.Label(self, text="", bg="black", fg=color, font=("Arial", 9))
+                label.grid(row=row + 1, column=column, sticky="ew")
+                labels.append(label)
+            self.cells.append(labels)
+            self.texts.append([""] * len(columns))
+
+        self.scrollbar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.grid(row=1, column=len(columns), rowspan=visible_rows, sticky="ns")
+
+        # Wheel scrolling over any cell (Button-4/5 on X11)
+        for widget in [self] + [label for labels in self.cells for label in labels]:
+            widget.bind("<MouseWheel>", self._on_wheel)
+            widget.bind("<Button-4>", lambda event: self.scroll(-3))
+            widget.bind("<Button-5>", lambda event: self.scroll(3))
+
+    def refresh(self):
+        """Re-sort by the current stats and redraw the rows in view"""
+        self.table.refresh()
+        self.render()
+
+    def sort_by(self, key: str):
+        self.table.sort_by(key)
+        self.render()
+
+    def scroll(self, rows: int):
+        self.table.scroll_to(self.table.offset + rows)
+        self.render()
+
+    def render(self):
+        """Point the row pool at the players in view, touching only changed labels"""
+        visible = self.table.visible()
+        blank = ("",) * len(self.table.columns)
+        for row, labels in enumerate(self.cells):
+            values = visible[row] if row < len(visible) else blank
+            texts = self.texts[row]
+            for column, text in enumerate(values):
+                if texts[column] != text:
+                    labels[column].config(text=text)
+                    texts[column] = text
+        self.scrollbar.set(*self.table.fraction())
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.table.scroll_to(round(float(amount) * len(self.table.order)))
+            self.render()
+        elif action == "scroll":
+            step = self.table.visible_rows if unit == "pages" else 1
+            self.scroll(int(amount) * step)
+
+    def _on_wheel(self, event):
+        self.scroll(-3 if event.delta > 0 else 3)